@@ -10,9 +10,37 @@ Refs:
 
 __version__ = "7.0.3"
 
+from typing import TYPE_CHECKING, Any
+
 from .commons import BoundingBox, Coords, Tile
-from .defaults import TileMatrixSets, tms
-from .models import TileMatrixSet
+
+if TYPE_CHECKING:
+    from .defaults import TileMatrixSets, tms
+    from .models import TileMatrixSet
+    from .ranges import TileRange
+    from .tilesets import TileSet
+
+# `pyproj` and `pydantic` (and the TMS registry) are only imported on first use
+_lazy_imports = {
+    "TileMatrixSet": "morecantile.models",
+    "TileMatrixSets": "morecantile.defaults",
+    "TileRange": "morecantile.ranges",
+    "TileSet": "morecantile.tilesets",
+    "tms": "morecantile.defaults",
+}
+_lazy_submodules = {
+    "compiled",
+    "cover",
+    "curves",
+    "defaults",
+    "errors",
+    "keys",
+    "models",
+    "ranges",
+    "tilesets",
+    "transformers",
+    "utils",
+}
 
 __all__ = [
     "BoundingBox",
@@ -20,5 +48,27 @@ __all__ = [
     "Tile",
     "TileMatrixSet",
     "TileMatrixSets",
+    "TileRange",
+    "TileSet",
     "tms",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import TileMatrixSet models and default TMS registry on first access."""
+    import importlib
+
+    if name in _lazy_imports:
+        value = getattr(importlib.import_module(_lazy_imports[name]), name)
+        globals()[name] = value
+        return value
+
+    if name in _lazy_submodules:
+        return importlib.import_module(f"{__name__}.{name}")
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    """List module attributes (including lazy imports)."""
+    return sorted({*globals(), *_lazy_imports, *_lazy_submodules})
@@ -0,0 +1,136 @@
+"""Morecantile compiled TMS registry.
+
+Validating a TileMatrixSet JSON document (pydantic validation and CRS
+resolution with PROJ) is slow compared to un-pickling an already validated
+model. `compile_tms` writes the validated TileMatrixSets (with their derived
+properties) to a versioned pickle file stored next to the TMS documents, which
+`load_tms` uses instead of the JSON documents when it is up to date.
+
+The compiled registry is not shipped with morecantile, it can be created at
+build or deployment time with `morecantile compile-tms`.
+
+"""
+
+import hashlib
+import os
+import pathlib
+import pickle
+from functools import cache
+from typing import Any
+
+import pydantic
+import pyproj
+
+from morecantile.models import DEFAULT_GEOGRAPHIC_CRS, TileMatrixSet
+
+# Increment when the compiled file structure changes
+COMPILED_TMS_VERSION = 1
+
+morecantile_tms_dir = pathlib.Path(__file__).parent.joinpath("data")
+compiled_tms_path = morecantile_tms_dir.joinpath("tms.pickle")
+
+
+def _header() -> dict[str, Any]:
+    """Versions the compiled TileMatrixSets depend on."""
+    from morecantile import __version__
+
+    return {
+        "version": COMPILED_TMS_VERSION,
+        "morecantile": __version__,
+        "pydantic": pydantic.VERSION,
+        "pyproj": pyproj.__version__,
+        "proj": pyproj.proj_version_str,
+        "geographic_crs": DEFAULT_GEOGRAPHIC_CRS,
+    }
+
+
+def _digest(content: bytes) -> str:
+    """TMS document digest."""
+    return hashlib.sha256(content).hexdigest()
+
+
+def compile_tms(
+    paths: list[pathlib.Path] | None = None,
+    output: pathlib.Path | None = None,
+) -> pathlib.Path:
+    """Validate TMS JSON documents and write them to a compiled registry file.
+
+    Args:
+        paths (list of pathlib.Path): TMS JSON documents. Defaults to morecantile's TMS documents.
+        output (pathlib.Path): Output file. Defaults to `morecantile/data/tms.pickle`.
+
+    Returns:
+        pathlib.Path: path of the compiled registry.
+
+    """
+    paths = paths if paths is not None else sorted(morecantile_tms_dir.glob("*.json"))
+    output = output or compiled_tms_path
+
+    tilematrixsets: dict[str, tuple[str, bytes]] = {}
+    for path in paths:
+        content = path.read_bytes()
+        tms = TileMatrixSet.model_validate_json(content)
+
+        # Compute derived properties so they are stored with the model
+        _ = tms.is_quadtree, tms.is_variable, tms._invert_axis, tms.xy_bbox
+
+        tilematrixsets[path.stem] = (
+            _digest(content),
+            pickle.dumps(tms, protocol=pickle.HIGHEST_PROTOCOL),
+        )
+
+    tmp = output.with_suffix(f".{os.getpid()}.tmp")
+    with tmp.open("wb") as f:
+        pickle.dump(
+            {"header": _header(), "tilematrixsets": tilematrixsets},
+            f,
+            protocol=pickle.HIGHEST_PROTOCOL,
+        )
+    tmp.replace(output)
+
+    _load_compiled.cache_clear()
+
+    return output
+
+
+@cache
+def _load_compiled(path: pathlib.Path) -> dict[str, tuple[str, bytes]]:
+    """Load compiled registry (TMS are still pickled), if not stale."""
+    try:
+        with path.open("rb") as f:
+            compiled = pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+        return {}
+
+    if not isinstance(compiled, dict) or compiled.get("header") != _header():
+        return {}
+
+    return compiled["tilematrixsets"]
+
+
+def load_tms(
+    path: pathlib.Path,
+    compiled: pathlib.Path | None = None,
+) -> TileMatrixSet:
+    """Load a TMS document, using the compiled registry when up to date.
+
+    Args:
+        path (pathlib.Path): TMS JSON document.
+        compiled (pathlib.Path): Compiled registry. Defaults to `morecantile/data/tms.pickle`.
+
+    Returns:
+        TileMatrixSet
+
+    """
+    content = path.read_bytes()
+
+    digest, data = _load_compiled(compiled or compiled_tms_path).get(
+        path.stem, (None, None)
+    )
+    if data is not None and digest == _digest(content):
+        try:
+            return pickle.loads(data)
+        except (pickle.UnpicklingError, AttributeError, ImportError, EOFError):
+            pass
+
+    return TileMatrixSet.model_validate_json(content)
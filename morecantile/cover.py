@@ -0,0 +1,540 @@
+"""Morecantile geometry cover.
+
+Helpers used by `TileMatrixSet.geometry_tiles` and `TileMatrixSet.line_tiles`
+to find the tiles intersecting GeoJSON-like geometries (requires numpy).
+
+Geometries are clipped to the TMS geographic bounding box and their edges are
+densified while being transformed to the TMS CRS, so that the projected
+(curved) edges are approximated to a fraction of a tile. The cover is then
+computed in (continuous) tile coordinates, for each row of tiles:
+
+- boundary: the tiles crossed by each edge of the geometry
+- interior: the tiles whose center is inside a polygon (scanline at the
+  center of the row, even-odd rule)
+
+For lines, the boundary tiles also include the tiles only touched by the lines
+(on their sides or corners), i.e the supercover of the lines.
+
+"""
+
+from collections.abc import Callable, Iterator
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    import numpy
+
+# Tolerance (in tile unit) used for points on the tile edges
+TILE_EPSILON = 1e-9
+
+# Maximum distance (in tile unit) between densified edges and the projected geometry
+DENSIFY_TOLERANCE = 0.001
+
+# Maximum number of densification iterations (each iteration splits the edges in half)
+DENSIFY_MAX_ITERATIONS = 16
+
+
+def _geometries(obj: Any) -> Iterator[dict]:
+    """Yield the geometries of a GeoJSON-like object (Feature, FeatureCollection, GeometryCollection)."""
+    if hasattr(obj, "__geo_interface__"):
+        obj = obj.__geo_interface__
+
+    geom_type = obj.get("type")
+    if geom_type == "FeatureCollection":
+        for feature in obj["features"]:
+            yield from _geometries(feature)
+
+    elif geom_type == "Feature":
+        if obj.get("geometry"):
+            yield from _geometries(obj["geometry"])
+
+    elif geom_type == "GeometryCollection":
+        for geometry in obj["geometries"]:
+            yield from _geometries(geometry)
+
+    else:
+        yield obj
+
+
+def _polygons(obj: Any) -> Iterator[list]:
+    """Yield the rings of the Polygons of a GeoJSON-like object."""
+    for geometry in _geometries(obj):
+        geom_type = geometry.get("type")
+        if geom_type == "Polygon":
+            yield geometry["coordinates"]
+
+        elif geom_type == "MultiPolygon":
+            yield from geometry["coordinates"]
+
+        else:
+            raise ValueError(f"Invalid geometry type: {geom_type}")
+
+
+def _clip_ring(
+    ring: list[tuple[float, float]],
+    bbox: tuple[float, float, float, float],
+) -> list[tuple[float, float]]:
+    """Clip a closed ring to a bounding box (Sutherland-Hodgman)."""
+    left, bottom, right, top = bbox
+    points = ring[:-1] if ring[0] == ring[-1] else ring
+    for axis, bound, sign in (
+        (0, left, 1),
+        (0, right, -1),
+        (1, bottom, 1),
+        (1, top, -1),
+    ):
+        if not points:
+            break
+
+        clipped = []
+        prev = points[-1]
+        prev_inside = (prev[axis] - bound) * sign >= 0
+        for point in points:
+            inside = (point[axis] - bound) * sign >= 0
+            if inside != prev_inside:
+                t = (bound - prev[axis]) / (point[axis] - prev[axis])
+                if axis == 0:
+                    clipped.append((bound, prev[1] + t * (point[1] - prev[1])))
+                else:
+                    clipped.append((prev[0] + t * (point[0] - prev[0]), bound))
+
+            if inside:
+                clipped.append(point)
+
+            prev, prev_inside = point, inside
+
+        points = clipped
+
+    return points + points[:1] if len(points) > 2 else []
+
+
+def _polygon_arrays(
+    geometry: Any,
+    bbox: tuple[float, float, float, float],
+) -> tuple["numpy.ndarray", "numpy.ndarray", "numpy.ndarray", "numpy.ndarray"]:
+    """Get the coordinates, ring ids and polygon id (of each ring) of a geometry clipped to a bbox."""
+    import numpy as np
+
+    left, bottom, right, top = bbox
+
+    # Split bbox crossing the antimeridian, each part of a polygon is a new polygon
+    bboxes = (
+        [(left, bottom, 180.0, top), (-180.0, bottom, right, top)]
+        if left > right
+        else [bbox]
+    )
+
+    xs: list["numpy.ndarray"] = []
+    ys: list["numpy.ndarray"] = []
+    rings: list["numpy.ndarray"] = []
+    polygons: list[int] = []
+    polygon_id = 0
+    for polygon in _polygons(geometry):
+        for clip_bbox in bboxes:
+            for ring in polygon:
+                coords = np.asarray(ring, dtype="float64")
+                if coords.ndim != 2 or len(coords) < 3:
+                    continue
+
+                coords = coords[:, :2]
+                if (
+                    coords[:, 0].min() < clip_bbox[0]
+                    or coords[:, 1].min() < clip_bbox[1]
+                    or coords[:, 0].max() > clip_bbox[2]
+                    or coords[:, 1].max() > clip_bbox[3]
+                ):
+                    coords = np.asarray(
+                        _clip_ring([(x, y) for x, y in coords.tolist()], clip_bbox),
+                        dtype="float64",
+                    ).reshape(-1, 2)
+                    if not len(coords):
+                        continue
+
+                elif (coords[0] != coords[-1]).any():
+                    coords = np.vstack([coords, coords[:1]])
+
+                xs.append(coords[:, 0])
+                ys.append(coords[:, 1])
+                rings.append(np.full(len(coords), len(polygons), dtype="int64"))
+                polygons.append(polygon_id)
+
+            polygon_id += 1
+
+    if not xs:
+        empty = np.empty(0, dtype="float64")
+        return empty, empty, np.empty(0, dtype="int64"), np.empty(0, dtype="int64")
+
+    return (
+        np.concatenate(xs),
+        np.concatenate(ys),
+        np.concatenate(rings),
+        np.asarray(polygons, dtype="int64"),
+    )
+
+
+def _lines(obj: Any) -> Iterator[Any]:
+    """Yield the coordinates of the LineStrings of a GeoJSON-like object, or of a sequence of them."""
+    if not (isinstance(obj, dict) or hasattr(obj, "__geo_interface__")):
+        # Sequence of GeoJSON-like objects or of line coordinates
+        for item in obj:
+            if isinstance(item, dict) or hasattr(item, "__geo_interface__"):
+                yield from _lines(item)
+            else:
+                yield item
+
+        return
+
+    for geometry in _geometries(obj):
+        geom_type = geometry.get("type")
+        if geom_type == "LineString":
+            yield geometry["coordinates"]
+
+        elif geom_type == "MultiLineString":
+            yield from geometry["coordinates"]
+
+        else:
+            raise ValueError(f"Invalid geometry type: {geom_type}")
+
+
+def _clip_segments(
+    x0: "numpy.ndarray",
+    y0: "numpy.ndarray",
+    x1: "numpy.ndarray",
+    y1: "numpy.ndarray",
+    bbox: tuple[float, float, float, float],
+) -> tuple["numpy.ndarray", "numpy.ndarray", "numpy.ndarray", "numpy.ndarray"]:
+    """Clip segments to a bounding box (Liang-Barsky), segments outside the bbox are removed."""
+    import numpy as np
+
+    left, bottom, right, top = bbox
+    dx = x1 - x0
+    dy = y1 - y0
+
+    t0 = np.zeros(len(x0))
+    t1 = np.ones(len(x0))
+    inside = np.ones(len(x0), dtype=bool)
+    for p, q in (
+        (-dx, x0 - left),
+        (dx, right - x0),
+        (-dy, y0 - bottom),
+        (dy, top - y0),
+    ):
+        parallel = p == 0
+        inside &= ~(parallel & (q < 0))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            r = np.where(parallel, 0, q / p)
+
+        t0 = np.where(~parallel & (p < 0), np.maximum(t0, r), t0)
+        t1 = np.where(~parallel & (p > 0), np.minimum(t1, r), t1)
+
+    inside &= t0 <= t1
+    x0, y0, dx, dy, t0, t1 = (
+        x0[inside],
+        y0[inside],
+        dx[inside],
+        dy[inside],
+        t0[inside],
+        t1[inside],
+    )
+    return x0 + t0 * dx, y0 + t0 * dy, x0 + t1 * dx, y0 + t1 * dy
+
+
+def _line_arrays(
+    lines: Any,
+    bbox: tuple[float, float, float, float],
+) -> tuple["numpy.ndarray", "numpy.ndarray", "numpy.ndarray"]:
+    """Get the coordinates and segment ids of the segments of lines clipped to a bbox."""
+    import numpy as np
+
+    left, bottom, right, top = bbox
+    bboxes = (
+        [(left, bottom, 180.0, top), (-180.0, bottom, right, top)]
+        if left > right
+        else [bbox]
+    )
+
+    segments: list[tuple["numpy.ndarray", ...]] = []
+    for line in _lines(lines):
+        coords = np.asarray(line, dtype="float64")
+        if coords.ndim != 2 or len(coords) < 1:
+            continue
+
+        # A single point is a zero length segment
+        if len(coords) == 1:
+            coords = np.vstack([coords, coords])
+
+        coords = coords[:, :2]
+        for clip_bbox in bboxes:
+            segments.append(
+                _clip_segments(
+                    coords[:-1, 0],
+                    coords[:-1, 1],
+                    coords[1:, 0],
+                    coords[1:, 1],
+                    clip_bbox,
+                )
+            )
+
+    if not segments:
+        empty = np.empty(0, dtype="float64")
+        return empty, empty, np.empty(0, dtype="int64")
+
+    x0, y0, x1, y1 = (np.concatenate(arrays) for arrays in zip(*segments))
+
+    # Interleave start and end points, each segment is a new "line"
+    lng = np.column_stack([x0, x1]).ravel()
+    lat = np.column_stack([y0, y1]).ravel()
+    ids = np.repeat(np.arange(len(x0), dtype="int64"), 2)
+    return lng, lat, ids
+
+
+def _densify(
+    lng: "numpy.ndarray",
+    lat: "numpy.ndarray",
+    rings: "numpy.ndarray",
+    transform: Callable[[Any, Any], tuple[Any, Any]],
+    tolerance: float,
+) -> tuple["numpy.ndarray", "numpy.ndarray", "numpy.ndarray"]:
+    """Transform ring coordinates, adding points until the edges are within tolerance of the transformed geometry."""
+    import numpy as np
+
+    x, y = transform(lng, lat)
+    x, y = np.asarray(x, dtype="float64"), np.asarray(y, dtype="float64")
+    if not (np.isfinite(x).all() and np.isfinite(y).all()):
+        raise ValueError("Geometry coordinates cannot be transformed to the TMS CRS")
+
+    for _ in range(DENSIFY_MAX_ITERATIONS):
+        mid_lng = (lng[:-1] + lng[1:]) / 2
+        mid_lat = (lat[:-1] + lat[1:]) / 2
+        mid_x, mid_y = transform(mid_lng, mid_lat)
+        mid_x, mid_y = np.asarray(mid_x), np.asarray(mid_y)
+
+        same_ring = rings[:-1] == rings[1:]
+        if not (
+            np.isfinite(mid_x[same_ring]).all() and np.isfinite(mid_y[same_ring]).all()
+        ):
+            raise ValueError(
+                "Geometry coordinates cannot be transformed to the TMS CRS"
+            )
+
+        distance = np.hypot(mid_x - (x[:-1] + x[1:]) / 2, mid_y - (y[:-1] + y[1:]) / 2)
+        split = same_ring & (distance > tolerance)
+        if not split.any():
+            break
+
+        idx = np.flatnonzero(split) + 1
+        lng = np.insert(lng, idx, mid_lng[split])
+        lat = np.insert(lat, idx, mid_lat[split])
+        x = np.insert(x, idx, mid_x[split])
+        y = np.insert(y, idx, mid_y[split])
+        rings = np.insert(rings, idx, rings[idx])
+
+    return x, y, rings
+
+
+def _edges(
+    u: "numpy.ndarray",
+    v: "numpy.ndarray",
+    rings: "numpy.ndarray",
+) -> tuple[
+    "numpy.ndarray", "numpy.ndarray", "numpy.ndarray", "numpy.ndarray", "numpy.ndarray"
+]:
+    """Get the edges (u0, v0, u1, v1) and ring ids of consecutive points of the same ring."""
+    valid = rings[:-1] == rings[1:]
+    return u[:-1][valid], v[:-1][valid], u[1:][valid], v[1:][valid], rings[:-1][valid]
+
+
+def _boundary_spans(
+    u0: "numpy.ndarray",
+    v0: "numpy.ndarray",
+    u1: "numpy.ndarray",
+    v1: "numpy.ndarray",
+    height: int,
+    touching: bool = False,
+) -> tuple["numpy.ndarray", "numpy.ndarray", "numpy.ndarray"]:
+    """Get the (row, first column, last column) of the tiles crossed by each edge in each row.
+
+    Tiles only touched by an edge (on their sides or corners) are only included when `touching=True`.
+
+    """
+    import numpy as np
+
+    eps = -TILE_EPSILON if touching else TILE_EPSILON
+
+    vmin = np.minimum(v0, v1)
+    vmax = np.maximum(v0, v1)
+    first = np.maximum(np.floor(vmin + eps), 0).astype("int64")
+    last = np.minimum(np.ceil(vmax - eps) - 1, height - 1).astype("int64")
+    count = np.maximum(last - first + 1, 0)
+
+    idx = np.repeat(np.arange(len(count)), count)
+    rows = first[idx] + np.arange(len(idx)) - np.repeat(np.cumsum(count) - count, count)
+
+    # part of the edges within the row
+    u0, v0, u1, v1 = u0[idx], v0[idx], u1[idx], v1[idx]
+    va = np.maximum(np.minimum(v0, v1), rows)
+    vb = np.minimum(np.maximum(v0, v1), rows + 1)
+    dv = v1 - v0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        slope = np.where(dv != 0, (u1 - u0) / dv, 0)
+
+    horizontal = dv == 0
+    ua = np.where(horizontal, u0, u0 + (va - v0) * slope)
+    ub = np.where(horizontal, u1, u0 + (vb - v0) * slope)
+
+    starts = np.floor(np.minimum(ua, ub) + eps).astype("int64")
+    ends = np.ceil(np.maximum(ua, ub) - eps).astype("int64") - 1
+
+    # Edges within a row but on a vertical tile edge
+    valid = ends >= starts
+    return rows[valid], starts[valid], ends[valid]
+
+
+def _interior_spans(
+    u0: "numpy.ndarray",
+    v0: "numpy.ndarray",
+    u1: "numpy.ndarray",
+    v1: "numpy.ndarray",
+    polygons: "numpy.ndarray",
+    height: int,
+) -> tuple["numpy.ndarray", "numpy.ndarray", "numpy.ndarray"]:
+    """Get the (row, first column, last column) of the tiles whose center is inside the polygons."""
+    import numpy as np
+
+    vmin = np.minimum(v0, v1)
+    vmax = np.maximum(v0, v1)
+
+    # rows whose center is in [vmin, vmax)
+    first = np.maximum(np.ceil(vmin - 0.5), 0).astype("int64")
+    last = np.minimum(np.ceil(vmax - 0.5) - 1, height - 1).astype("int64")
+    count = np.maximum(last - first + 1, 0)
+
+    idx = np.repeat(np.arange(len(count)), count)
+    rows = first[idx] + np.arange(len(idx)) - np.repeat(np.cumsum(count) - count, count)
+
+    # crossing of the edges with the row's center line
+    u0, v0, u1, v1 = u0[idx], v0[idx], u1[idx], v1[idx]
+    crossing = u0 + (rows + 0.5 - v0) * (u1 - u0) / (v1 - v0)
+
+    # even-odd pairs of crossings, for each polygon and row
+    polygons = polygons[idx]
+    order = np.lexsort((crossing, rows, polygons))
+    rows, crossing = rows[order], crossing[order]
+    ua, ub = crossing[0::2], crossing[1::2]
+
+    starts = np.ceil(ua - 0.5).astype("int64")
+    ends = np.floor(ub - 0.5).astype("int64")
+
+    valid = ends >= starts
+    return rows[0::2][valid], starts[valid], ends[valid]
+
+
+def polygon_spans(
+    u: "numpy.ndarray",
+    v: "numpy.ndarray",
+    rings: "numpy.ndarray",
+    polygons: "numpy.ndarray",
+    height: int,
+) -> tuple["numpy.ndarray", "numpy.ndarray", "numpy.ndarray"]:
+    """Get the (row, first column, last column) spans of the tiles intersecting polygons.
+
+    Args:
+        u, v (numpy.ndarray): Polygon rings coordinates, in tile unit (column, row).
+        rings (numpy.ndarray): Ring id of each coordinate.
+        polygons (numpy.ndarray): Polygon id of each ring.
+        height (int): Number of rows of the tile matrix.
+
+    Returns:
+        tuple of 1D int64 arrays: rows, first and last columns (spans may overlap and are not clipped to the matrix width).
+
+    """
+    import numpy as np
+
+    u0, v0, u1, v1, edge_rings = _edges(u, v, rings)
+    boundary = _boundary_spans(u0, v0, u1, v1, height)
+    interior = _interior_spans(u0, v0, u1, v1, polygons[edge_rings], height)
+
+    return (
+        np.concatenate([boundary[0], interior[0]]),
+        np.concatenate([boundary[1], interior[1]]),
+        np.concatenate([boundary[2], interior[2]]),
+    )
+
+
+def line_spans(
+    u: "numpy.ndarray",
+    v: "numpy.ndarray",
+    lines: "numpy.ndarray",
+    height: int,
+) -> tuple["numpy.ndarray", "numpy.ndarray", "numpy.ndarray"]:
+    """Get the (row, first column, last column) spans of the tiles touched by lines (supercover).
+
+    Args:
+        u, v (numpy.ndarray): Lines coordinates, in tile unit (column, row).
+        lines (numpy.ndarray): Line id of each coordinate.
+        height (int): Number of rows of the tile matrix.
+
+    Returns:
+        tuple of 1D int64 arrays: rows, first and last columns (spans may overlap and are not clipped to the matrix width).
+
+    """
+    u0, v0, u1, v1, _ = _edges(u, v, lines)
+    return _boundary_spans(u0, v0, u1, v1, height, touching=True)
+
+
+def merge_spans(
+    rows: "numpy.ndarray",
+    starts: "numpy.ndarray",
+    ends: "numpy.ndarray",
+    width: int,
+) -> tuple["numpy.ndarray", "numpy.ndarray", "numpy.ndarray"]:
+    """Sort and merge overlapping or adjacent (row, first column, last column) spans.
+
+    Columns are clipped to the matrix width.
+
+    """
+    import numpy as np
+
+    starts = np.maximum(starts, 0)
+    ends = np.minimum(ends, width - 1)
+    valid = ends >= starts
+    rows, starts, ends = rows[valid], starts[valid], ends[valid]
+    if not len(rows):
+        return rows, starts, ends
+
+    # Sort spans using a single (row, column) key
+    size = width + 2
+    start_keys = rows * size + starts
+    order = np.argsort(start_keys, kind="stable")
+    start_keys = start_keys[order]
+    end_keys = np.maximum.accumulate((rows * size + ends)[order])
+
+    new = np.ones(len(start_keys), dtype=bool)
+    new[1:] = start_keys[1:] > end_keys[:-1] + 1
+    first = np.flatnonzero(new)
+    last = np.append(first[1:], len(start_keys)) - 1
+
+    merged_rows = start_keys[first] // size
+    return (
+        merged_rows,
+        start_keys[first] - merged_rows * size,
+        end_keys[last] - merged_rows * size,
+    )
+
+
+def in_spans(
+    rows: "numpy.ndarray",
+    cols: "numpy.ndarray",
+    spans: tuple["numpy.ndarray", "numpy.ndarray", "numpy.ndarray"],
+    width: int,
+) -> "numpy.ndarray":
+    """Check if (row, column) tiles are within merged (see `merge_spans`) spans."""
+    import numpy as np
+
+    span_rows, starts, ends = spans
+    if not len(span_rows):
+        return np.zeros(len(rows), dtype=bool)
+
+    size = width + 2
+    idx = np.searchsorted(span_rows * size + starts, rows * size + cols, side="right")
+    idx = np.maximum(idx - 1, 0)
+    return (span_rows[idx] == rows) & (starts[idx] <= cols) & (ends[idx] >= cols)
@@ -0,0 +1,384 @@
+"""Morecantile space-filling curves.
+
+Tile orderings following a space-filling curve keep neighbouring tiles close to
+each other, which makes (tile) keys of neighbouring tiles share prefixes.
+
+- Morton (or Z-order): interleave the bits of the tile X (even bits) and Y (odd
+  bits) indices. For quadtree TMS, the Morton index of a tile is its quadkey
+  read as a base-4 number.
+- Hilbert: continuous curve, each tile is followed by one of its (edge)
+  neighbours. The Hilbert tile IDs of PMTiles archives are the position of the
+  tiles along the Hilbert curves of successive zoom levels.
+
+"""
+
+from collections.abc import Iterator, Sequence
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+from morecantile.utils import _parse_tile_arrays
+
+if TYPE_CHECKING:
+    import numpy
+    import numpy.typing
+
+# Maximum level of the blocks (of 2**level x 2**level tiles) yielded from a lookup table
+CURVE_BLOCK_LEVEL = 6
+
+# Maximum (zoom) level of the 64-bit Hilbert tile IDs
+HILBERT_MAX_LEVEL = 31
+
+# Number of levels of the Hilbert curve encoded/decoded at once (with lookup tables)
+HILBERT_TABLE_LEVELS = 4
+
+
+def morton_index(x: int, y: int) -> int:
+    """
+    Get the Morton (Z-order) index of a tile
+
+    Parameters
+    ----------
+    x, y : int
+        Tile X and Y indices.
+
+    Returns
+    -------
+    int
+
+    """
+    index = 0
+    for i in range(max(x.bit_length(), y.bit_length())):
+        index |= ((x >> i) & 1) << (2 * i) | ((y >> i) & 1) << (2 * i + 1)
+    return index
+
+
+def _spread_bits(v: "numpy.ndarray") -> "numpy.ndarray":
+    """Insert a 0 bit between each of the 32 lower bits of uint64 integers."""
+    import numpy as np
+
+    v = v & np.uint64(0x00000000FFFFFFFF)
+    for shift, mask in (
+        (16, 0x0000FFFF0000FFFF),
+        (8, 0x00FF00FF00FF00FF),
+        (4, 0x0F0F0F0F0F0F0F0F),
+        (2, 0x3333333333333333),
+        (1, 0x5555555555555555),
+    ):
+        v = (v | (v << np.uint64(shift))) & np.uint64(mask)
+    return v
+
+
+def morton_indices(
+    x: "numpy.typing.ArrayLike", y: "numpy.typing.ArrayLike"
+) -> "numpy.ndarray":
+    """
+    Get the Morton (Z-order) indices of many tiles (requires numpy)
+
+    Parameters
+    ----------
+    x, y : array_like
+        Tile X and Y indices (< 2**32).
+
+    Returns
+    -------
+    numpy.ndarray of uint64
+
+    """
+    import numpy as np
+
+    x = np.asarray(x).astype("uint64")
+    y = np.asarray(y).astype("uint64")
+    return _spread_bits(x) | (_spread_bits(y) << np.uint64(1))
+
+
+def morton_sort(
+    x: "numpy.typing.ArrayLike",
+    y: "numpy.typing.ArrayLike | None" = None,
+    z: "numpy.typing.ArrayLike | None" = None,
+) -> "numpy.ndarray":
+    """
+    Sort many tiles by zoom level and Morton (Z-order) index (requires numpy)
+
+    Parameters
+    ----------
+    x : array_like
+        Either the X indices (with `y` and `z`) or a (N, 3) array of X, Y, Z (e.g
+        a list of Tile or `TileRange.to_numpy()`).
+    y, z : array_like, optional
+        Y indices and zoom levels. Scalars are broadcasted.
+
+    Returns
+    -------
+    numpy.ndarray
+        (N, 3) int64 array of the sorted tiles X, Y, Z.
+
+    """
+    import numpy as np
+
+    xs, ys, zs = _parse_tile_arrays(x, y, z)
+    order = np.lexsort((morton_indices(xs, ys), zs))
+    return np.stack([xs[order], ys[order], zs[order]], axis=-1)
+
+
+def hilbert_index(x: int, y: int, bits: int) -> int:
+    """
+    Get the Hilbert index of a tile
+
+    Parameters
+    ----------
+    x, y : int
+        Tile X and Y indices.
+    bits : int
+        Order of the curve (the matrix is 2**bits x 2**bits tiles).
+
+    Returns
+    -------
+    int
+
+    """
+    index = 0
+    for level in range(bits - 1, -1, -1):
+        rx = (x >> level) & 1
+        ry = (y >> level) & 1
+        index |= ((3 * rx) ^ ry) << (2 * level)
+
+        # Rotate the quadrant
+        mask = (1 << level) - 1
+        x, y = x & mask, y & mask
+        if ry == 0:
+            if rx == 1:
+                x, y = mask - x, mask - y
+            x, y = y, x
+
+    return index
+
+
+def hilbert_indices(
+    x: "numpy.typing.ArrayLike",
+    y: "numpy.typing.ArrayLike",
+    bits: "numpy.typing.ArrayLike",
+) -> "numpy.ndarray":
+    """
+    Get the Hilbert indices of many tiles (requires numpy)
+
+    Parameters
+    ----------
+    x, y : array_like
+        Tile X and Y indices.
+    bits : int or array_like
+        Order of the curve for each tile (<= 32).
+
+    Returns
+    -------
+    numpy.ndarray of uint64
+
+    """
+    import numpy as np
+
+    x, y, bits = np.broadcast_arrays(
+        np.asarray(x).astype("uint64"),
+        np.asarray(y).astype("uint64"),
+        np.asarray(bits).astype("uint64"),
+    )
+    digits, states, _, _ = _hilbert_tables()
+    k = np.uint64(HILBERT_TABLE_LEVELS)
+    chunk_mask = (np.uint64(1) << k) - np.uint64(1)
+
+    levels = _hilbert_levels(bits)
+    state = _hilbert_state(bits, levels)
+    index = np.zeros(x.shape, dtype="uint64")
+    for shift in range(levels - HILBERT_TABLE_LEVELS, -1, -HILBERT_TABLE_LEVELS):
+        s = np.uint64(shift)
+        key = (state << (k * np.uint64(2))) | (((x >> s) & chunk_mask) << k)
+        key |= (y >> s) & chunk_mask
+        index = (index << (k * np.uint64(2))) | digits[key]
+        state = states[key]
+
+    return index
+
+
+def hilbert_xy(
+    indices: "numpy.typing.ArrayLike", bits: "numpy.typing.ArrayLike"
+) -> tuple["numpy.ndarray", "numpy.ndarray"]:
+    """
+    Get the X and Y indices of many tiles from their Hilbert indices (requires numpy)
+
+    Parameters
+    ----------
+    indices : array_like
+        Hilbert indices.
+    bits : int or array_like
+        Order of the curve for each index (<= 32).
+
+    Returns
+    -------
+    tuple of two numpy.ndarray of int64 (x, y)
+
+    """
+    import numpy as np
+
+    indices, bits = np.broadcast_arrays(
+        np.asarray(indices).astype("uint64"), np.asarray(bits).astype("uint64")
+    )
+    _, _, coords, states = _hilbert_tables()
+    k = np.uint64(HILBERT_TABLE_LEVELS)
+    digits_mask = (np.uint64(1) << (k * np.uint64(2))) - np.uint64(1)
+    chunk_mask = (np.uint64(1) << k) - np.uint64(1)
+
+    levels = _hilbert_levels(bits)
+    state = _hilbert_state(bits, levels)
+    x = np.zeros(indices.shape, dtype="uint64")
+    y = np.zeros(indices.shape, dtype="uint64")
+    for shift in range(levels - HILBERT_TABLE_LEVELS, -1, -HILBERT_TABLE_LEVELS):
+        key = (state << (k * np.uint64(2))) | (
+            (indices >> (np.uint64(shift) * np.uint64(2))) & digits_mask
+        )
+        xy = coords[key]
+        x = (x << k) | (xy >> k)
+        y = (y << k) | (xy & chunk_mask)
+        state = states[key]
+
+    return x.astype("int64"), y.astype("int64")
+
+
+def _hilbert_levels(bits: "numpy.ndarray") -> int:
+    """Number of levels of the curve processed by the vectorized functions (a multiple of HILBERT_TABLE_LEVELS)."""
+    nbits = int(bits.max(initial=0))
+    return -(-nbits // HILBERT_TABLE_LEVELS) * HILBERT_TABLE_LEVELS
+
+
+def _hilbert_state(bits: "numpy.ndarray", levels: int) -> "numpy.ndarray":
+    """Initial state of the curve for tiles of a smaller order than the processed levels.
+
+    The levels above the order of a tile (in the first quadrant) only swap x
+    and y (state 1).
+
+    """
+    import numpy as np
+
+    return (np.uint64(levels) - bits) & np.uint64(1)
+
+
+@lru_cache(maxsize=None)
+def _hilbert_tables() -> tuple[
+    "numpy.ndarray", "numpy.ndarray", "numpy.ndarray", "numpy.ndarray"
+]:
+    """Lookup tables of the Hilbert curve for blocks of HILBERT_TABLE_LEVELS levels.
+
+    Returns
+    -------
+    tuple of numpy.ndarray of uint64:
+        - digits (indexed by state, x bits, y bits)
+        - states after encoding (indexed by state, x bits, y bits)
+        - x, y bits (indexed by state, digits)
+        - states after decoding (indexed by state, digits)
+
+    """
+    import numpy as np
+
+    k = HILBERT_TABLE_LEVELS
+    size = 1 << (2 * k)
+    digits = np.zeros(4 * size, dtype="uint64")
+    encode_states = np.zeros(4 * size, dtype="uint64")
+    coords = np.zeros(4 * size, dtype="uint64")
+    decode_states = np.zeros(4 * size, dtype="uint64")
+    for state in range(4):
+        for x in range(1 << k):
+            for y in range(1 << k):
+                digit, current = 0, state
+                for level in range(k - 1, -1, -1):
+                    quadrant = ((x >> level) & 1, (y >> level) & 1)
+                    children = _curve_children("hilbert", current)
+                    i = [c[:2] for c in children].index(quadrant)
+                    digit = (digit << 2) | i
+                    current = children[i][2]
+
+                key = (state << (2 * k)) | (x << k) | y
+                digits[key] = digit
+                encode_states[key] = current
+                coords[(state << (2 * k)) | digit] = (x << k) | y
+                decode_states[(state << (2 * k)) | digit] = current
+
+    return digits, encode_states, coords, decode_states
+
+
+# Quadrants (x, y) in Morton order
+_MORTON_QUADRANTS = ((0, 0), (1, 0), (0, 1), (1, 1))
+
+# Quadrants (rx, ry) in Hilbert order, in the (rotated) frame of the curve
+_HILBERT_QUADRANTS = ((0, 0), (0, 1), (1, 1), (1, 0))
+
+
+@lru_cache(maxsize=None)
+def _curve_children(curve: str, state: int) -> tuple[tuple[int, int, int], ...]:
+    """Get the (x, y, state) of the 4 children of a block in the curve order.
+
+    The Hilbert curve state is the transformation of the block (bit 0: x/y
+    swapped, bit 1: x/y flipped) in the frame of the curve.
+
+    """
+    if curve == "morton":
+        return tuple((x, y, state) for x, y in _MORTON_QUADRANTS)
+
+    swap, flip = state & 1, state >> 1
+    children = []
+    for rx, ry in _HILBERT_QUADRANTS:
+        x, y = rx ^ flip, ry ^ flip
+        if swap:
+            x, y = y, x
+        rotation = (1 | (rx << 1)) if ry == 0 else 0
+        children.append((x, y, state ^ rotation))
+
+    return tuple(children)
+
+
+@lru_cache(maxsize=None)
+def _curve_offsets(curve: str, level: int, state: int) -> list[tuple[int, int]]:
+    """(x, y) offsets of the tiles of a 2**level x 2**level block, in the curve order."""
+    if level == 0:
+        return [(0, 0)]
+
+    size = 1 << (level - 1)
+    return [
+        (x + cx * size, y + cy * size)
+        for cx, cy, child in _curve_children(curve, state)
+        for x, y in _curve_offsets(curve, level - 1, child)
+    ]
+
+
+def _curve_tiles(
+    rects: Sequence[tuple[int, int, int, int]], bits: int, curve: str
+) -> Iterator[tuple[int, int]]:
+    """Yield the (x, y) indices of the tiles within (minx, miny, maxx, maxy) rectangles in the curve (morton or hilbert) order.
+
+    The rectangles are within a 2**bits x 2**bits matrix, and the tiles within
+    more than one rectangle are only yielded once.
+
+    """
+    # (x, y, level, state): block of 2**level x 2**level tiles
+    stack = [(0, 0, bits, 0)]
+    while stack:
+        x, y, level, state = stack.pop()
+        minx, miny = x << level, y << level
+        maxx, maxy = minx + (1 << level) - 1, miny + (1 << level) - 1
+
+        inside = any(
+            minx >= rminx and maxx <= rmaxx and miny >= rminy and maxy <= rmaxy
+            for rminx, rminy, rmaxx, rmaxy in rects
+        )
+        if inside and level <= CURVE_BLOCK_LEVEL:
+            # Small block within a rectangle: yield all its tiles from the lookup table
+            for dx, dy in _curve_offsets(curve, level, state):
+                yield minx + dx, miny + dy
+            continue
+
+        if not inside and not any(
+            minx <= rmaxx and maxx >= rminx and miny <= rmaxy and maxy >= rminy
+            for rminx, rminy, rmaxx, rmaxy in rects
+        ):
+            continue
+
+        stack.extend(
+            (x * 2 + cx, y * 2 + cy, level - 1, child)
+            for cx, cy, child in reversed(_curve_children(curve, state))
+        )
@@ -6,6 +6,7 @@ from copy import copy, deepcopy
 
 import attr
 
+from morecantile.compiled import load_tms
 from morecantile.errors import InvalidIdentifier
 from morecantile.models import TileMatrixSet
 
@@ -26,9 +27,22 @@ class TileMatrixSets:
     """Default TileMatrixSets holder."""
 
     tilematrixsets: dict = attr.ib()
+    _shared: dict = attr.ib(factory=dict, init=False, repr=False, eq=False)
 
-    def get(self, identifier: str) -> TileMatrixSet:
-        """Fetch a TMS."""
+    def get(self, identifier: str, shared: bool = False) -> TileMatrixSet:
+        """Fetch a TMS.
+
+        Args:
+            identifier (str): TileMatrixSet identifier.
+            shared (bool): Return a shared, frozen, TileMatrixSet instance instead of a copy.
+                The same instance (with its cached properties) is returned on each call and
+                `set_geographic_crs` will raise `FrozenTileMatrixSetError` (use `with_geographic_crs`
+                to get an updated copy). Defaults to False.
+
+        Returns:
+            TileMatrixSet
+
+        """
         if identifier not in self.tilematrixsets:
             raise InvalidIdentifier(f"Invalid identifier: {identifier}")
 
@@ -36,9 +50,18 @@ class TileMatrixSets:
 
         # We lazyload the TMS document only when called
         if isinstance(tilematrix, pathlib.Path):
-            with tilematrix.open() as f:
-                tilematrix = TileMatrixSet.model_validate_json(f.read())
-                self.tilematrixsets[identifier] = tilematrix
+            tilematrix = load_tms(tilematrix)
+            self.tilematrixsets[identifier] = tilematrix
+
+        if shared:
+            # The registered TMS might have been updated (e.g `tilematrixsets` dict or overwrite)
+            source, frozen_tms = self._shared.get(identifier, (None, None))
+            if source is not tilematrix:
+                frozen_tms = deepcopy(tilematrix)
+                frozen_tms._frozen = True
+                self._shared[identifier] = (tilematrix, frozen_tms)
+
+            return frozen_tms
 
         return deepcopy(tilematrix)
 
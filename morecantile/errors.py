@@ -17,6 +17,10 @@ class TileArgParsingError(MorecantileError):
     """Raised when errors occur in parsing a function's tile arg(s)"""
 
 
+class FrozenTileMatrixSetError(MorecantileError):
+    """Raised when trying to modify a shared (frozen) TileMatrixSet."""
+
+
 class PointOutsideTMSBounds(UserWarning):
     """Point is outside TMS bounds."""
 
@@ -0,0 +1,239 @@
+"""Morecantile packed tile keys.
+
+A tile key packs the zoom level and the X and Y indices of a tile in a single
+unsigned 64-bit integer (requires numpy):
+
+    key = z << 58 | y << 29 | x
+
+Keys are 8 bytes per tile (instead of a `Tile` tuple of three Python ints),
+can be stored, hashed and compared as NumPy arrays, and sort by zoom level and
+then in row-major order (like `TileMatrixSet.tiles`). The X and Y indices must
+be lower than 2**29.
+
+"""
+
+from collections.abc import Iterator
+from typing import TYPE_CHECKING
+
+from morecantile.errors import InvalidZoomError
+from morecantile.utils import _parse_tile_arrays
+
+if TYPE_CHECKING:
+    import numpy
+    import numpy.typing
+
+# Number of bits of the X and Y tile indices
+KEY_INDEX_BITS = 29
+
+# Number of bits of the zoom level
+KEY_ZOOM_BITS = 64 - 2 * KEY_INDEX_BITS
+
+
+def _check_key_zoom(zoom: int) -> None:
+    """Check that tiles of a zoom level can be packed in keys (zoom 0 to 63)."""
+    if not 0 <= zoom < 1 << KEY_ZOOM_BITS:
+        raise InvalidZoomError(
+            f"Tile keys are only supported for zoom levels 0 to {(1 << KEY_ZOOM_BITS) - 1}, got {zoom}"
+        )
+
+
+def pack_keys(
+    x: "numpy.typing.ArrayLike",
+    y: "numpy.typing.ArrayLike | None" = None,
+    z: "numpy.typing.ArrayLike | None" = None,
+) -> "numpy.ndarray":
+    """
+    Pack the tile indices of many tiles to uint64 keys (requires numpy)
+
+    Only the zoom levels are validated (negative zoom levels, e.g. of
+    CDB1GlobalGrid, cannot be packed). See `TileMatrixSet.pack_tiles` to also
+    validate the tile indices.
+
+    Parameters
+    ----------
+    x : array_like
+        Either the X indices (with `y` and `z`) or a (N, 3) array of X, Y, Z (e.g
+        a list of Tile).
+    y, z : array_like, optional
+        Y indices and zoom levels. Scalars are broadcasted.
+
+    Returns
+    -------
+    numpy.ndarray of uint64
+
+    """
+    import numpy as np
+
+    xs, ys, zs = _parse_tile_arrays(x, y, z)
+    if zs.size:
+        _check_key_zoom(int(zs.min()))
+        _check_key_zoom(int(zs.max()))
+
+    bits = np.uint64(KEY_INDEX_BITS)
+    return (
+        (zs.astype("uint64") << (bits * np.uint64(2)))
+        | (ys.astype("uint64") << bits)
+        | xs.astype("uint64")
+    )
+
+
+def unpack_keys(keys: "numpy.typing.ArrayLike") -> "numpy.ndarray":
+    """
+    Unpack the tile indices of many uint64 keys (requires numpy)
+
+    Parameters
+    ----------
+    keys : array_like
+        Tile keys.
+
+    Returns
+    -------
+    numpy.ndarray: (N, 3) int64 array of X, Y, Z tile indices.
+
+    """
+    import numpy as np
+
+    keys = np.asarray(keys).astype("uint64").ravel()
+    bits = np.uint64(KEY_INDEX_BITS)
+    mask = (np.uint64(1) << bits) - np.uint64(1)
+    return np.stack(
+        [keys & mask, (keys >> bits) & mask, keys >> (bits * np.uint64(2))],
+        axis=-1,
+    ).astype("int64")
+
+
+def compact_keys(keys: "numpy.typing.ArrayLike", minzoom: int = 0) -> "numpy.ndarray":
+    """
+    Compact the packed keys of a quadtree tile set (requires numpy)
+
+    Tiles covered by a coarser tile of the set are dropped and complete sets of
+    4 sibling tiles are replaced by their parent, recursively, down to
+    `minzoom`. The compacted set covers the same area with the fewest tiles.
+
+    The tile indices are not validated (see `TileMatrixSet.compact_tiles`).
+
+    Parameters
+    ----------
+    keys : array_like
+        Tile keys of a quadtree TileMatrixSet, in any order and with duplicates.
+    minzoom : int, optional
+        Coarsest zoom level of the compacted tiles (default to 0).
+
+    Returns
+    -------
+    numpy.ndarray: sorted uint64 keys.
+
+    """
+    import numpy as np
+
+    keys = np.sort(np.asarray(keys).astype("uint64").ravel())
+    new = np.ones(len(keys), dtype=bool)
+    new[1:] = keys[1:] != keys[:-1]
+    keys = keys[new]
+    x, y, z = unpack_keys(keys).T
+
+    # Drop the tiles covered by a coarser tile of the set
+    covered = np.zeros(len(keys), dtype=bool)
+    for zoom in np.unique(z)[:-1].tolist():
+        deeper = z > zoom
+        shift = z[deeper] - zoom
+        covered[deeper] |= np.isin(
+            pack_keys(x[deeper] >> shift, y[deeper] >> shift, zoom),
+            keys[z == zoom],
+            assume_unique=True,
+        )
+
+    keys, x, y, z = keys[~covered], x[~covered], y[~covered], z[~covered]
+
+    # Replace complete sets of siblings by their parent, from the finest zoom level
+    compacted = [keys[z < minzoom]]
+    parents = np.empty(0, dtype="int64")
+    mask = (1 << KEY_INDEX_BITS) - 1
+    for zoom in range(int(z.max(initial=minzoom)), minzoom, -1):
+        level = z == zoom
+        xs = np.concatenate([x[level], parents & mask])
+        ys = np.concatenate([y[level], parents >> KEY_INDEX_BITS])
+
+        parents, inverse, counts = np.unique(
+            ((ys >> 1) << KEY_INDEX_BITS) | (xs >> 1),
+            return_inverse=True,
+            return_counts=True,
+        )
+        partial = counts[inverse.ravel()] < 4
+        compacted.append(pack_keys(xs[partial], ys[partial], zoom))
+        parents = parents[counts == 4]
+
+    level = z == minzoom
+    compacted.append(
+        pack_keys(
+            np.concatenate([x[level], parents & mask]),
+            np.concatenate([y[level], parents >> KEY_INDEX_BITS]),
+            minzoom,
+        )
+    )
+    return np.sort(np.concatenate(compacted))
+
+
+def expand_keys(
+    keys: "numpy.typing.ArrayLike", zoom: int, chunk_size: int = 1 << 20
+) -> Iterator["numpy.ndarray"]:
+    """
+    Lazily expand the packed keys of a quadtree tile set to a zoom level (requires numpy)
+
+    Inverse of `compact_keys`: each tile is replaced by its descendants at
+    `zoom`. The keys are yielded in chunks, by zoom level of the input tiles
+    and then tile by tile (each tile's descendants in row-major order), so
+    that large areas can be expanded without building all the keys at once.
+
+    Parameters
+    ----------
+    keys : array_like
+        Tile keys of a quadtree TileMatrixSet (tiles should not overlap).
+    zoom : int
+        Zoom level of the expanded tiles.
+    chunk_size : int, optional
+        Maximum number of keys in each chunk (default to 2**20). Chunks are
+        never smaller than a row of descendants of a single tile.
+
+    Yields
+    ------
+    numpy.ndarray: uint64 keys.
+
+    """
+    import numpy as np
+
+    tiles = unpack_keys(keys)
+    if np.any(tiles[:, 2] > zoom):
+        raise ValueError("zoom must be greater than that of the input tiles")
+
+    for level in np.unique(tiles[:, 2]).tolist():
+        x, y, _ = tiles[tiles[:, 2] == level].T
+        shift = zoom - level
+        size = 1 << shift
+        offsets = np.arange(size, dtype="int64")
+
+        if size * size <= chunk_size:
+            # Expand many tiles at once
+            step = chunk_size // (size * size)
+            for i in range(0, len(x), step):
+                yield pack_keys(
+                    (
+                        (x[i : i + step] << shift)[:, None, None]
+                        + offsets[None, None, :]
+                    ),
+                    (
+                        (y[i : i + step] << shift)[:, None, None]
+                        + offsets[None, :, None]
+                    ),
+                    zoom,
+                )
+
+        else:
+            # Expand a single tile by blocks of rows
+            step = max(1, chunk_size // size)
+            for tx, ty in zip(x.tolist(), y.tolist()):
+                for row in range(0, size, step):
+                    rows = (ty << shift) + offsets[row : row + step]
+                    yield pack_keys(
+                        (tx << shift) + offsets[None, :], rows[:, None], zoom
+                    )
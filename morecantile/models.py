@@ -3,9 +3,10 @@
 import math
 import os
 import warnings
-from collections.abc import Iterator, Sequence
-from functools import cached_property, lru_cache
-from typing import Any, Literal
+from bisect import bisect_right
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from functools import cached_property
+from typing import TYPE_CHECKING, Any, Literal, overload
 
 import pyproj
 from pydantic import (
@@ -24,30 +25,56 @@ from typing_extensions import Annotated
 from morecantile.commons import BoundingBox, Coords, Tile
 from morecantile.errors import (
     DeprecationError,
+    FrozenTileMatrixSetError,
     InvalidZoomError,
     NoQuadkeySupport,
     PointOutsideTMSBounds,
     QuadKeyError,
 )
+from morecantile.ranges import TileRange
+from morecantile.transformers import (  # noqa: F401
+    TransformerFromCRS,
+    closed_form_transformer,
+    transformer_from_crs,
+)
 from morecantile.utils import (
     _parse_tile_arg,
+    _parse_tile_arrays,
     bbox_to_feature,
     check_quadkey_support,
+    crs_from_epsg,
     lons_contain_antimeridian,
     meters_per_unit,
     point_in_bbox,
+    points_in_bbox,
     to_rasterio_crs,
     truncate_coordinates,
 )
 
+if TYPE_CHECKING:
+    import numpy
+    import numpy.typing
+
 NumType = float | int
 BoundsType = tuple[NumType, NumType]
 LL_EPSILON = 1e-11
 axesInfo = Annotated[list[str], Field(min_length=2, max_length=2)]
-WGS84_CRS = pyproj.CRS.from_epsg(4326)
 DEFAULT_GEOGRAPHIC_CRS = os.environ.get("MORECANTILE_DEFAULT_GEOGRAPHIC_CRS")
+# Maximum number of extrapolated TileMatrix kept by `TileMatrixSet.matrix`
+EXTRAPOLATED_MATRICES_CACHE_SIZE = 32
+# Maximum number of lookup tables kept by `TileMatrixSet.overlapping_tiles_many`
+OVERLAPPING_TABLES_CACHE_SIZE = 8
+# Maximum number of tiles of a TileMatrix for `overlapping_tiles_many` lookup tables
+OVERLAPPING_TABLE_MAX_TILES = 1 << 20
+
+
+def __getattr__(name: str) -> Any:
+    """Create module constants on first access."""
+    # Kept for backward compatibility, use `morecantile.utils.crs_from_epsg(4326)`
+    if name == "WGS84_CRS":
+        return crs_from_epsg(4326)
 
-TransformerFromCRS = lru_cache(pyproj.Transformer.from_crs)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 class CRSUri(BaseModel):
@@ -378,6 +405,41 @@ class TileMatrix(BaseModel, extra="forbid"):
         ),
     ] = None
 
+    @cached_property
+    def _coalesce_lookup(self) -> tuple[tuple[int, ...], tuple[int, ...]]:
+        """Sorted row intervals lookup table for the coalesce factors.
+
+        Returns the first row of each interval and its coalesce factor (the
+        interval ends at the next interval's first row). When
+        `variableMatrixWidths` overlap, the first matching definition wins.
+
+        """
+        widths = self.variableMatrixWidths or []
+        edges = sorted(
+            edge
+            for edge in (
+                {0}
+                | {w.minTileRow for w in widths}
+                | {w.maxTileRow + 1 for w in widths}
+            )
+            if edge < self.matrixHeight
+        )
+
+        starts: list[int] = []
+        factors: list[int] = []
+        for edge in edges:
+            factor = next(
+                (w.coalesce for w in widths if w.maxTileRow >= edge >= w.minTileRow),
+                1,
+            )
+            if factors and factors[-1] == factor:
+                continue
+
+            starts.append(edge)
+            factors.append(factor)
+
+        return tuple(starts), tuple(factors)
+
     def get_coalesce_factor(self, row: int) -> int:
         """Get Coalesce value for TileMatrix."""
         if not self.variableMatrixWidths:
@@ -391,11 +453,30 @@ class TileMatrix(BaseModel, extra="forbid"):
                 f"Row {row} is greater than the TileMatrix height ({self.matrixHeight})"
             )
 
-        for matrix_width in self.variableMatrixWidths:
-            if matrix_width.maxTileRow >= row >= matrix_width.minTileRow:
-                return matrix_width.coalesce
+        starts, factors = self._coalesce_lookup
+        return factors[bisect_right(starts, row) - 1]
+
+    def get_coalesce_factors(self, rows: "numpy.ndarray") -> "numpy.ndarray":
+        """Get Coalesce values for an array of rows."""
+        import numpy as np
+
+        if not self.variableMatrixWidths:
+            raise ValueError("TileMatrix has not variableMatrixWidths")
+
+        rows = np.asarray(rows, dtype="int64")
+        if rows.size and rows.min() < 0:
+            raise ValueError(
+                f"Cannot find coalesce factor for Negative Row ({rows.min()})"
+            )
+
+        if rows.size and rows.max() > self.matrixHeight - 1:
+            raise ValueError(
+                f"Row {rows.max()} is greater than the TileMatrix height ({self.matrixHeight})"
+            )
 
-        return 1
+        starts, factors = self._coalesce_lookup
+        idx = np.searchsorted(np.asarray(starts, dtype="int64"), rows, side="right")
+        return np.asarray(factors, dtype="int64")[idx - 1]
 
 
 class TileMatrixSet(BaseModel, arbitrary_types_allowed=True, extra="ignore"):
@@ -504,6 +585,7 @@ class TileMatrixSet(BaseModel, arbitrary_types_allowed=True, extra="ignore"):
     # Private attributes
     _geographic_crs: pyproj.CRS = PrivateAttr()
     _tile_matrices_idx: dict[int, int] = PrivateAttr()
+    _frozen: bool = PrivateAttr(default=False)
 
     def __init__(self, **data):
         """Set private attributes."""
@@ -519,6 +601,7 @@ class TileMatrixSet(BaseModel, arbitrary_types_allowed=True, extra="ignore"):
             if DEFAULT_GEOGRAPHIC_CRS
             else self.crs._pyproj_crs.geodetic_crs
         )
+        _ = self._bound_transformers
 
     @model_validator(mode="before")
     def check_for_old_specification(cls, data):
@@ -547,6 +630,28 @@ class TileMatrixSet(BaseModel, arbitrary_types_allowed=True, extra="ignore"):
             for matrix in self.tileMatrices
         )
 
+    @property
+    def is_frozen(self) -> bool:
+        """Check if the TMS is a shared, read-only, instance (see `TileMatrixSets.get`)."""
+        return self._frozen
+
+    def __copy__(self) -> "TileMatrixSet":
+        """Shallow copy (copies are never frozen)."""
+        tms = super().__copy__()
+        tms._frozen = False
+        return tms
+
+    def __deepcopy__(self, memo: dict[int, Any] | None = None) -> "TileMatrixSet":
+        """Deep copy (copies are never frozen)."""
+        tms = super().__deepcopy__(memo)
+        tms._frozen = False
+        return tms
+
+    def __setstate__(self, state: dict[Any, Any]) -> None:
+        """Unpickle (unpickled TMS are never frozen)."""
+        super().__setstate__(state)
+        self._frozen = False
+
     def __iter__(self):
         """Iterate over matrices"""
         for matrix in self.tileMatrices:
@@ -563,18 +668,65 @@ class TileMatrixSet(BaseModel, arbitrary_types_allowed=True, extra="ignore"):
 
     def set_geographic_crs(self, crs: pyproj.CRS) -> None:
         """Overwrite Geographic CRS for the TMS."""
+        if self._frozen:
+            raise FrozenTileMatrixSetError(
+                "Cannot update a shared TileMatrixSet, use `with_geographic_crs` to get an updated copy."
+            )
+
         self._geographic_crs = crs
 
+        # Cached values might be shared with copies of the TMS
+        self.__dict__.pop("_bound_transformers", None)
+        self.__dict__.pop("_geographic_bboxes", None)
+        _ = self._bound_transformers
+
+    def with_geographic_crs(self, crs: pyproj.CRS) -> "TileMatrixSet":
+        """Return a copy of the TMS with a new Geographic CRS.
+
+        The copy is shallow: tile matrices and cached properties are shared
+        with the original TMS, which is left unchanged (even if frozen).
+
+        """
+        tms = self.model_copy()
+        tms.set_geographic_crs(crs)
+        return tms
+
+    @cached_property
+    def _bound_transformers(self) -> tuple[pyproj.CRS, pyproj.CRS, Any, Any]:
+        """TMS and Geographic CRS, with the closed-form transformers (no-op, axis swap or Web Mercator) to and from the Geographic CRS, if any.
+
+        Stored as a cached property (instead of private attributes) for fast access.
+
+        """
+        crs, geographic_crs = self.crs._pyproj_crs, self._geographic_crs
+        return (
+            crs,
+            geographic_crs,
+            closed_form_transformer(crs, geographic_crs),
+            closed_form_transformer(geographic_crs, crs),
+        )
+
     @property
     def _to_geographic(self) -> pyproj.Transformer:
-        return TransformerFromCRS(
-            self.crs._pyproj_crs, self.geographic_crs, always_xy=True
-        )
+        crs, geographic_crs, to_geographic, _ = self._bound_transformers
+        return to_geographic or transformer_from_crs(crs, geographic_crs)
 
     @property
     def _from_geographic(self) -> pyproj.Transformer:
-        return TransformerFromCRS(
-            self.geographic_crs, self.crs._pyproj_crs, always_xy=True
+        crs, geographic_crs, _, from_geographic = self._bound_transformers
+        return from_geographic or transformer_from_crs(geographic_crs, crs)
+
+    def _geographic_transformers(
+        self, geographic_crs: pyproj.CRS | None = None
+    ) -> tuple[pyproj.Transformer, pyproj.Transformer]:
+        """Return the transformers from and to a geographic CRS (default to the TMS's geographic CRS)."""
+        if geographic_crs is None:
+            return self._from_geographic, self._to_geographic
+
+        crs = self._bound_transformers[0]
+        return (
+            transformer_from_crs(geographic_crs, crs),
+            transformer_from_crs(crs, geographic_crs),
         )
 
     @property
@@ -811,11 +963,24 @@ class TileMatrixSet(BaseModel, arbitrary_types_allowed=True, extra="ignore"):
             **kwargs,
         )
 
+    @cached_property
+    def _extrapolated_matrices(self) -> dict[int, TileMatrix]:
+        """TileMatrix extrapolated from the TMS scale, by zoom (see `matrix`)."""
+        return {}
+
+    @cached_property
+    def _extrapolation_warnings(self) -> set[int]:
+        """Zoom levels for which an extrapolation warning was emitted."""
+        return set()
+
     def matrix(self, zoom: int) -> TileMatrix:
         """Return the TileMatrix for a specific zoom."""
         if (idx := self._tile_matrices_idx.get(zoom, None)) is not None:
             return self.tileMatrices[idx]
 
+        if (tile_matrix := self._extrapolated_matrices.get(zoom, None)) is not None:
+            return tile_matrix
+
         #######################################################################
         # If user wants a deeper matrix we calculate it
         #######################################################################
@@ -839,14 +1004,24 @@ class TileMatrixSet(BaseModel, arbitrary_types_allowed=True, extra="ignore"):
                 f"TileMatrix not found for level: {zoom} - Unable to construct tileMatrix for TMS with variable scale"
             )
 
-        warnings.warn(
-            f"TileMatrix not found for level: {zoom} - Creating values from TMS Scale.",
-            UserWarning,
-            stacklevel=1,
-        )
+        if zoom not in self._extrapolation_warnings:
+            self._extrapolation_warnings.add(zoom)
+            warnings.warn(
+                f"TileMatrix not found for level: {zoom} - Creating values from TMS Scale.",
+                UserWarning,
+                stacklevel=1,
+            )
 
         # TODO: what if we want to construct a matrix for a level up ?
         tile_matrix = self.tileMatrices[-1]
+
+        # Start from the deepest extrapolated matrix above the requested zoom
+        last_zoom = int(tile_matrix.id)
+        if previous_zooms := [
+            z for z in self._extrapolated_matrices if last_zoom < z < zoom
+        ]:
+            tile_matrix = self._extrapolated_matrices[max(previous_zooms)]
+
         factor = 1 / matrix_scale[0]
         while not str(zoom) == tile_matrix.id:
             tile_matrix = TileMatrix(
@@ -861,6 +1036,13 @@ class TileMatrixSet(BaseModel, arbitrary_types_allowed=True, extra="ignore"):
                 matrixHeight=int(tile_matrix.matrixHeight * factor),
             )
 
+        if len(self._extrapolated_matrices) >= EXTRAPOLATED_MATRICES_CACHE_SIZE:
+            # Copy the keys (atomic) in case the cache is updated from another thread
+            oldest = list(self._extrapolated_matrices)[0]
+            self._extrapolated_matrices.pop(oldest, None)
+
+        self._extrapolated_matrices[zoom] = tile_matrix
+
         return tile_matrix
 
     def _matrix_origin(self, matrix: TileMatrix) -> Coords:
@@ -1071,21 +1253,10 @@ class TileMatrixSet(BaseModel, arbitrary_types_allowed=True, extra="ignore"):
         Tile
 
         """
-        geographic_crs = geographic_crs or self.geographic_crs or WGS84_CRS
-        _from_geographic = TransformerFromCRS(
-            geographic_crs, self.crs._pyproj_crs, always_xy=True
-        )
-        _to_geographic = TransformerFromCRS(
-            self.crs._pyproj_crs, geographic_crs, always_xy=True
-        )
+        _from_geographic, _ = self._geographic_transformers(geographic_crs)
 
         if truncate:
-            left, bottom, right, top = self.xy_bbox
-            bbox = BoundingBox(
-                *_to_geographic.transform_bounds(
-                    left, bottom, right, top, densify_pts=21
-                ),
-            )
+            bbox = self._geographic_bbox(geographic_crs)
             lng, lat = truncate_coordinates(lng, lat, bbox)
 
         x, y = _from_geographic.transform(lng, lat)
@@ -1098,6 +1269,135 @@ class TileMatrixSet(BaseModel, arbitrary_types_allowed=True, extra="ignore"):
 
         return self._tile(x, y, zoom, ignore_coalescence=ignore_coalescence)
 
+    def _tile_many(
+        self,
+        xcoord: "numpy.typing.ArrayLike",
+        ycoord: "numpy.typing.ArrayLike",
+        zoom: int,
+        ignore_coalescence: bool = True,
+    ) -> "numpy.ndarray":
+        """
+        Get the tiles containing many Points (in TMS CRS).
+
+        Vectorized version of `_tile`.
+
+        Parameters
+        ----------
+        xcoord, ycoord : array_like
+            `X` and `Y` coordinates in TMS coordinate reference system.
+        zoom : int
+            The zoom level.
+        ignore_coalescence : bool
+            Whether or not to ignore coalescence factor for TMS with variable matrix width.
+
+        Returns
+        -------
+        numpy.ndarray: (N, 3) int64 array of X, Y, Z tile indices.
+
+        """
+        import numpy as np
+
+        xcoord, ycoord = np.broadcast_arrays(
+            np.asarray(xcoord, dtype="float64"), np.asarray(ycoord, dtype="float64")
+        )
+        xcoord = xcoord.ravel()
+        ycoord = ycoord.ravel()
+        if np.isnan(xcoord).any() or np.isnan(ycoord).any():
+            raise ValueError("All coordinates must be finite")
+
+        matrix = self.matrix(zoom)
+        origin_x, origin_y = self._matrix_origin(matrix)
+
+        xtile = np.floor(
+            (xcoord - origin_x) / float(matrix.cellSize * matrix.tileWidth)
+        )
+        xtile[np.isinf(xcoord)] = 0
+
+        coord = (
+            (origin_y - ycoord)
+            if matrix.cornerOfOrigin == "topLeft"
+            else (ycoord - origin_y)
+        )
+        ytile = np.floor(coord / float(matrix.cellSize * matrix.tileHeight))
+        ytile[np.isinf(ycoord)] = 0
+
+        # avoid out-of-range tiles
+        tiles = np.empty((xcoord.size, 3), dtype="int64")
+        tiles[:, 0] = np.clip(xtile, 0, matrix.matrixWidth - 1)
+        tiles[:, 1] = np.clip(ytile, 0, matrix.matrixHeight - 1)
+        tiles[:, 2] = zoom
+
+        if not ignore_coalescence and matrix.variableMatrixWidths is not None:
+            cf = matrix.get_coalesce_factors(tiles[:, 1])
+            tiles[:, 0] -= tiles[:, 0] % cf
+
+        return tiles
+
+    def tile_many(
+        self,
+        lng: "numpy.typing.ArrayLike",
+        lat: "numpy.typing.ArrayLike",
+        zoom: int,
+        truncate=False,
+        ignore_coalescence: bool = False,
+        geographic_crs: pyproj.CRS | None = None,
+    ) -> "numpy.ndarray":
+        """
+        Get the tiles for many geographic longitude and latitude pairs.
+
+        Vectorized version of `tile`, all the points are transformed using a single call.
+
+        Parameters
+        ----------
+        lng, lat : array_like
+            Longitude and latitude arrays in geographic coordinate reference system.
+        zoom : int
+            The zoom level.
+        truncate : bool
+            Whether or not to truncate inputs to limits of TMS geographic bounds.
+        ignore_coalescence : bool
+            Whether or not to ignore coalescence factor for TMS with variable matrix width.
+        geographic_crs: pyproj.CRS, optional
+            Geographic CRS of the given coordinates. Default to TMS's Geographic CRS.
+
+        Returns
+        -------
+        numpy.ndarray: (N, 3) int64 array of X, Y, Z tile indices.
+
+        """
+        import numpy as np
+
+        _from_geographic, _ = self._geographic_transformers(geographic_crs)
+
+        lngs, lats = np.broadcast_arrays(
+            np.asarray(lng, dtype="float64"), np.asarray(lat, dtype="float64")
+        )
+        if truncate:
+            bbox = self._geographic_bbox(geographic_crs)
+            # Same comparisons as `truncate_coordinates` (the bbox can cross the antimeridian)
+            lngs = np.where(
+                lngs > bbox.right,
+                bbox.right,
+                np.where(lngs < bbox.left, bbox.left, lngs),
+            )
+            lats = np.where(
+                lats > bbox.top,
+                bbox.top,
+                np.where(lats < bbox.bottom, bbox.bottom, lats),
+            )
+
+        x, y = _from_geographic.transform(lngs.ravel(), lats.ravel())
+
+        inside = points_in_bbox(x, y, self.xy_bbox)
+        if not inside.all():
+            warnings.warn(
+                f"{np.count_nonzero(~inside)} points are outside TMS bounds.",
+                PointOutsideTMSBounds,
+                stacklevel=1,
+            )
+
+        return self._tile_many(x, y, zoom, ignore_coalescence=ignore_coalescence)
+
     def _ul(self, *tile: Tile) -> Coords:
         """
         Return the upper left coordinate of the tile in TMS coordinate reference system.
@@ -1205,6 +1505,57 @@ class TileMatrixSet(BaseModel, arbitrary_types_allowed=True, extra="ignore"):
 
         return BoundingBox(left, bottom, right, top)
 
+    def xy_bounds_many(self, x, y=None, z=None) -> "numpy.ndarray":
+        """
+        Return the bounding boxes of many tiles in TMS coordinate reference system.
+
+        Vectorized version of `xy_bounds`, results are identical to the scalar method.
+
+        Attributes
+        ----------
+        x, y, z: X, Y and Z tile indices arrays, or a (N, 3) array of X, Y, Z tile indices.
+
+        Returns
+        -------
+        numpy.ndarray: (N, 4) array of left, bottom, right, top coordinates.
+
+        """
+        import numpy as np
+
+        xs, ys, zs = _parse_tile_arrays(x, y, z)
+
+        bounds = np.empty((xs.size, 4), dtype="float64")
+        for zoom in np.unique(zs):
+            idx = np.flatnonzero(zs == zoom)
+            tx, ty = xs[idx], ys[idx]
+
+            matrix = self.matrix(int(zoom))
+            origin_x, origin_y = self._matrix_origin(matrix)
+
+            cf = (
+                matrix.get_coalesce_factors(ty)
+                if matrix.variableMatrixWidths is not None
+                else 1
+            )
+
+            col = np.floor(tx / cf)
+            bounds[idx, 0] = origin_x + col * matrix.cellSize * cf * matrix.tileWidth
+            bounds[idx, 2] = (
+                origin_x + (col + 1) * matrix.cellSize * cf * matrix.tileWidth
+            )
+            if matrix.cornerOfOrigin == "topLeft":
+                bounds[idx, 3] = origin_y - ty * matrix.cellSize * matrix.tileHeight
+                bounds[idx, 1] = (
+                    origin_y - (ty + 1) * matrix.cellSize * matrix.tileHeight
+                )
+            else:
+                bounds[idx, 1] = origin_y + ty * matrix.cellSize * matrix.tileHeight
+                bounds[idx, 3] = (
+                    origin_y + (ty + 1) * matrix.cellSize * matrix.tileHeight
+                )
+
+        return bounds
+
     def ul(self, *tile: Tile) -> Coords:
         """
         Return the upper left coordinates of the tile in geographic coordinate reference system.
@@ -1260,6 +1611,49 @@ class TileMatrixSet(BaseModel, arbitrary_types_allowed=True, extra="ignore"):
 
         return BoundingBox(left, bottom, right, top)
 
+    def bounds_many(self, x, y=None, z=None) -> "numpy.ndarray":
+        """
+        Return the bounding boxes of many tiles in geographic coordinate reference system.
+
+        Vectorized version of `bounds`, the corners of all the tiles are
+        transformed using a single call to the geographic transformer.
+
+        Attributes
+        ----------
+        x, y, z: X, Y and Z tile indices arrays, or a (N, 3) array of X, Y, Z tile indices.
+
+        Returns
+        -------
+        numpy.ndarray: (N, 4) array of left, bottom, right, top coordinates.
+
+        """
+        import numpy as np
+
+        xy_bounds = self.xy_bounds_many(x, y, z)
+        n = xy_bounds.shape[0]
+
+        # upper-left and lower-right corners
+        xs = np.concatenate([xy_bounds[:, 0], xy_bounds[:, 2]])
+        ys = np.concatenate([xy_bounds[:, 3], xy_bounds[:, 1]])
+
+        inside = points_in_bbox(xs, ys, self.xy_bbox)
+        if not inside.all():
+            warnings.warn(
+                f"{np.count_nonzero(~inside)} points are outside TMS bounds {list(self.xy_bbox)}.",
+                PointOutsideTMSBounds,
+                stacklevel=1,
+            )
+
+        lng, lat = self._to_geographic.transform(xs, ys)
+
+        bounds = np.empty((n, 4), dtype="float64")
+        bounds[:, 0] = lng[:n]
+        bounds[:, 1] = lat[n:]
+        bounds[:, 2] = lng[n:]
+        bounds[:, 3] = lat[:n]
+
+        return bounds
+
     @cached_property
     def xy_bbox(self):
         """Return TMS bounding box in TileMatrixSet's CRS."""
@@ -1275,18 +1669,62 @@ class TileMatrixSet(BaseModel, arbitrary_types_allowed=True, extra="ignore"):
     @property
     def bbox(self):
         """Return TMS bounding box in geographic coordinate reference system."""
-        left, bottom, right, top = self.xy_bbox
-        return BoundingBox(
-            *self._to_geographic.transform_bounds(
-                left,
-                bottom,
-                right,
-                top,
-                densify_pts=21,
+        return self._geographic_bbox()
+
+    @cached_property
+    def _geographic_bboxes(self) -> dict[str | None, BoundingBox]:
+        """TMS bounding boxes by geographic CRS (`None` for the TMS's geographic CRS)."""
+        return {}
+
+    def _geographic_bbox(self, geographic_crs: pyproj.CRS | None = None) -> BoundingBox:
+        """Return TMS bounding box in a geographic CRS (default to TMS's geographic CRS)."""
+        key = geographic_crs.srs if geographic_crs is not None else None
+        if (bbox := self._geographic_bboxes.get(key)) is None:
+            _, _to_geographic = self._geographic_transformers(geographic_crs)
+            left, bottom, right, top = self.xy_bbox
+            bbox = BoundingBox(
+                *_to_geographic.transform_bounds(
+                    left,
+                    bottom,
+                    right,
+                    top,
+                    densify_pts=21,
+                )
             )
-        )
+            self._geographic_bboxes[key] = bbox
+
+        return bbox
 
-    def tiles(  # noqa: C901
+    @overload
+    def tiles(
+        self,
+        west: float,
+        south: float,
+        east: float,
+        north: float,
+        zooms: Sequence[int],
+        truncate: bool = ...,
+        geographic_crs: pyproj.CRS | None = ...,
+        order: Literal["row", "morton", "hilbert"] = ...,
+        as_keys: Literal[False] = ...,
+    ) -> Iterator[Tile]: ...
+
+    @overload
+    def tiles(
+        self,
+        west: float,
+        south: float,
+        east: float,
+        north: float,
+        zooms: Sequence[int],
+        truncate: bool = ...,
+        geographic_crs: pyproj.CRS | None = ...,
+        order: Literal["row", "morton", "hilbert"] = ...,
+        *,
+        as_keys: Literal[True],
+    ) -> "numpy.ndarray": ...
+
+    def tiles(
         self,
         west: float,
         south: float,
@@ -1295,7 +1733,9 @@ class TileMatrixSet(BaseModel, arbitrary_types_allowed=True, extra="ignore"):
         zooms: Sequence[int],
         truncate: bool = False,
         geographic_crs: pyproj.CRS | None = None,
-    ) -> Iterator[Tile]:
+        order: Literal["row", "morton", "hilbert"] = "row",
+        as_keys: bool = False,
+    ) -> "Iterator[Tile] | numpy.ndarray":
         """
         Get the tiles overlapped by a geographic bounding box
 
@@ -1311,10 +1751,19 @@ class TileMatrixSet(BaseModel, arbitrary_types_allowed=True, extra="ignore"):
             Whether or not to truncate inputs to TMS limits.
         geographic_crs: pyproj.CRS, optional
             Geographic CRS of the given coordinates. Default to TMS's Geographic CRS
+        order: str, optional
+            Order of the tiles within each zoom level: `row` (row-major, default),
+            `morton` (Morton/Z-order, i.e quadkey order) or `hilbert` (Hilbert
+            curve, i.e `hilbert_ids` order). `morton` and `hilbert` orders are
+            only supported by quadtree TMS.
+        as_keys: bool, optional
+            Return the tiles as a uint64 array of packed keys (see `pack_tiles`,
+            requires numpy) instead of yielding each tile. The parts of a bounding
+            box crossing the antimeridian are merged (see `tile_ranges`).
 
         Yields
         ------
-        Tile
+        Tile (or returns a numpy.ndarray of uint64 keys when `as_keys=True`)
 
         Notes
         -----
@@ -1322,70 +1771,532 @@ class TileMatrixSet(BaseModel, arbitrary_types_allowed=True, extra="ignore"):
         function yields exactly one tile when given the bounds of that same tile.
 
         """
-        if any(math.isnan(coord) for coord in (west, south, east, north)):
-            raise ValueError("All coordinates must be finite")
+        if order not in ("row", "morton", "hilbert"):
+            raise ValueError(f"Invalid tiles order: {order}")
 
-        if isinstance(zooms, int):
-            zooms = (zooms,)
+        if order != "row" and not self.is_quadtree:
+            raise NoQuadkeySupport(
+                "This Tile Matrix Set doesn't support 2 x 2 quadkeys."
+            )
 
-        geographic_crs = geographic_crs or self.geographic_crs or WGS84_CRS
-        _from_geographic = TransformerFromCRS(
-            geographic_crs, self.crs._pyproj_crs, always_xy=True
-        )
-        _to_geographic = TransformerFromCRS(
-            self.crs._pyproj_crs, geographic_crs, always_xy=True
-        )
+        if as_keys:
+            return self._tiles_keys(
+                self.tile_ranges(
+                    west, south, east, north, zooms, truncate, geographic_crs
+                ),
+                order,
+            )
 
-        # TMS bbox
-        left, bottom, right, top = self.xy_bbox
-        bbox = BoundingBox(
-            *_to_geographic.transform_bounds(left, bottom, right, top, densify_pts=21),
+        return self._tiles(
+            self._tiles_rects(
+                west, south, east, north, zooms, truncate, geographic_crs
+            ),
+            order,
         )
 
-        if truncate:
-            west, south = truncate_coordinates(west, south, bbox)
-            east, north = truncate_coordinates(east, north, bbox)
-
-        if west > east:
-            bbox_west = (bbox.left, south, east, north)
-            bbox_east = (west, south, bbox.right, north)
-            bboxes = [bbox_west, bbox_east]
-        else:
-            bboxes = [(west, south, east, north)]
-
-        for w, s, e, n in bboxes:
-            # Clamp bounding values.
-            es_contain_180th = lons_contain_antimeridian(e, bbox.right)
-            w = max(bbox.left, w)
-            s = max(bbox.bottom, s)
-            e = max(bbox.right, e) if es_contain_180th else min(bbox.right, e)
-            n = min(bbox.top, n)
+    def _tiles(
+        self, rects: Iterable[tuple[int, int, int, int, int]], order: str
+    ) -> Iterator[Tile]:
+        """Yield the tiles within (zoom, minx, miny, maxx, maxy) rectangles."""
+        if order != "row":
+            yield from self._curve_tiles(rects, order)
+            return
+
+        for z, minx, miny, maxx, maxy in rects:
+            matrix = self.matrix(z)
+            for j in range(miny, maxy + 1):
+                cf = (
+                    matrix.get_coalesce_factor(j)
+                    if matrix.variableMatrixWidths is not None
+                    else 1
+                )
+                for i in range(minx, maxx + 1):
+                    if cf != 1 and i % cf:
+                        continue
+
+                    yield Tile(i, j, z)
+
+    def _tiles_keys(self, ranges: list[TileRange], order: str) -> "numpy.ndarray":
+        """Get the packed keys of the tiles of TileRanges, in row-major, morton or hilbert order."""
+        import numpy as np
+
+        from morecantile.curves import hilbert_indices, morton_indices
+        from morecantile.keys import unpack_keys
+
+        keys = []
+        for r in ranges:
+            self._check_keys_matrix(self.matrix(r.z))
+            zoom_keys = r.to_keys()
+            if order != "row":
+                x, y, _ = unpack_keys(zoom_keys).T
+                if order == "morton":
+                    indices = morton_indices(x, y)
+                else:
+                    bits = self.matrix(r.z).matrixWidth.bit_length() - 1
+                    indices = hilbert_indices(x, y, bits)
+                zoom_keys = zoom_keys[np.argsort(indices, kind="stable")]
+            keys.append(zoom_keys)
+
+        if not keys:
+            return np.empty(0, dtype="uint64")
+
+        return np.concatenate(keys)
+
+    def tile_ranges(
+        self,
+        west: float,
+        south: float,
+        east: float,
+        north: float,
+        zooms: Sequence[int],
+        truncate: bool = False,
+        geographic_crs: pyproj.CRS | None = None,
+    ) -> list[TileRange]:
+        """
+        Get the tiles overlapped by a geographic bounding box as TileRange
 
-            w, n = _from_geographic.transform(w + LL_EPSILON, n - LL_EPSILON)
-            e, s = _from_geographic.transform(e - LL_EPSILON, s + LL_EPSILON)
-            for z in zooms:
-                nw_tile = self._tile(w, n, z, ignore_coalescence=True)
-                se_tile = self._tile(e, s, z, ignore_coalescence=True)
-                minx = min(nw_tile.x, se_tile.x)
-                maxx = max(nw_tile.x, se_tile.x)
-                miny = min(nw_tile.y, se_tile.y)
-                maxy = max(nw_tile.y, se_tile.y)
-
-                matrix = self.matrix(z)
-                for j in range(miny, maxy + 1):
-                    cf = (
-                        matrix.get_coalesce_factor(j)
-                        if matrix.variableMatrixWidths is not None
-                        else 1
-                    )
-                    for i in range(minx, maxx + 1):
-                        if cf != 1 and i % cf:
-                            continue
-
-                        yield Tile(i, j, z)
+        Same as `tiles` but, instead of yielding each tile, returns one lazy
+        `TileRange` (row spans) per zoom level, supporting `len()`, `in`,
+        iteration, indexing/slicing and `to_numpy()`. Parts of a bounding box
+        crossing the antimeridian are merged into the same TileRange.
 
-    def feature(
-        self,
+        Parameters
+        ----------
+        west, south, east, north : sequence of float
+            Bounding values in decimal degrees (geographic CRS).
+        zooms : int or sequence of int
+            One or more zoom levels.
+        truncate : bool, optional
+            Whether or not to truncate inputs to TMS limits.
+        geographic_crs: pyproj.CRS, optional
+            Geographic CRS of the given coordinates. Default to TMS's Geographic CRS
+
+        Returns
+        -------
+        list of TileRange (one per zoom level)
+
+        """
+        rects: dict[int, list[tuple[int, int, int, int]]] = {}
+        for z, minx, miny, maxx, maxy in self._tiles_rects(
+            west, south, east, north, zooms, truncate, geographic_crs
+        ):
+            rects.setdefault(z, []).append((minx, miny, maxx, maxy))
+
+        ranges = []
+        for z, zoom_rects in rects.items():
+            matrix = self.matrix(z)
+            ranges.append(
+                TileRange(
+                    z,
+                    zoom_rects,
+                    coalesce=matrix._coalesce_lookup
+                    if matrix.variableMatrixWidths is not None
+                    else None,
+                )
+            )
+
+        return ranges
+
+    def count_tiles(
+        self,
+        west: float,
+        south: float,
+        east: float,
+        north: float,
+        zooms: Sequence[int],
+        truncate: bool = False,
+        geographic_crs: pyproj.CRS | None = None,
+    ) -> dict[int, int]:
+        """
+        Count the tiles overlapped by a geographic bounding box
+
+        Counts are derived from the min/max tile indices (and the coalesce
+        factors intervals for TMS with variable matrix width) of each zoom
+        level, without iterating over the tiles.
+
+        Parameters
+        ----------
+        west, south, east, north : sequence of float
+            Bounding values in decimal degrees (geographic CRS).
+        zooms : int or sequence of int
+            One or more zoom levels.
+        truncate : bool, optional
+            Whether or not to truncate inputs to TMS limits.
+        geographic_crs: pyproj.CRS, optional
+            Geographic CRS of the given coordinates. Default to TMS's Geographic CRS
+
+        Returns
+        -------
+        dict: number of (distinct) tiles for each zoom level.
+
+        """
+        return {
+            r.z: len(r)
+            for r in self.tile_ranges(
+                west,
+                south,
+                east,
+                north,
+                zooms,
+                truncate=truncate,
+                geographic_crs=geographic_crs,
+            )
+        }
+
+    def geometry_tiles(
+        self,
+        geometry: Any,
+        zooms: Sequence[int],
+        geographic_crs: pyproj.CRS | None = None,
+    ) -> list[TileRange]:
+        """
+        Get the tiles intersecting a Polygon or MultiPolygon geometry (requires numpy)
+
+        Contrary to `tiles`, which uses the bounding box of the geometry, only
+        the tiles intersecting the geometry are returned (tiles only touching
+        the geometry on their edges are excluded).
+
+        Parameters
+        ----------
+        geometry : dict or object
+            GeoJSON-like Polygon, MultiPolygon, GeometryCollection, Feature or
+            FeatureCollection (or object with a `__geo_interface__`), in geographic CRS.
+        zooms : int or sequence of int
+            One or more zoom levels.
+        geographic_crs: pyproj.CRS, optional
+            Geographic CRS of the given coordinates. Default to TMS's Geographic CRS
+
+        Returns
+        -------
+        list of TileRange (one per zoom level)
+
+        Notes
+        -----
+        The geometry is clipped to the TMS geographic bounding box, and its
+        edges are densified when transformed to the TMS CRS so that the
+        projected edges are within 1/1000 of a tile of the (curved) projected
+        geometry at the deepest zoom level.
+
+        """
+        from morecantile.cover import _polygon_arrays, polygon_spans
+
+        lng, lat, rings, polygons = _polygon_arrays(
+            geometry, self._geographic_bbox(geographic_crs)
+        )
+        return self._cover(
+            lng,
+            lat,
+            rings,
+            zooms,
+            lambda u, v, rings, height: polygon_spans(u, v, rings, polygons, height),
+            geographic_crs=geographic_crs,
+        )
+
+    def line_tiles(
+        self,
+        lines: Any,
+        zooms: Sequence[int],
+        geographic_crs: pyproj.CRS | None = None,
+    ) -> list[TileRange]:
+        """
+        Get the tiles touched by lines (supercover, requires numpy)
+
+        Each segment of the lines is walked through the tile grid of each
+        zoom level, and the tiles touched by many segments or lines are
+        only returned once. Tiles only touched by a line on their edges or
+        corners are included.
+
+        Parameters
+        ----------
+        lines : dict, object or sequence
+            GeoJSON-like LineString, MultiLineString, GeometryCollection, Feature
+            or FeatureCollection (or object with a `__geo_interface__`), or a sequence
+            of them or of line coordinates ([[lng, lat], ...]), in geographic CRS.
+        zooms : int or sequence of int
+            One or more zoom levels.
+        geographic_crs: pyproj.CRS, optional
+            Geographic CRS of the given coordinates. Default to TMS's Geographic CRS
+
+        Returns
+        -------
+        list of TileRange (one per zoom level)
+
+        Notes
+        -----
+        The lines are clipped to the TMS geographic bounding box, and their
+        segments are densified when transformed to the TMS CRS (see
+        `geometry_tiles`).
+
+        """
+        from morecantile.cover import _line_arrays, line_spans
+
+        lng, lat, segments = _line_arrays(lines, self._geographic_bbox(geographic_crs))
+        return self._cover(
+            lng, lat, segments, zooms, line_spans, geographic_crs=geographic_crs
+        )
+
+    def pyramid_tiles(
+        self,
+        geometry: Any,
+        minzoom: int,
+        maxzoom: int,
+        geographic_crs: pyproj.CRS | None = None,
+    ) -> Iterator[tuple[Tile, bool]]:
+        """
+        Get the tiles intersecting a Polygon or MultiPolygon geometry from minzoom to maxzoom (requires numpy)
+
+        The tiles are refined from coarse to fine zoom levels, using quadtree
+        children: only the children of the tiles crossed by the geometry
+        boundary are visited, tiles outside the geometry are pruned, and the
+        tiles fully inside the geometry are yielded once (with `full=True`),
+        without any of their descendants.
+
+        Parameters
+        ----------
+        geometry : dict or object
+            GeoJSON-like Polygon, MultiPolygon, GeometryCollection, Feature or
+            FeatureCollection (or object with a `__geo_interface__`), in geographic CRS.
+        minzoom : int
+            First zoom level.
+        maxzoom : int
+            Last zoom level.
+        geographic_crs: pyproj.CRS, optional
+            Geographic CRS of the given coordinates. Default to TMS's Geographic CRS
+
+        Yields
+        ------
+        tuple of (Tile, bool)
+            Tile and whether the tile (and thus all its descendants) is fully
+            inside the geometry. Tiles are yielded by zoom level.
+
+        Notes
+        -----
+        The descendants of a `full` tile (x, y, z) at zoom level `zoom` are
+        the tiles of `TileRange(zoom, [(x << d, y << d, ((x + 1) << d) - 1, ((y + 1) << d) - 1)])`
+        with `d = zoom - z`.
+
+        """
+        import numpy as np
+
+        from morecantile.cover import (
+            _boundary_spans,
+            _edges,
+            _interior_spans,
+            _polygon_arrays,
+            in_spans,
+            merge_spans,
+        )
+
+        if not self.is_quadtree:
+            raise NoQuadkeySupport(
+                "This Tile Matrix Set doesn't support 2 x 2 quadkeys."
+            )
+
+        if minzoom > maxzoom:
+            raise InvalidZoomError("minzoom must be less than or equal to maxzoom")
+
+        lng, lat, rings, polygons = _polygon_arrays(
+            geometry, self._geographic_bbox(geographic_crs)
+        )
+        matrices = [self.matrix(z) for z in range(minzoom, maxzoom + 1)]
+        x, y, rings = self._densify(lng, lat, rings, matrices, geographic_crs)
+
+        partial = None
+        for matrix in matrices:
+            u, v = self._matrix_coords(matrix, x, y)
+            u0, v0, u1, v1, edge_rings = _edges(u, v, rings)
+            boundary = merge_spans(
+                *_boundary_spans(u0, v0, u1, v1, matrix.matrixHeight),
+                matrix.matrixWidth,
+            )
+            interior = merge_spans(
+                *_interior_spans(
+                    u0, v0, u1, v1, polygons[edge_rings], matrix.matrixHeight
+                ),
+                matrix.matrixWidth,
+            )
+
+            if partial is None:
+                cover = self._spans_range(
+                    matrix, *(np.concatenate(s) for s in zip(boundary, interior))
+                ).to_numpy()
+                cols, rows = cover[:, 0], cover[:, 1]
+            else:
+                # children: top-left, top-right, bottom-right, bottom-left
+                cols = ((partial[0] * 2)[:, None] + [0, 1, 1, 0]).ravel()
+                rows = ((partial[1] * 2)[:, None] + [0, 0, 1, 1]).ravel()
+
+            is_partial = in_spans(rows, cols, boundary, matrix.matrixWidth)
+            is_full = ~is_partial & in_spans(rows, cols, interior, matrix.matrixWidth)
+            keep = is_partial | is_full
+
+            z = int(matrix.id)
+            for col, row, full in zip(
+                cols[keep].tolist(), rows[keep].tolist(), is_full[keep].tolist()
+            ):
+                yield Tile(col, row, z), full
+
+            partial = (cols[is_partial], rows[is_partial])
+            if not len(partial[0]):
+                break
+
+    def _cover(
+        self,
+        lng: "numpy.ndarray",
+        lat: "numpy.ndarray",
+        ids: "numpy.ndarray",
+        zooms: Sequence[int],
+        spans: Callable[..., tuple["numpy.ndarray", "numpy.ndarray", "numpy.ndarray"]],
+        geographic_crs: pyproj.CRS | None = None,
+    ) -> list[TileRange]:
+        """Densify and transform lines/rings coordinates to the TMS CRS and get the TileRange of their spans for each zoom."""
+        if isinstance(zooms, int):
+            zooms = (zooms,)
+
+        matrices = [self.matrix(z) for z in zooms]
+        x, y, ids = self._densify(lng, lat, ids, matrices, geographic_crs)
+
+        ranges = []
+        for matrix in matrices:
+            u, v = self._matrix_coords(matrix, x, y)
+            ranges.append(
+                self._spans_range(matrix, *spans(u, v, ids, matrix.matrixHeight))
+            )
+
+        return ranges
+
+    def _densify(
+        self,
+        lng: "numpy.ndarray",
+        lat: "numpy.ndarray",
+        ids: "numpy.ndarray",
+        matrices: Sequence[TileMatrix],
+        geographic_crs: pyproj.CRS | None = None,
+    ) -> tuple["numpy.ndarray", "numpy.ndarray", "numpy.ndarray"]:
+        """Densify and transform lines/rings coordinates to the TMS CRS, for the deepest of the matrices."""
+        from morecantile.cover import DENSIFY_TOLERANCE, _densify
+
+        _from_geographic, _ = self._geographic_transformers(geographic_crs)
+        tolerance = DENSIFY_TOLERANCE * min(
+            m.cellSize * min(m.tileWidth, m.tileHeight) for m in matrices
+        )
+        return _densify(lng, lat, ids, _from_geographic.transform, tolerance)
+
+    def _matrix_coords(
+        self,
+        matrix: TileMatrix,
+        x: "numpy.ndarray",
+        y: "numpy.ndarray",
+    ) -> tuple["numpy.ndarray", "numpy.ndarray"]:
+        """Get the (continuous) column and row coordinates of TMS CRS coordinates."""
+        origin_x, origin_y = self._matrix_origin(matrix)
+        u = (x - origin_x) / (matrix.cellSize * matrix.tileWidth)
+        v = (
+            (origin_y - y) if matrix.cornerOfOrigin == "topLeft" else (y - origin_y)
+        ) / (matrix.cellSize * matrix.tileHeight)
+        return u, v
+
+    def _spans_range(
+        self,
+        matrix: TileMatrix,
+        rows: "numpy.ndarray",
+        starts: "numpy.ndarray",
+        ends: "numpy.ndarray",
+    ) -> TileRange:
+        """Create a TileRange from (row, first column, last column) spans."""
+        from morecantile.cover import merge_spans
+
+        coalesce = None
+        if matrix.variableMatrixWidths is not None and len(rows):
+            # A coalesced tile (first column multiple of the coalesce factor)
+            # covers the columns up to the next coalesced tile
+            cf = matrix.get_coalesce_factors(rows)
+            starts = starts - starts % cf
+            coalesce = matrix._coalesce_lookup
+
+        rows, starts, ends = merge_spans(rows, starts, ends, matrix.matrixWidth)
+        return TileRange.from_row_spans(
+            int(matrix.id),
+            (
+                (row, ((start, end),))
+                for row, start, end in zip(
+                    rows.tolist(), starts.tolist(), ends.tolist()
+                )
+            ),
+            coalesce=coalesce,
+        )
+
+    def _curve_tiles(
+        self, rects: Iterable[tuple[int, int, int, int, int]], curve: str
+    ) -> Iterator[Tile]:
+        """Yield the tiles within (zoom, minx, miny, maxx, maxy) rectangles in the curve (morton or hilbert) order, by zoom level."""
+        from morecantile.curves import _curve_tiles
+
+        zoom_rects: dict[int, list[tuple[int, int, int, int]]] = {}
+        for z, *rect in rects:
+            zoom_rects.setdefault(z, []).append(tuple(rect))  # type: ignore
+
+        for z, zrects in zoom_rects.items():
+            bits = self.matrix(z).matrixWidth.bit_length() - 1
+            for x, y in _curve_tiles(zrects, bits, curve):
+                yield Tile(x, y, z)
+
+    def _tiles_rects(
+        self,
+        west: float,
+        south: float,
+        east: float,
+        north: float,
+        zooms: Sequence[int],
+        truncate: bool = False,
+        geographic_crs: pyproj.CRS | None = None,
+    ) -> Iterator[tuple[int, int, int, int, int]]:
+        """Get the (zoom, minx, miny, maxx, maxy) tile indices overlapped by a geographic bounding box."""
+        if any(math.isnan(coord) for coord in (west, south, east, north)):
+            raise ValueError("All coordinates must be finite")
+
+        if isinstance(zooms, int):
+            zooms = (zooms,)
+
+        _from_geographic, _ = self._geographic_transformers(geographic_crs)
+
+        # TMS bbox
+        bbox = self._geographic_bbox(geographic_crs)
+
+        if truncate:
+            west, south = truncate_coordinates(west, south, bbox)
+            east, north = truncate_coordinates(east, north, bbox)
+
+        if west > east:
+            bbox_west = (bbox.left, south, east, north)
+            bbox_east = (west, south, bbox.right, north)
+            bboxes = [bbox_west, bbox_east]
+        else:
+            bboxes = [(west, south, east, north)]
+
+        for w, s, e, n in bboxes:
+            # Clamp bounding values.
+            es_contain_180th = lons_contain_antimeridian(e, bbox.right)
+            w = max(bbox.left, w)
+            s = max(bbox.bottom, s)
+            e = max(bbox.right, e) if es_contain_180th else min(bbox.right, e)
+            n = min(bbox.top, n)
+
+            w, n = _from_geographic.transform(w + LL_EPSILON, n - LL_EPSILON)
+            e, s = _from_geographic.transform(e - LL_EPSILON, s + LL_EPSILON)
+            for z in zooms:
+                nw_tile = self._tile(w, n, z, ignore_coalescence=True)
+                se_tile = self._tile(e, s, z, ignore_coalescence=True)
+                yield (
+                    z,
+                    min(nw_tile.x, se_tile.x),
+                    min(nw_tile.y, se_tile.y),
+                    max(nw_tile.x, se_tile.x),
+                    max(nw_tile.y, se_tile.y),
+                )
+
+    def feature(
+        self,
         tile: Tile,
         fid: str | None = None,
         props: dict | None = None,
@@ -1423,49 +2334,96 @@ class TileMatrixSet(BaseModel, arbitrary_types_allowed=True, extra="ignore"):
         dict
 
         """
-        geographic_crs = geographic_crs or WGS84_CRS
+        feat = self._feature_factory(
+            buffer=buffer,
+            precision=precision,
+            projected=projected,
+            geographic_crs=geographic_crs,
+        )(tile)
 
-        feature_crs = self.crs._pyproj_crs
-        west, south, east, north = self.xy_bounds(tile)
+        if props:
+            feat["properties"].update(props)
 
-        if not projected:
-            feature_crs = geographic_crs
-            tr = pyproj.Transformer.from_crs(
-                self.crs._pyproj_crs, geographic_crs, always_xy=True
-            )
+        if fid is not None:
+            feat["id"] = fid
 
-            west, south, east, north = tr.transform_bounds(
-                west, south, east, north, densify_pts=21
-            )
+        return feat
 
-        if buffer:
-            west -= buffer
-            south -= buffer
-            east += buffer
-            north += buffer
+    def features(
+        self,
+        tiles: Iterable[Tile],
+        props: dict | None = None,
+        buffer: NumType | None = None,
+        precision: int | None = None,
+        projected: bool = False,
+        geographic_crs: pyproj.CRS | None = None,
+    ) -> Iterator[dict]:
+        """
+        Get the GeoJSON features corresponding to tiles.
 
-        if precision and precision >= 0:
-            west, south, east, north = (
-                round(v, precision) for v in (west, south, east, north)
-            )
+        Same as `feature` but the transformer and the CRS metadata are only resolved once.
 
-        bbox = [min(west, east), min(south, north), max(west, east), max(south, north)]
-        geom = bbox_to_feature(west, south, east, north)
-
-        xyz = str(tile)
-        feat: dict[str, Any] = {
-            "type": "Feature",
-            "bbox": bbox,
-            "id": xyz,
-            "geometry": geom,
-            "properties": {
-                "title": f"XYZ tile {xyz}",
-                "tms": self.id,
-                "tms_crs": CRS_to_uri(self.crs._pyproj_crs),
-            },
-        }
+        Parameters
+        ----------
+        tiles : iterable of Tile or sequence of int
+            Tiles, as instances of Tile or sequences of 3 ints, X, Y, Z.
+        props : dict, optional
+            Optional extra feature properties (added to all the features).
+        buffer : float, optional
+            Optional buffer distance for the GeoJSON polygon.
+        precision: float
+            If >= 0, geometry coordinates will be rounded to this number of decimal,
+            otherwise original coordinate values will be preserved (default).
+        projected : bool, optional
+            Return coordinates in TMS projection. Default is false.
+        geographic_crs: pyproj.CRS, optional
+            Geographic CRS to use when `projected=False`. Default to 'EPSG:4326' as per GeoJSON specification.
+
+        Yields
+        ------
+        dict
+
+        """
+        feature = self._feature_factory(
+            buffer=buffer,
+            precision=precision,
+            projected=projected,
+            geographic_crs=geographic_crs,
+        )
+        for tile in tiles:
+            feat = feature(tile)
+            if props:
+                feat["properties"].update(props)
+
+            yield feat
+
+    @cached_property
+    def _crs_uri(self) -> str:
+        """TMS's CRS URI."""
+        return CRS_to_uri(self.crs._pyproj_crs)
 
-        if feature_crs != WGS84_CRS:
+    def _feature_factory(
+        self,
+        buffer: NumType | None = None,
+        precision: int | None = None,
+        projected: bool = False,
+        geographic_crs: pyproj.CRS | None = None,
+    ) -> Callable[[Tile], dict]:
+        """Return a function creating the GeoJSON feature of a tile (see `feature`)."""
+        geographic_crs = geographic_crs or crs_from_epsg(4326)
+
+        feature_crs = self.crs._pyproj_crs
+        tr = None
+        if not projected:
+            feature_crs = geographic_crs
+            tr = transformer_from_crs(self.crs._pyproj_crs, geographic_crs)
+
+        tms_id = self.id
+        tms_crs = self._crs_uri
+
+        crs_properties: dict[str, str] | None = None
+        crs_type = "name"
+        if feature_crs != crs_from_epsg(4326):
             warnings.warn(
                 "CRS is no longer part of the GeoJSON specification."
                 "Other projection than EPSG:4326 might not be supported.",
@@ -1473,33 +2431,58 @@ class TileMatrixSet(BaseModel, arbitrary_types_allowed=True, extra="ignore"):
                 stacklevel=1,
             )
 
-            if authority_code := feature_crs.to_authority(min_confidence=20):
-                authority, code = authority_code
-                feat.update(
-                    {
-                        "crs": {
-                            "type": "name",
-                            "properties": {"name": CRS_to_uri(feature_crs)},
-                        }
-                    }
-                )
+            if feature_crs.to_authority(min_confidence=20):
+                crs_properties = {"name": CRS_to_uri(feature_crs)}
             else:
-                feat.update(
-                    {
-                        "crs": {
-                            "type": "wkt",
-                            "properties": {"wkt": feature_crs.to_wkt()},
-                        }
-                    }
+                crs_type = "wkt"
+                crs_properties = {"wkt": feature_crs.to_wkt()}
+
+        def _feature(tile: Tile) -> dict:
+            west, south, east, north = self.xy_bounds(tile)
+
+            if tr is not None:
+                west, south, east, north = tr.transform_bounds(
+                    west, south, east, north, densify_pts=21
                 )
 
-        if props:
-            feat["properties"].update(props)
+            if buffer:
+                west -= buffer
+                south -= buffer
+                east += buffer
+                north += buffer
 
-        if fid is not None:
-            feat["id"] = fid
+            if precision and precision >= 0:
+                west, south, east, north = (
+                    round(v, precision) for v in (west, south, east, north)
+                )
 
-        return feat
+            bbox = [
+                min(west, east),
+                min(south, north),
+                max(west, east),
+                max(south, north),
+            ]
+            geom = bbox_to_feature(west, south, east, north)
+
+            xyz = str(tile)
+            feat: dict[str, Any] = {
+                "type": "Feature",
+                "bbox": bbox,
+                "id": xyz,
+                "geometry": geom,
+                "properties": {
+                    "title": f"XYZ tile {xyz}",
+                    "tms": tms_id,
+                    "tms_crs": tms_crs,
+                },
+            }
+
+            if crs_properties is not None:
+                feat["crs"] = {"type": crs_type, "properties": dict(crs_properties)}
+
+            return feat
+
+        return _feature
 
     def quadkey(self, *tile: Tile) -> str:
         """Get the quadkey of a tile
@@ -1533,6 +2516,260 @@ class TileMatrixSet(BaseModel, arbitrary_types_allowed=True, extra="ignore"):
 
         return "".join(qk)
 
+    def hilbert_ids(self, x, y=None, z=None) -> "numpy.ndarray":
+        """Get the Hilbert IDs of many tiles (requires numpy)
+
+        The Hilbert ID of a tile is its position along the Hilbert curves of
+        the successive zoom levels, starting from the TMS minzoom (same as the
+        PMTiles tile IDs for WebMercatorQuad). The curve of each zoom level
+        covers its whole TileMatrix (e.g 2x2 tiles for a TMS with a 2x2 minzoom
+        matrix).
+
+        Parameters
+        ----------
+        x, y, z : array_like
+            X, Y and Z tile indices arrays, or a (N, 3) array of X, Y, Z tile indices.
+
+        Returns
+        -------
+        numpy.ndarray of uint64
+
+        """
+        import numpy as np
+
+        from morecantile.curves import HILBERT_MAX_LEVEL, hilbert_indices
+
+        if not self.is_quadtree:
+            raise NoQuadkeySupport(
+                "This Tile Matrix Set doesn't support 2 x 2 quadkeys."
+            )
+
+        xs, ys, zs = _parse_tile_arrays(x, y, z)
+        root_bits = self._hilbert_root_bits()
+        max_level = HILBERT_MAX_LEVEL - root_bits
+        levels = zs - self.minzoom
+        if np.any((levels < 0) | (levels > max_level)):
+            raise InvalidZoomError(
+                f"Hilbert IDs are only supported for zoom levels {self.minzoom} to {self.minzoom + max_level}"
+            )
+
+        for zoom in np.unique(zs).tolist():
+            matrix = self.matrix(zoom)
+            idx = zs == zoom
+            tx, ty = xs[idx], ys[idx]
+            if np.any(
+                (tx < 0)
+                | (tx >= matrix.matrixWidth)
+                | (ty < 0)
+                | (ty >= matrix.matrixHeight)
+            ):
+                raise ValueError("Tile indices are outside of the tile matrix")
+
+        bits = levels + root_bits
+        size = np.left_shift(1, bits)
+        if np.any((xs >= size) | (ys >= size)):
+            raise ValueError("Tile indices are outside of the Hilbert curve")
+
+        # Number of tiles of the lower zoom levels
+        offsets = (
+            (np.left_shift(1, 2 * levels).astype("uint64") - np.uint64(1)) // 3
+        ) << np.uint64(2 * root_bits)
+        return offsets + hilbert_indices(xs, ys, bits)
+
+    def hilbert_tiles(self, ids: "numpy.typing.ArrayLike") -> "numpy.ndarray":
+        """Get the tiles of many Hilbert IDs (requires numpy)
+
+        Inverse of `hilbert_ids`.
+
+        Parameters
+        ----------
+        ids : array_like
+            Hilbert IDs.
+
+        Returns
+        -------
+        numpy.ndarray: (N, 3) int64 array of X, Y, Z tile indices.
+
+        """
+        import numpy as np
+
+        from morecantile.curves import HILBERT_MAX_LEVEL, hilbert_xy
+
+        if not self.is_quadtree:
+            raise NoQuadkeySupport(
+                "This Tile Matrix Set doesn't support 2 x 2 quadkeys."
+            )
+
+        ids = np.asarray(ids).astype("uint64").ravel()
+        root_bits = self._hilbert_root_bits()
+        max_level = HILBERT_MAX_LEVEL - root_bits
+
+        # First ID of each zoom level
+        starts = np.array(
+            [
+                (((1 << (2 * level)) - 1) // 3) << (2 * root_bits)
+                for level in range(max_level + 2)
+            ],
+            dtype="uint64",
+        )
+        levels = np.searchsorted(starts, ids, side="right") - 1
+        if np.any(levels > max_level):
+            raise ValueError("Invalid Hilbert IDs")
+
+        x, y = hilbert_xy(ids - starts[levels], levels + root_bits)
+        return np.stack([x, y, levels + self.minzoom], axis=-1)
+
+    def _hilbert_root_bits(self) -> int:
+        """Get the Hilbert curve level of the minzoom TileMatrix (0 for a 1x1 matrix)."""
+        return self.matrix(self.minzoom).matrixWidth.bit_length() - 1
+
+    def pack_tiles(self, x, y=None, z=None) -> "numpy.ndarray":
+        """Get the packed uint64 keys of many tiles (requires numpy)
+
+        Keys pack the zoom level and the X and Y indices of a tile (see
+        `morecantile.keys`) and sort by zoom level and then in row-major order.
+
+        Parameters
+        ----------
+        x, y, z : array_like
+            X, Y and Z tile indices arrays, or a (N, 3) array of X, Y, Z tile indices.
+
+        Returns
+        -------
+        numpy.ndarray of uint64
+
+        """
+        from morecantile.keys import pack_keys
+
+        xs, ys, zs = _parse_tile_arrays(x, y, z)
+        self._check_tile_arrays(xs, ys, zs)
+        return pack_keys(xs, ys, zs)
+
+    def unpack_tiles(self, keys: "numpy.typing.ArrayLike") -> "numpy.ndarray":
+        """Get the tiles of many packed uint64 keys (requires numpy)
+
+        Inverse of `pack_tiles`.
+
+        Parameters
+        ----------
+        keys : array_like
+            Tile keys.
+
+        Returns
+        -------
+        numpy.ndarray: (N, 3) int64 array of X, Y, Z tile indices.
+
+        """
+        from morecantile.keys import unpack_keys
+
+        tiles = unpack_keys(keys)
+        self._check_tile_arrays(tiles[:, 0], tiles[:, 1], tiles[:, 2])
+        return tiles
+
+    def compact_tiles(self, keys: "numpy.typing.ArrayLike") -> "numpy.ndarray":
+        """Compact the packed keys of a set of tiles (requires numpy)
+
+        Tiles covered by a coarser tile of the set are dropped and complete sets
+        of 4 sibling tiles (the `children` of a tile) are replaced by their
+        `parent`, recursively. The compacted set covers the same area with the
+        fewest tiles, e.g. a polygon cover at zoom 18 shrinks to its boundary
+        tiles and a few coarse interior tiles.
+
+        Parameters
+        ----------
+        keys : array_like
+            Tile keys (see `pack_tiles`), in any order and with duplicates.
+
+        Returns
+        -------
+        numpy.ndarray: sorted uint64 keys.
+
+        """
+        from morecantile.keys import compact_keys
+
+        if not self.is_quadtree:
+            raise NoQuadkeySupport(
+                "This Tile Matrix Set doesn't support 2 x 2 quadkeys."
+            )
+
+        self.unpack_tiles(keys)
+        return compact_keys(keys, minzoom=self.minzoom)
+
+    def expand_tiles(
+        self, keys: "numpy.typing.ArrayLike", zoom: int, chunk_size: int = 1 << 20
+    ) -> Iterator["numpy.ndarray"]:
+        """Lazily expand the packed keys of a set of tiles to a zoom level (requires numpy)
+
+        Inverse of `compact_tiles`: each tile is replaced by its `children` at
+        `zoom`. The keys are yielded in chunks (see `morecantile.keys.expand_keys`).
+
+        Parameters
+        ----------
+        keys : array_like
+            Tile keys (see `pack_tiles`) of non-overlapping tiles, e.g. `compact_tiles` output.
+        zoom : int
+            Zoom level of the expanded tiles.
+        chunk_size : int, optional
+            Maximum number of keys in each chunk (default to 2**20).
+
+        Returns
+        -------
+        Iterator of numpy.ndarray of uint64 keys.
+
+        """
+        import numpy as np
+
+        from morecantile.keys import expand_keys
+
+        if not self.is_quadtree:
+            raise NoQuadkeySupport(
+                "This Tile Matrix Set doesn't support 2 x 2 quadkeys."
+            )
+
+        tiles = self.unpack_tiles(keys)
+        if np.any(tiles[:, 2] > zoom):
+            raise InvalidZoomError("zoom must be greater than that of the input tiles")
+
+        self._check_keys_matrix(self.matrix(zoom))
+        return expand_keys(keys, zoom, chunk_size=chunk_size)
+
+    def _check_tile_arrays(
+        self, xs: "numpy.ndarray", ys: "numpy.ndarray", zs: "numpy.ndarray"
+    ) -> None:
+        """Check that tile indices are within the tile matrices and can be packed in keys."""
+        import numpy as np
+
+        from morecantile.keys import _check_key_zoom
+
+        for zoom in np.unique(zs).tolist():
+            _check_key_zoom(zoom)
+            if zoom < self.minzoom:
+                raise InvalidZoomError(
+                    f"Invalid zoom level {zoom}, TMS minzoom is {self.minzoom}"
+                )
+
+            matrix = self.matrix(zoom)
+            self._check_keys_matrix(matrix)
+
+            idx = zs == zoom
+            tx, ty = xs[idx], ys[idx]
+            if np.any(
+                (tx < 0)
+                | (tx >= matrix.matrixWidth)
+                | (ty < 0)
+                | (ty >= matrix.matrixHeight)
+            ):
+                raise ValueError("Tile indices are outside of the tile matrix")
+
+    def _check_keys_matrix(self, matrix: TileMatrix) -> None:
+        """Check that the tile indices of a matrix can be packed in keys."""
+        from morecantile.keys import KEY_INDEX_BITS
+
+        if max(matrix.matrixWidth, matrix.matrixHeight) > 1 << KEY_INDEX_BITS:
+            raise ValueError(
+                f"TileMatrix {matrix.id} is too large for tile keys (more than 2**{KEY_INDEX_BITS} columns or rows)"
+            )
+
     def quadkey_to_tile(self, qk: str) -> Tile:
         """Get the tile corresponding to a quadkey
 
@@ -1602,7 +2839,9 @@ class TileMatrixSet(BaseModel, arbitrary_types_allowed=True, extra="ignore"):
 
         return validx and validy
 
-    def neighbors(self, *tile: Tile) -> list[Tile]:
+    def neighbors(
+        self, *tile: Tile, as_keys: bool = False
+    ) -> "list[Tile] | numpy.ndarray":
         """The neighbors of a tile
 
         The neighbors function makes no guarantees regarding neighbor tile
@@ -1615,10 +2854,13 @@ class TileMatrixSet(BaseModel, arbitrary_types_allowed=True, extra="ignore"):
         ----------
         tile : Tile or sequence of int
             May be be either an instance of Tile or 3 ints, X, Y, Z.
+        as_keys : bool, optional
+            Return the tiles as a uint64 array of packed keys (see `pack_tiles`,
+            requires numpy).
 
         Returns
         -------
-        list
+        list (or numpy.ndarray of uint64 keys when `as_keys=True`)
 
         """
         t = _parse_tile_arg(*tile)
@@ -1663,9 +2905,12 @@ class TileMatrixSet(BaseModel, arbitrary_types_allowed=True, extra="ignore"):
 
                 tiles.add(Tile(x=nx, y=ytile, z=t.z))
 
+        if as_keys:
+            return self.pack_tiles(sorted(tiles))
+
         return sorted(tiles)
 
-    def parent(self, *tile: Tile, zoom: int = None):
+    def parent(self, *tile: Tile, zoom: int = None, as_keys: bool = False):
         """Get the parent of a tile
 
         The parent is the tile of one zoom level lower that contains the
@@ -1678,16 +2923,19 @@ class TileMatrixSet(BaseModel, arbitrary_types_allowed=True, extra="ignore"):
         zoom : int, optional
             Determines the *zoom* level of the returned parent tile.
             This defaults to one lower than the tile (the immediate parent).
+        as_keys : bool, optional
+            Return the tiles as a uint64 array of packed keys (see `pack_tiles`,
+            requires numpy).
 
         Returns
         -------
-        list: list of Tile
+        list: list of Tile (or numpy.ndarray of uint64 keys when `as_keys=True`)
 
         """
         t = _parse_tile_arg(*tile)
 
         if t.z == self.minzoom:
-            return []
+            return self.pack_tiles([]) if as_keys else []
 
         if zoom is not None and t.z <= zoom:
             raise InvalidZoomError("zoom must be less than that of the input tile")
@@ -1700,8 +2948,18 @@ class TileMatrixSet(BaseModel, arbitrary_types_allowed=True, extra="ignore"):
         ul_tile = self._tile(bbox.left + res, bbox.top - res, target_zoom)
         lr_tile = self._tile(bbox.right - res, bbox.bottom + res, target_zoom)
 
-        tiles = []
         matrix = self.matrix(target_zoom)
+        if as_keys:
+            self._check_keys_matrix(matrix)
+            return TileRange(
+                target_zoom,
+                [(ul_tile.x, ul_tile.y, lr_tile.x, lr_tile.y)],
+                coalesce=matrix._coalesce_lookup
+                if matrix.variableMatrixWidths is not None
+                else None,
+            ).to_keys()
+
+        tiles = []
         for j in range(ul_tile.y, lr_tile.y + 1):
             cf = (
                 matrix.get_coalesce_factor(j)
@@ -1715,7 +2973,7 @@ class TileMatrixSet(BaseModel, arbitrary_types_allowed=True, extra="ignore"):
 
         return tiles
 
-    def children(self, *tile: Tile, zoom: int = None):
+    def children(self, *tile: Tile, zoom: int = None, as_keys: bool = False):
         """Get the children of a tile
 
         The children are ordered: top-left, top-right, bottom-right, bottom-left.
@@ -1727,10 +2985,13 @@ class TileMatrixSet(BaseModel, arbitrary_types_allowed=True, extra="ignore"):
         zoom : int, optional
             Determines the *zoom* level of the returned child tiles.
             This defaults to one higher than the tile (the immediate children).
+        as_keys : bool, optional
+            Return the tiles as a uint64 array of packed keys (see `pack_tiles`,
+            requires numpy).
 
         Returns
         -------
-        list: list of Tile
+        list: list of Tile (or numpy.ndarray of uint64 keys when `as_keys=True`)
 
         """
         t = _parse_tile_arg(*tile)
@@ -1747,8 +3008,18 @@ class TileMatrixSet(BaseModel, arbitrary_types_allowed=True, extra="ignore"):
         ul_tile = self._tile(bbox.left + res, bbox.top - res, target_zoom)
         lr_tile = self._tile(bbox.right - res, bbox.bottom + res, target_zoom)
 
-        tiles = []
         matrix = self.matrix(target_zoom)
+        if as_keys:
+            self._check_keys_matrix(matrix)
+            return TileRange(
+                target_zoom,
+                [(ul_tile.x, ul_tile.y, lr_tile.x, lr_tile.y)],
+                coalesce=matrix._coalesce_lookup
+                if matrix.variableMatrixWidths is not None
+                else None,
+            ).to_keys()
+
+        tiles = []
         for j in range(ul_tile.y, lr_tile.y + 1):
             cf = (
                 matrix.get_coalesce_factor(j)
@@ -1761,3 +3032,255 @@ class TileMatrixSet(BaseModel, arbitrary_types_allowed=True, extra="ignore"):
                 tiles.append(Tile(i, j, target_zoom))
 
         return tiles
+
+    def overlapping_tiles(
+        self,
+        other_tms: "TileMatrixSet",
+        tile: Tile,
+        zoom: int,
+        densify_pts: int = 21,
+    ) -> list[Tile]:
+        """Get the tiles of another TileMatrixSet overlapping a tile (requires numpy)
+
+        Parameters
+        ----------
+        other_tms : TileMatrixSet
+            TileMatrixSet of the overlapping tiles.
+        tile : Tile or sequence of int
+            Tile of this TileMatrixSet (X, Y, Z).
+        zoom : int
+            Zoom level of the overlapping tiles.
+        densify_pts : int, optional
+            Number of points added along each edge of the tile before
+            transforming its bounds (default to 21).
+
+        Returns
+        -------
+        list of Tile
+
+        """
+        return list(
+            self.overlapping_tiles_many(
+                other_tms, [_parse_tile_arg(tile)], zoom, densify_pts=densify_pts
+            )[0]
+        )
+
+    def overlapping_tiles_many(
+        self,
+        other_tms: "TileMatrixSet",
+        tiles: "numpy.typing.ArrayLike",
+        zoom: int,
+        densify_pts: int = 21,
+        lookup: bool = False,
+    ) -> list[TileRange]:
+        """Get the tiles of another TileMatrixSet overlapping many tiles (requires numpy)
+
+        The bounds of the tiles are densified with `densify_pts` points along
+        each edge and transformed to the other TMS's CRS at once (like
+        `pyproj.Transformer.transform_bounds`, with the transformers cached by
+        CRS pair). Tiles only sharing an edge with the transformed bounds are
+        not overlapping.
+
+        Parameters
+        ----------
+        other_tms : TileMatrixSet
+            TileMatrixSet of the overlapping tiles.
+        tiles : array_like
+            (N, 3) array of X, Y, Z tile indices of this TileMatrixSet (e.g a list of Tile).
+        zoom : int
+            Zoom level of the overlapping tiles.
+        densify_pts : int, optional
+            Number of points added along each edge of the tiles before
+            transforming their bounds (default to 21).
+        lookup : bool, optional
+            Use a lookup table of the overlapping tiles of every tile of the
+            input zoom levels, computed on first use and cached by zoom levels
+            pair (the input TileMatrix must have less than 2**20 tiles).
+
+        Returns
+        -------
+        list of TileRange (one per input tile)
+
+        Notes
+        -----
+        As with `transform_bounds`, only the densified edges of the tiles are
+        transformed: a tile containing a singularity of the other CRS (e.g. a
+        pole for `WebMercatorQuad`) might miss some overlapping tiles.
+
+        """
+        import numpy as np
+
+        xs, ys, zs = _parse_tile_arrays(tiles)
+
+        if lookup:
+            rects = np.empty((xs.size, 4), dtype="int64")
+            for tile_zoom in np.unique(zs).tolist():
+                idx = zs == tile_zoom
+                table = self._overlapping_table(other_tms, tile_zoom, zoom, densify_pts)
+                tx, ty = xs[idx], ys[idx]
+                if np.any(
+                    (tx < 0)
+                    | (tx >= table.shape[1])
+                    | (ty < 0)
+                    | (ty >= table.shape[0])
+                ):
+                    raise ValueError("Tile indices are outside of the tile matrix")
+
+                rects[idx] = table[ty, tx]
+
+        else:
+            rects = self._overlapping_rects(other_tms, xs, ys, zs, zoom, densify_pts)
+
+        matrix = other_tms.matrix(zoom)
+        coalesce = (
+            matrix._coalesce_lookup if matrix.variableMatrixWidths is not None else None
+        )
+
+        ranges = []
+        for minx, miny, maxx, maxy in rects.tolist():
+            if coalesce is None:
+                ranges.append(TileRange(zoom, [(minx, miny, maxx, maxy)]))
+                continue
+
+            # Include the coalesced tile overlapping the first column of each row
+            ranges.append(
+                TileRange.from_row_spans(
+                    zoom,
+                    (
+                        (row, ((minx - minx % matrix.get_coalesce_factor(row), maxx),))
+                        for row in range(miny, maxy + 1)
+                    ),
+                    coalesce=coalesce,
+                )
+            )
+
+        return ranges
+
+    def _overlapping_rects(
+        self,
+        other_tms: "TileMatrixSet",
+        xs: "numpy.ndarray",
+        ys: "numpy.ndarray",
+        zs: "numpy.ndarray",
+        zoom: int,
+        densify_pts: int,
+    ) -> "numpy.ndarray":
+        """Get the (minx, miny, maxx, maxy) tile indices of another TMS overlapped by many tiles.
+
+        Tiles without overlapping tiles get empty (0, 0, -1, -1) rects.
+
+        """
+        import numpy as np
+
+        transformer = transformer_from_crs(
+            self._bound_transformers[0], other_tms._bound_transformers[0]
+        )
+        bbox = other_tms.xy_bbox
+        steps = np.arange(densify_pts + 1) / (densify_pts + 1)
+        ones = np.ones_like(steps)
+
+        rects = np.empty((xs.size, 4), dtype="int64")
+        rects[:] = (0, 0, -1, -1)
+
+        # Limit the number of transformed points at once
+        chunk = max(1, (1 << 20) // (4 * steps.size))
+        for i in range(0, xs.size, chunk):
+            bounds = self.xy_bounds_many(
+                xs[i : i + chunk], ys[i : i + chunk], zs[i : i + chunk]
+            )
+            left, bottom, right, top = (b[:, None] for b in bounds.T)
+            width, height = right - left, top - bottom
+
+            # Densified edges: bottom, right, top and left
+            px = np.concatenate(
+                [
+                    left + width * steps,
+                    right * ones,
+                    right - width * steps,
+                    left * ones,
+                ],
+                axis=1,
+            )
+            py = np.concatenate(
+                [
+                    bottom * ones,
+                    bottom + height * steps,
+                    top * ones,
+                    top - height * steps,
+                ],
+                axis=1,
+            )
+            tx, ty = transformer.transform(px.ravel(), py.ravel())
+            points = np.stack([tx, ty]).reshape(2, *px.shape)
+
+            # (2, N) min and max coordinates of the finite points (NaN if none)
+            points[:, ~np.isfinite(points).all(axis=0)] = np.nan
+            mins = np.fmin.reduce(points, axis=2)
+            maxs = np.fmax.reduce(points, axis=2)
+
+            valid = (
+                (mins[0] < bbox.right)
+                & (maxs[0] > bbox.left)
+                & (mins[1] < bbox.top)
+                & (maxs[1] > bbox.bottom)
+            )
+            mins, maxs = mins[:, valid], maxs[:, valid]
+
+            # Shrink the bounds so that tiles only sharing an edge are not overlapping
+            buffer = (maxs - mins) * 1e-6
+            corners = other_tms._tile_many(
+                np.concatenate([mins[0] + buffer[0], maxs[0] - buffer[0]]),
+                np.concatenate([maxs[1] - buffer[1], mins[1] + buffer[1]]),
+                zoom,
+            )
+            ul, lr = corners[: valid.sum(), :2], corners[valid.sum() :, :2]
+
+            idx = i + np.flatnonzero(valid)
+            rects[idx, :2] = np.minimum(ul, lr)
+            rects[idx, 2:] = np.maximum(ul, lr)
+
+        return rects
+
+    @cached_property
+    def _overlapping_tables(self) -> dict[tuple, "numpy.ndarray"]:
+        """Overlapping tiles lookup tables (see `overlapping_tiles_many`)."""
+        return {}
+
+    def _overlapping_table(
+        self,
+        other_tms: "TileMatrixSet",
+        tile_zoom: int,
+        zoom: int,
+        densify_pts: int,
+    ) -> "numpy.ndarray":
+        """Get the (height, width, 4) overlapping tiles rects of every tile of a TileMatrix."""
+        import numpy as np
+
+        other_matrix = other_tms.matrix(zoom)
+        key = (
+            other_tms._bound_transformers[0].srs,
+            other_matrix.model_dump_json(),
+            tile_zoom,
+            densify_pts,
+        )
+        if (table := self._overlapping_tables.get(key)) is None:
+            matrix = self.matrix(tile_zoom)
+            width, height = matrix.matrixWidth, matrix.matrixHeight
+            if width * height > OVERLAPPING_TABLE_MAX_TILES:
+                raise ValueError(
+                    f"TileMatrix {matrix.id} is too large for a lookup table (more than {OVERLAPPING_TABLE_MAX_TILES} tiles)"
+                )
+
+            ys, xs = np.divmod(np.arange(width * height, dtype="int64"), width)
+            table = self._overlapping_rects(
+                other_tms, xs, ys, np.full_like(xs, tile_zoom), zoom, densify_pts
+            ).reshape(height, width, 4)
+
+            if len(self._overlapping_tables) >= OVERLAPPING_TABLES_CACHE_SIZE:
+                # Copy the keys (atomic) in case the cache is updated from another thread
+                oldest = list(self._overlapping_tables)[0]
+                self._overlapping_tables.pop(oldest, None)
+
+            self._overlapping_tables[key] = table
+
+        return table
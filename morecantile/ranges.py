@@ -0,0 +1,391 @@
+"""Morecantile tile ranges.
+
+A `TileRange` describes the tiles of one zoom level covered by one or more
+rectangles of tile indices (e.g the two parts of a bounding box crossing the
+antimeridian) without creating one `Tile` per cell. Rows are grouped in blocks
+sharing the same column spans and coalesce factor, so its size and the
+`len()`, `in` and indexing operations only depend on the number of blocks.
+
+"""
+
+import operator
+from bisect import bisect_right
+from collections.abc import Iterable, Iterator, Sequence
+from typing import TYPE_CHECKING, overload
+
+from morecantile.commons import Tile
+
+if TYPE_CHECKING:
+    import numpy
+
+Span = tuple[int, int]
+
+
+def _first_column(minx: int, coalesce: int) -> int:
+    """First column, multiple of the coalesce factor, greater or equal to minx."""
+    return -(-minx // coalesce) * coalesce
+
+
+def _count_columns(minx: int, maxx: int, coalesce: int) -> int:
+    """Number of columns, multiple of the coalesce factor, between minx and maxx."""
+    return max(0, maxx // coalesce - _first_column(minx, coalesce) // coalesce + 1)
+
+
+def _block_columns(spans: Sequence[Span], coalesce: int) -> "numpy.ndarray":
+    """Columns of the tiles of a row, as an int64 array (requires numpy)."""
+    import numpy as np
+
+    return np.concatenate(
+        [
+            np.arange(_first_column(minx, coalesce), maxx + 1, coalesce, dtype="int64")
+            for minx, maxx in spans
+        ]
+    )
+
+
+def _coalesce_spans(spans: Iterable[Span], coalesce: int) -> tuple[Span, ...]:
+    """Extend the column spans to the full extent of their first and last coalesced tiles."""
+    return _merge_spans(
+        (_first_column(minx, coalesce), maxx - maxx % coalesce + coalesce - 1)
+        for minx, maxx in spans
+        if _first_column(minx, coalesce) <= maxx
+    )
+
+
+def _intersect_spans(a: Sequence[Span], b: Sequence[Span]) -> tuple[Span, ...]:
+    """Intersection of two sorted and merged column spans."""
+    spans = []
+    i = j = 0
+    while i < len(a) and j < len(b):
+        minx, maxx = max(a[i][0], b[j][0]), min(a[i][1], b[j][1])
+        if minx <= maxx:
+            spans.append((minx, maxx))
+
+        if a[i][1] < b[j][1]:
+            i += 1
+        else:
+            j += 1
+
+    return tuple(spans)
+
+
+def _subtract_spans(a: Sequence[Span], b: Sequence[Span]) -> tuple[Span, ...]:
+    """Difference of two sorted and merged column spans."""
+    spans = []
+    j = 0
+    for minx, maxx in a:
+        while j < len(b) and b[j][1] < minx:
+            j += 1
+
+        k = j
+        while k < len(b) and b[k][0] <= maxx:
+            if b[k][0] > minx:
+                spans.append((minx, b[k][0] - 1))
+            minx = b[k][1] + 1
+            k += 1
+
+        if minx <= maxx:
+            spans.append((minx, maxx))
+
+    return tuple(spans)
+
+
+_SPANS_OPERATIONS = {
+    "union": lambda a, b: _merge_spans((*a, *b)),
+    "intersection": _intersect_spans,
+    "difference": _subtract_spans,
+}
+
+
+def _merge_spans(spans: Iterable[Span]) -> tuple[Span, ...]:
+    """Sort and merge overlapping or adjacent column spans."""
+    merged: list[Span] = []
+    for minx, maxx in sorted(spans):
+        if merged and minx <= merged[-1][1] + 1:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], maxx))
+        else:
+            merged.append((minx, maxx))
+
+    return tuple(merged)
+
+
+class TileRange:
+    """Tiles of a TileMatrix covered by rectangles of tile indices.
+
+    Args:
+        z (int): zoom level.
+        rects (sequence of (minx, miny, maxx, maxy)): Inclusive tile indices rectangles.
+        coalesce (tuple, optional): Coalesce lookup table of the TileMatrix (first row and
+            coalesce factor of each row interval, see `TileMatrix._coalesce_lookup`). Only the
+            columns which are a multiple of the row's coalesce factor are part of the range.
+
+    Examples:
+        >>> tiles = TileRange(2, [(0, 0, 1, 1)])
+        >>> len(tiles)
+        4
+        >>> list(tiles)
+        [Tile(x=0, y=0, z=2), Tile(x=1, y=0, z=2), Tile(x=0, y=1, z=2), Tile(x=1, y=1, z=2)]
+
+    """
+
+    __slots__ = ("z", "_blocks", "_rows", "_offsets", "_coalesce")
+
+    def __init__(
+        self,
+        z: int,
+        rects: Iterable[tuple[int, int, int, int]] = (),
+        coalesce: tuple[Sequence[int], Sequence[int]] | None = None,
+    ):
+        """Group the rows of the rectangles in blocks."""
+        self.z = z
+
+        rects = [r for r in rects if r[0] <= r[2] and r[1] <= r[3]]
+        rows = sorted({r[1] for r in rects} | {r[3] + 1 for r in rects})
+        self._set_blocks(
+            (
+                (
+                    row,
+                    next_row - 1,
+                    _merge_spans(
+                        (minx, maxx)
+                        for minx, miny, maxx, maxy in rects
+                        if miny <= row <= maxy
+                    ),
+                )
+                for row, next_row in zip(rows[:-1], rows[1:])
+            ),
+            coalesce,
+        )
+
+    @classmethod
+    def from_row_spans(
+        cls,
+        z: int,
+        row_spans: Iterable[tuple[int, Iterable[Span]]],
+        coalesce: tuple[Sequence[int], Sequence[int]] | None = None,
+    ) -> "TileRange":
+        """Create a TileRange from the inclusive column spans of each row.
+
+        Args:
+            z (int): zoom level.
+            row_spans (sequence of (row, spans)): Row index and inclusive (minx, maxx) column spans.
+            coalesce (tuple, optional): Coalesce lookup table of the TileMatrix.
+
+        Returns:
+            TileRange
+
+        """
+        tile_range = cls.__new__(cls)
+        tile_range.z = z
+
+        spans: dict[int, list[Span]] = {}
+        for row, row_spans_ in row_spans:
+            spans.setdefault(row, []).extend(row_spans_)
+
+        tile_range._set_blocks(
+            ((row, row, _merge_spans(spans[row])) for row in sorted(spans)),
+            coalesce,
+        )
+        return tile_range
+
+    def _set_blocks(
+        self,
+        segments: Iterable[tuple[int, int, tuple[Span, ...]]],
+        coalesce: tuple[Sequence[int], Sequence[int]] | None = None,
+    ) -> None:
+        """Split sorted (miny, maxy, spans) row segments by coalesce factor and group them in blocks.
+
+        The column spans of coalesced rows are extended to the full extent of
+        their first and last tiles, so that the same tiles always give the
+        same blocks.
+
+        """
+        self._coalesce = coalesce
+        starts, factors = coalesce if coalesce is not None else ((0,), (1,))
+
+        # blocks of rows: (miny, maxy, spans, coalesce factor, tiles per row)
+        blocks: list[tuple[int, int, tuple[Span, ...], int, int]] = []
+        for miny, maxy, spans in segments:
+            idx = bisect_right(starts, miny) - 1
+            row = miny
+            while row <= maxy:
+                end = min(maxy, starts[idx + 1] - 1) if idx + 1 < len(starts) else maxy
+                cf = factors[idx]
+                row_spans = _coalesce_spans(spans, cf) if cf != 1 else spans
+                width = sum(_count_columns(minx, maxx, cf) for minx, maxx in row_spans)
+                if width:
+                    if (
+                        blocks
+                        and blocks[-1][1] == row - 1
+                        and blocks[-1][2:4] == (row_spans, cf)
+                    ):
+                        blocks[-1] = (blocks[-1][0], end, row_spans, cf, width)
+                    else:
+                        blocks.append((row, end, row_spans, cf, width))
+
+                row = end + 1
+                idx += 1
+
+        offsets = [0]
+        for miny, maxy, _, _, width in blocks:
+            offsets.append(offsets[-1] + (maxy - miny + 1) * width)
+
+        self._blocks = tuple(blocks)
+        self._rows = tuple(block[0] for block in blocks)
+        self._offsets = tuple(offsets)
+
+    def _combine(self, other: "TileRange", operation: str) -> "TileRange":
+        """Union, intersection or difference of two ranges of the same TileMatrix."""
+        tile_range = self.__class__.__new__(self.__class__)
+        tile_range.z = self.z
+
+        rows = sorted(
+            {block[0] for block in self._blocks + other._blocks}
+            | {block[1] + 1 for block in self._blocks + other._blocks}
+        )
+        spans_operation = _SPANS_OPERATIONS[operation]
+        tile_range._set_blocks(
+            (
+                (
+                    row,
+                    next_row - 1,
+                    spans_operation(self._row_spans(row), other._row_spans(row)),
+                )
+                for row, next_row in zip(rows[:-1], rows[1:])
+            ),
+            self._coalesce if self._coalesce is not None else other._coalesce,
+        )
+        return tile_range
+
+    def _row_spans(self, y: int) -> tuple[Span, ...]:
+        """Column spans of a row."""
+        idx = bisect_right(self._rows, y) - 1
+        if idx < 0 or self._blocks[idx][1] < y:
+            return ()
+
+        return self._blocks[idx][2]
+
+    def __repr__(self):
+        """Simplify default repr."""
+        return f"<TileRange z={self.z} rows={self.nrows} tiles={len(self)}>"
+
+    def __len__(self) -> int:
+        """Number of tiles."""
+        return self._offsets[-1]
+
+    def __iter__(self) -> Iterator[Tile]:
+        """Iterate over the tiles, row by row."""
+        z = self.z
+        for miny, maxy, spans, cf, _ in self._blocks:
+            for y in range(miny, maxy + 1):
+                for minx, maxx in spans:
+                    for x in range(_first_column(minx, cf), maxx + 1, cf):
+                        yield Tile(x, y, z)
+
+    def __contains__(self, tile: object) -> bool:
+        """Check if a tile is part of the range."""
+        if not isinstance(tile, tuple) or len(tile) != 3:
+            return False
+
+        x, y, z = tile
+        if z != self.z:
+            return False
+
+        idx = bisect_right(self._rows, y) - 1
+        if idx < 0:
+            return False
+
+        _, maxy, spans, cf, _ = self._blocks[idx]
+        if y > maxy or x % cf:
+            return False
+
+        return any(minx <= x <= maxx for minx, maxx in spans)
+
+    @overload
+    def __getitem__(self, index: int) -> Tile: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[Tile]: ...
+
+    def __getitem__(self, index: int | slice) -> Tile | list[Tile]:
+        """Get a tile (or a list of tiles for slices) by position."""
+        if isinstance(index, slice):
+            return [self._tile(i) for i in range(*index.indices(len(self)))]
+
+        index = operator.index(index)
+        if index < 0:
+            index += len(self)
+
+        if not 0 <= index < len(self):
+            raise IndexError("TileRange index out of range")
+
+        return self._tile(index)
+
+    def _tile(self, index: int) -> Tile:
+        """Get the tile at a (valid, positive) position."""
+        idx = bisect_right(self._offsets, index) - 1
+        miny, _, spans, cf, width = self._blocks[idx]
+        row, col = divmod(index - self._offsets[idx], width)
+        for minx, maxx in spans:
+            count = _count_columns(minx, maxx, cf)
+            if col < count:
+                return Tile(_first_column(minx, cf) + col * cf, miny + row, self.z)
+
+            col -= count
+
+        raise IndexError("TileRange index out of range")  # pragma: no cover
+
+    @property
+    def nrows(self) -> int:
+        """Number of rows."""
+        return sum(maxy - miny + 1 for miny, maxy, _, _, _ in self._blocks)
+
+    def row_spans(self) -> Iterator[tuple[int, tuple[Span, ...], int]]:
+        """Iterate over the rows.
+
+        Yields:
+            tuple: row index, inclusive column spans and coalesce factor of the row.
+
+        """
+        for miny, maxy, spans, cf, _ in self._blocks:
+            for y in range(miny, maxy + 1):
+                yield y, spans, cf
+
+    def to_numpy(self) -> "numpy.ndarray":
+        """Get the tiles as a (N, 3) int64 array of X, Y, Z tile indices (requires numpy)."""
+        import numpy as np
+
+        arrays = []
+        for miny, maxy, spans, cf, width in self._blocks:
+            xs = _block_columns(spans, cf)
+            ys = np.arange(miny, maxy + 1, dtype="int64")
+            block = np.empty((ys.size * width, 3), dtype="int64")
+            block[:, 0] = np.tile(xs, ys.size)
+            block[:, 1] = np.repeat(ys, width)
+            block[:, 2] = self.z
+            arrays.append(block)
+
+        if not arrays:
+            return np.empty((0, 3), dtype="int64")
+
+        return np.concatenate(arrays)
+
+    def to_keys(self) -> "numpy.ndarray":
+        """Get the tiles as a uint64 array of packed keys (see `morecantile.keys`, requires numpy)."""
+        import numpy as np
+
+        from morecantile.keys import _check_key_zoom, pack_keys
+
+        _check_key_zoom(self.z)
+        arrays = [
+            pack_keys(
+                _block_columns(spans, cf)[None, :],
+                np.arange(miny, maxy + 1, dtype="int64")[:, None],
+                self.z,
+            )
+            for miny, maxy, spans, cf, _ in self._blocks
+        ]
+        if not arrays:
+            return np.empty(0, dtype="uint64")
+
+        return np.concatenate(arrays)
@@ -2,17 +2,17 @@
 
 import json
 import logging
+import pathlib
 import sys
 
 import click
 from pyproj import CRS
 
 import morecantile
+from morecantile.utils import crs_from_epsg
 
 logger = logging.getLogger(__name__)
 
-WGS84_CRS = CRS.from_epsg(4326)
-
 
 def configure_logging(verbosity):
     """Configure log verbosity.
@@ -101,6 +101,39 @@ def coords(obj):
                 yield f
 
 
+def exact_tiles(tms, obj, zoom):
+    """Tiles intersecting the geometries of a GeoJSON object (requires numpy).
+
+    Polygons and lines are covered exactly, points use their tile.
+    """
+    from morecantile.cover import _geometries
+    from morecantile.tilesets import TileSet
+
+    polygons, lines, ranges = [], [], []
+    for geometry in _geometries(obj):
+        geom_type = geometry.get("type")
+        if geom_type in ("Polygon", "MultiPolygon"):
+            polygons.append(geometry)
+        elif geom_type in ("LineString", "MultiLineString"):
+            lines.append(geometry)
+        elif geom_type in ("Point", "MultiPoint"):
+            for lng, lat, *_ in coords(geometry):
+                ranges.extend(tms.tile_ranges(lng, lat, lng, lat, [zoom]))
+        else:
+            raise click.BadParameter(
+                f"Invalid geometry type: {geom_type}", param_hint="input"
+            )
+
+    if polygons:
+        collection = {"type": "GeometryCollection", "geometries": polygons}
+        ranges.extend(tms.geometry_tiles(collection, [zoom]))
+
+    if lines:
+        ranges.extend(tms.line_tiles(lines, [zoom]))
+
+    return TileSet.from_ranges(tms, ranges)
+
+
 # The CLI command group.
 @click.group(help="Command line interface for the Morecantile Python package.")
 @click.option("--verbose", "-v", count=True, help="Increase verbosity.")
@@ -247,6 +280,14 @@ def shapes(  # noqa: C901
     col_xs = []
     col_ys = []
 
+    # Resolve the transformer and CRS metadata once for all the tiles
+    tile_feature = tilematrixset._feature_factory(
+        projected=projected,
+        buffer=buffer,
+        precision=precision,
+        geographic_crs=CRS.from_user_input(crs) if crs else crs_from_epsg(4326),
+    )
+
     for _i, line in enumerate(iter_lines(src)):
         obj = json.loads(line)
         if isinstance(obj, dict):
@@ -260,15 +301,11 @@ def shapes(  # noqa: C901
         else:
             raise click.BadParameter("{0}".format(obj), param=input, param_hint="input")
 
-        feature = tilematrixset.feature(
-            (x, y, z),
-            fid=fid,
-            props=props,
-            projected=projected,
-            buffer=buffer,
-            precision=precision,
-            geographic_crs=CRS.from_user_input(crs) if crs else WGS84_CRS,
-        )
+        feature = tile_feature((x, y, z))
+        if props:
+            feature["properties"].update(props)
+        if fid is not None:
+            feature["id"] = fid
         bbox = feature["bbox"]
         w, s, e, n = bbox
         col_xs.extend([w, e])
@@ -325,8 +362,14 @@ def shapes(  # noqa: C901
     help="Path to TileMatrixSet JSON file.",
     type=click.Path(),
 )
+@click.option(
+    "--exact",
+    is_flag=True,
+    default=False,
+    help="List the tiles intersecting the GeoJSON geometries instead of their bounding box (requires numpy).",
+)
 @click.pass_context
-def tiles(ctx, zoom, input, identifier, seq, tms):  # noqa: C901
+def tiles(ctx, zoom, input, identifier, seq, tms, exact):  # noqa: C901
     """
     Lists TMS tiles at ZOOM level intersecting
     GeoJSON [west, south, east, north] bounding boxen, features, or
@@ -364,6 +407,15 @@ def tiles(ctx, zoom, input, identifier, seq, tms):  # noqa: C901
                 )
 
         elif isinstance(obj, dict):
+            if exact:
+                for tile in exact_tiles(tilematrixset, obj, zoom):
+                    if seq:
+                        click.echo("\x1e")
+
+                    click.echo(json.dumps((tile.x, tile.y, zoom)))
+
+                continue
+
             if "bbox" in obj:
                 bbox = obj["bbox"]
             else:
@@ -414,6 +466,27 @@ def tms(identifier):
     click.echo(tms.model_dump_json(exclude_none=True))
 
 
+################################################################################
+# The compile_tms command.
+@cli.command(short_help="Compile TileMatrixSet documents.")
+@click.option(
+    "--output",
+    type=click.Path(dir_okay=False, writable=True, path_type=pathlib.Path),
+    help="Output file (defaults to morecantile/data/tms.pickle).",
+)
+def compile_tms(output):
+    """Validate morecantile's TMS documents and write them to a compiled registry.
+
+    The compiled registry is used by `morecantile.tms.get` instead of the JSON
+    documents when it is up to date (same morecantile, pydantic, pyproj and
+    PROJ versions, and same TMS documents).
+    """
+    from morecantile.compiled import compile_tms
+
+    path = compile_tms(output=output)
+    click.echo(str(path))
+
+
 ################################################################################
 # The custom command.
 @cli.command(short_help="Create Custom TileMatrixSet")
@@ -581,7 +654,7 @@ def tms_to_geojson(  # noqa: C901
                 projected=projected,
                 buffer=buffer,
                 precision=precision,
-                geographic_crs=CRS.from_user_input(crs) if crs else WGS84_CRS,
+                geographic_crs=CRS.from_user_input(crs) if crs else crs_from_epsg(4326),
             )
             bbox = feature["bbox"]
             w, s, e, n = bbox
@@ -0,0 +1,309 @@
+"""Morecantile TileSet: sets of tiles of a TileMatrixSet."""
+
+from collections.abc import Iterable, Iterator, Mapping
+from typing import TYPE_CHECKING
+
+from morecantile.commons import Tile
+from morecantile.errors import InvalidZoomError
+from morecantile.ranges import Span, TileRange
+
+if TYPE_CHECKING:
+    import numpy
+    import numpy.typing
+
+    from morecantile.models import TileMatrix, TileMatrixSet
+
+
+class TileSet:
+    """Set of tiles of a TileMatrixSet.
+
+    The tiles of each zoom level are stored as a `TileRange` (blocks of rows
+    sharing the same inclusive column spans), so that large sets of
+    contiguous tiles (e.g `TileMatrixSet.geometry_tiles` covers) only use a
+    few spans per row. Union, intersection and difference are computed on
+    the spans, without listing the tiles.
+
+    Args:
+        tms (TileMatrixSet): TileMatrixSet of the tiles.
+        tiles (iterable of Tile): Tiles of the set. For TileMatrix with variable
+            matrix widths, columns are snapped to the first column of the coalesced
+            tile (as with `TileMatrixSet.tile`).
+
+    Examples:
+        >>> tms = morecantile.tms.get("WebMercatorQuad")
+        >>> a = TileSet(tms, tms.tiles(-10, -10, 10, 10, zooms=[4]))
+        >>> b = TileSet(tms, tms.tiles(0, 0, 40, 40, zooms=[4]))
+        >>> len(a), len(b), len(a | b), len(a & b), len(a - b)
+        (4, 4, 7, 1, 3)
+
+    """
+
+    __slots__ = ("tms", "_ranges")
+
+    tms: "TileMatrixSet"
+    _ranges: dict[int, TileRange]
+
+    def __init__(self, tms: "TileMatrixSet", tiles: Iterable[Tile] = ()):
+        """Group the tiles by zoom level and row."""
+        self.tms = tms
+
+        rows: dict[int, dict[int, list[Span]]] = {}
+        for x, y, z in tiles:
+            rows.setdefault(z, {}).setdefault(y, []).append((x, x))
+
+        ranges: dict[int, TileRange] = {}
+        for z in sorted(rows):
+            matrix, coalesce = self._matrix(z)
+            if coalesce is not None:
+                for y, spans in rows[z].items():
+                    cf = matrix.get_coalesce_factor(y)
+                    spans[:] = [(x - x % cf, x) for x, _ in spans]
+
+            ranges[z] = TileRange.from_row_spans(z, rows[z].items(), coalesce=coalesce)
+
+        self._set_ranges(ranges)
+
+    @classmethod
+    def from_ranges(
+        cls, tms: "TileMatrixSet", ranges: Iterable[TileRange]
+    ) -> "TileSet":
+        """Create a TileSet from TileRanges (e.g `TileMatrixSet.tile_ranges` output).
+
+        Args:
+            tms (TileMatrixSet): TileMatrixSet of the tiles.
+            ranges (iterable of TileRange): Tile ranges, ranges of the same zoom level are merged.
+
+        Returns:
+            TileSet
+
+        """
+        tileset = cls.__new__(cls)
+        tileset.tms = tms
+
+        merged: dict[int, TileRange] = {}
+        for tile_range in ranges:
+            _, coalesce = tileset._matrix(tile_range.z)
+            # Group the rows with the TileMatrix coalesce factors
+            tile_range = _with_coalesce(tile_range, coalesce)
+            if tile_range.z in merged:
+                tile_range = merged[tile_range.z]._combine(tile_range, "union")
+
+            merged[tile_range.z] = tile_range
+
+        tileset._set_ranges(merged)
+        return tileset
+
+    @classmethod
+    def from_keys(
+        cls, tms: "TileMatrixSet", keys: "numpy.typing.ArrayLike"
+    ) -> "TileSet":
+        """Create a TileSet from packed uint64 tile keys (see `morecantile.keys`, requires numpy).
+
+        Args:
+            tms (TileMatrixSet): TileMatrixSet of the tiles.
+            keys (array_like): Tile keys, in any order and with duplicates.
+
+        Returns:
+            TileSet
+
+        """
+        import numpy as np
+
+        tiles = tms.unpack_tiles(keys)
+
+        tileset = cls.__new__(cls)
+        tileset.tms = tms
+        tileset._ranges = {
+            z: tms._spans_range(
+                tms.matrix(z), tiles[idx, 1], tiles[idx, 0], tiles[idx, 0]
+            )
+            for z in np.unique(tiles[:, 2]).tolist()
+            for idx in [tiles[:, 2] == z]
+        }
+        return tileset
+
+    def _matrix(self, z: int) -> tuple["TileMatrix", tuple | None]:
+        """Get the TileMatrix and its coalesce lookup table."""
+        if z < self.tms.minzoom:
+            raise InvalidZoomError(
+                f"Zoom level {z} is lower than the TileMatrixSet min zoom ({self.tms.minzoom})"
+            )
+
+        matrix = self.tms.matrix(z)
+        coalesce = (
+            matrix._coalesce_lookup if matrix.variableMatrixWidths is not None else None
+        )
+        return matrix, coalesce
+
+    def _set_ranges(self, ranges: Mapping[int, TileRange]) -> None:
+        """Check that the ranges are within their TileMatrix and drop empty ranges."""
+        self._ranges = {}
+        for z in sorted(ranges):
+            tile_range = ranges[z]
+            if not len(tile_range):
+                continue
+
+            matrix, _ = self._matrix(z)
+            blocks = tile_range._blocks
+            outside = blocks[0][0] < 0 or blocks[-1][1] >= matrix.matrixHeight
+            for _, _, spans, cf, _ in blocks:
+                # Coalesced spans end at the last column of their last tile
+                maxx = spans[-1][1] - spans[-1][1] % cf
+                outside |= spans[0][0] < 0 or maxx >= matrix.matrixWidth
+
+            if outside:
+                raise ValueError("Tile indices are outside of the tile matrix")
+
+            self._ranges[z] = tile_range
+
+    def __repr__(self):
+        """Simplify default repr."""
+        return f"<TileSet tms={self.tms.id} zooms={self.zooms} tiles={len(self)}>"
+
+    def __len__(self) -> int:
+        """Number of tiles."""
+        return sum(len(tile_range) for tile_range in self._ranges.values())
+
+    def __iter__(self) -> Iterator[Tile]:
+        """Iterate over the tiles, by zoom level and row by row."""
+        for tile_range in self._ranges.values():
+            yield from tile_range
+
+    def __contains__(self, tile: object) -> bool:
+        """Check if a tile is part of the set."""
+        if not isinstance(tile, tuple) or len(tile) != 3:
+            return False
+
+        tile_range = self._ranges.get(tile[2])
+        return tile_range is not None and tile in tile_range
+
+    def __eq__(self, other: object) -> bool:
+        """Check if two sets have the same TileMatrixSet and tiles."""
+        if not isinstance(other, TileSet):
+            return NotImplemented
+
+        return (
+            self._same_tms(other)
+            and self._ranges.keys() == other._ranges.keys()
+            and all(
+                tile_range._blocks == other._ranges[z]._blocks
+                for z, tile_range in self._ranges.items()
+            )
+        )
+
+    __hash__ = None  # type: ignore[assignment]
+
+    @property
+    def zooms(self) -> list[int]:
+        """Zoom levels with tiles."""
+        return list(self._ranges)
+
+    @property
+    def ranges(self) -> dict[int, TileRange]:
+        """TileRange of each zoom level."""
+        return dict(self._ranges)
+
+    def to_numpy(self) -> "numpy.ndarray":
+        """Get the tiles as a (N, 3) int64 array of X, Y, Z tile indices (requires numpy)."""
+        import numpy as np
+
+        if not self._ranges:
+            return np.empty((0, 3), dtype="int64")
+
+        return np.concatenate(
+            [tile_range.to_numpy() for tile_range in self._ranges.values()]
+        )
+
+    def to_keys(self) -> "numpy.ndarray":
+        """Get the tiles as a sorted uint64 array of packed keys (see `morecantile.keys`, requires numpy)."""
+        import numpy as np
+
+        from morecantile.keys import _check_key_zoom
+
+        for z in self._ranges:
+            _check_key_zoom(z)
+            self.tms._check_keys_matrix(self.tms.matrix(z))
+
+        if not self._ranges:
+            return np.empty(0, dtype="uint64")
+
+        return np.concatenate(
+            [tile_range.to_keys() for tile_range in self._ranges.values()]
+        )
+
+    def _same_tms(self, other: "TileSet") -> bool:
+        """Check if two sets share the same TileMatrixSet."""
+        return self.tms is other.tms or self.tms == other.tms
+
+    def _combine(self, other: "TileSet", operation: str) -> "TileSet":
+        """Apply a set operation, zoom level by zoom level."""
+        if not isinstance(other, TileSet):
+            raise TypeError(f"Expected a TileSet, got {type(other).__name__}")
+
+        if not self._same_tms(other):
+            raise ValueError("TileSets must share the same TileMatrixSet")
+
+        ranges = {}
+        for z in self._ranges.keys() | other._ranges.keys():
+            if z not in other._ranges:
+                if operation != "intersection":
+                    ranges[z] = self._ranges[z]
+
+            elif z not in self._ranges:
+                if operation == "union":
+                    ranges[z] = other._ranges[z]
+
+            else:
+                ranges[z] = self._ranges[z]._combine(other._ranges[z], operation)
+
+        tileset = self.__class__.__new__(self.__class__)
+        tileset.tms = self.tms
+        tileset._ranges = {z: ranges[z] for z in sorted(ranges) if len(ranges[z])}
+        return tileset
+
+    def union(self, other: "TileSet") -> "TileSet":
+        """Tiles in either set."""
+        return self._combine(other, "union")
+
+    def intersection(self, other: "TileSet") -> "TileSet":
+        """Tiles in both sets."""
+        return self._combine(other, "intersection")
+
+    def difference(self, other: "TileSet") -> "TileSet":
+        """Tiles of this set which are not in the other set."""
+        return self._combine(other, "difference")
+
+    def __or__(self, other: "TileSet") -> "TileSet":
+        """Union."""
+        if not isinstance(other, TileSet):
+            return NotImplemented
+
+        return self.union(other)
+
+    def __and__(self, other: "TileSet") -> "TileSet":
+        """Intersection."""
+        if not isinstance(other, TileSet):
+            return NotImplemented
+
+        return self.intersection(other)
+
+    def __sub__(self, other: "TileSet") -> "TileSet":
+        """Difference."""
+        if not isinstance(other, TileSet):
+            return NotImplemented
+
+        return self.difference(other)
+
+
+def _with_coalesce(tile_range: TileRange, coalesce: tuple | None) -> TileRange:
+    """Group the rows of a TileRange with another coalesce lookup table."""
+    if tile_range._coalesce == coalesce:
+        return tile_range
+
+    regrouped = TileRange.__new__(TileRange)
+    regrouped.z = tile_range.z
+    regrouped._set_blocks(
+        ((miny, maxy, spans) for miny, maxy, spans, _, _ in tile_range._blocks),
+        coalesce,
+    )
+    return regrouped
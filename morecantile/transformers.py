@@ -0,0 +1,367 @@
+"""Morecantile coordinate transformers.
+
+Closed-form transformers used in place of `pyproj.Transformer` when the
+transformation between a TileMatrixSet CRS and its geographic CRS can be
+expressed analytically. They implement the subset of the `pyproj.Transformer`
+API used by morecantile (`transform` and `transform_bounds`) and accept
+python scalars or numpy arrays.
+
+Transformers returned by `transformer_from_crs` are cached per thread, so
+`pyproj.Transformer` objects are never shared between threads.
+
+"""
+
+import math
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any
+
+import pyproj
+
+from morecantile.utils import crs_from_epsg
+
+# Kept for backward compatibility, use `transformer_from_crs`
+TransformerFromCRS = lru_cache(pyproj.Transformer.from_crs)
+
+# EPSG:3857 sphere radius (WGS84 semi-major axis)
+EARTH_RADIUS = 6378137.0
+# Half of the EPSG:3857 projected extent (pi * R)
+WEB_MERCATOR_EXTENT = math.pi * EARTH_RADIUS
+
+# Same constants and tolerances as PROJ so results match `pyproj`
+DEG_TO_RAD = math.pi / 180.0
+RAD_TO_DEG = 180.0 / math.pi
+INV_EARTH_RADIUS = 1.0 / EARTH_RADIUS
+EPS_LAT = 1e-12
+
+
+def _is_scalar(*values: Any) -> bool:
+    """Check if all the values are python or numpy scalars (or 0-d arrays)."""
+    return all(
+        isinstance(v, (int, float)) or getattr(v, "ndim", None) == 0 for v in values
+    )
+
+
+def _adjlon(lam: float) -> float:
+    """Reduce longitude (in radians) to the [-pi, pi] range, like PROJ's adjlon."""
+    if abs(lam) < math.pi + 1e-12:
+        return lam
+
+    lam += math.pi
+    lam -= 2 * math.pi * math.floor(lam / (2 * math.pi))
+    return lam - math.pi
+
+
+def _same_transformation(tr: Any, other: Any) -> bool:
+    """Check if two closed-form transformers have the same type and CRS."""
+    return (
+        type(tr) is type(other)
+        and tr.crs_from == other.crs_from
+        and tr.crs_to == other.crs_to
+    )
+
+
+class IdentityTransformer:
+    """No-op transformer between equivalent CRS (ignoring axis order).
+
+    Attributes
+    ----------
+    crs_from, crs_to: pyproj.CRS
+        Source and target CRS.
+
+    """
+
+    def __init__(self, crs_from: pyproj.CRS, crs_to: pyproj.CRS):
+        """Set source and target CRS."""
+        self.crs_from = crs_from
+        self.crs_to = crs_to
+
+    def __repr__(self):
+        """Transformer repr."""
+        return "<IdentityTransformer>"
+
+    def __eq__(self, other: object) -> bool:
+        """Transformers are equal if they have the same type and CRS."""
+        return _same_transformation(self, other)
+
+    __hash__ = None  # type: ignore
+
+    def transform(self, xx: Any, yy: Any, **kwargs: Any) -> tuple[Any, Any]:
+        """Transform points."""
+        if _is_scalar(xx, yy):
+            return float(xx), float(yy)
+
+        import numpy as np
+
+        return np.array(xx, dtype="float64"), np.array(yy, dtype="float64")
+
+    def transform_bounds(
+        self,
+        left: float,
+        bottom: float,
+        right: float,
+        top: float,
+        densify_pts: int = 21,
+        **kwargs: Any,
+    ) -> tuple[float, float, float, float]:
+        """Transform bounds."""
+        return float(left), float(bottom), float(right), float(top)
+
+
+class WebMercatorTransformer:
+    """Closed-form transformer between EPSG:3857 and WGS84 longitude/latitude.
+
+    Attributes
+    ----------
+    crs_from, crs_to: pyproj.CRS
+        Source and target CRS. One must be EPSG:3857 and the other WGS84.
+
+    Notes
+    -----
+    Scalar inputs are transformed with the python `math` module and give the
+    same results as PROJ. Array inputs are transformed with numpy, for which
+    results might differ from PROJ in the last digits (< 1e-8 meter).
+
+    """
+
+    def __init__(self, crs_from: pyproj.CRS, crs_to: pyproj.CRS):
+        """Set source and target CRS."""
+        self.crs_from = crs_from
+        self.crs_to = crs_to
+        self.inverse = is_web_mercator(crs_from)
+
+    def __repr__(self):
+        """Transformer repr."""
+        direction = "inverse" if self.inverse else "forward"
+        return f"<WebMercatorTransformer direction='{direction}'>"
+
+    def __eq__(self, other: object) -> bool:
+        """Transformers are equal if they have the same type and CRS."""
+        return _same_transformation(self, other)
+
+    __hash__ = None  # type: ignore
+
+    @property
+    def _transformer(self) -> pyproj.Transformer:
+        """pyproj Transformer, used for edge cases in `transform_bounds`."""
+        return pyproj_transformer(self.crs_from, self.crs_to)
+
+    def transform(self, xx: Any, yy: Any, **kwargs: Any) -> tuple[Any, Any]:
+        """Transform points."""
+        if _is_scalar(xx, yy):
+            xx, yy = float(xx), float(yy)
+            return (
+                self._inverse_scalar(xx, yy)
+                if self.inverse
+                else self._forward_scalar(xx, yy)
+            )
+
+        return (
+            self._inverse_array(xx, yy) if self.inverse else self._forward_array(xx, yy)
+        )
+
+    def transform_bounds(
+        self,
+        left: float,
+        bottom: float,
+        right: float,
+        top: float,
+        densify_pts: int = 21,
+        **kwargs: Any,
+    ) -> tuple[float, float, float, float]:
+        """Transform bounds.
+
+        Both projection axes are independent and monotonic so the bounds are
+        given by the transformed corners, as long as they are within the
+        projection's validity domain.
+
+        """
+        if self.inverse:
+            valid = (
+                -WEB_MERCATOR_EXTENT <= left <= right <= WEB_MERCATOR_EXTENT
+                and bottom <= top
+                and math.isfinite(bottom)
+                and math.isfinite(top)
+            )
+        else:
+            valid = -180.0 <= left <= right <= 180.0 and -90.0 <= bottom <= top <= 90.0
+
+        if not valid:
+            return self._transformer.transform_bounds(
+                left, bottom, right, top, densify_pts=densify_pts, **kwargs
+            )
+
+        xmin, ymin = self.transform(left, bottom)
+        xmax, ymax = self.transform(right, top)
+        return xmin, ymin, xmax, ymax
+
+    @staticmethod
+    def _forward_scalar(lng: float, lat: float) -> tuple[float, float]:
+        """Longitude/Latitude to Web Mercator."""
+        lam = lng * DEG_TO_RAD
+        phi = lat * DEG_TO_RAD
+        if math.isnan(lam) or math.isnan(phi):
+            return math.nan, math.nan
+
+        if not (math.isfinite(lam) and math.isfinite(phi)):
+            return math.inf, math.inf
+
+        if abs(phi) - math.pi / 2 > EPS_LAT or abs(lam) > 10:
+            return math.inf, math.inf
+
+        phi = max(-math.pi / 2, min(phi, math.pi / 2))
+        lam = _adjlon(lam)
+        return EARTH_RADIUS * lam, EARTH_RADIUS * math.asinh(math.tan(phi))
+
+    @staticmethod
+    def _inverse_scalar(x: float, y: float) -> tuple[float, float]:
+        """Web Mercator to Longitude/Latitude."""
+        if math.isnan(x) or math.isnan(y):
+            return math.nan, math.nan
+
+        if not (math.isfinite(x) and math.isfinite(y)):
+            return math.inf, math.inf
+
+        lam = _adjlon(x * INV_EARTH_RADIUS)
+        phi = math.atan(math.sinh(y * INV_EARTH_RADIUS))
+        return lam * RAD_TO_DEG, phi * RAD_TO_DEG
+
+    @staticmethod
+    def _forward_array(lng: Any, lat: Any) -> tuple[Any, Any]:
+        """Longitude/Latitude arrays to Web Mercator."""
+        import numpy as np
+
+        lam = np.asarray(lng, dtype="float64") * DEG_TO_RAD
+        phi = np.asarray(lat, dtype="float64") * DEG_TO_RAD
+
+        with np.errstate(invalid="ignore"):
+            nan = np.isnan(lam) | np.isnan(phi)
+            invalid = (
+                ~np.isfinite(lam)
+                | ~np.isfinite(phi)
+                | (np.abs(phi) - math.pi / 2 > EPS_LAT)
+                | (np.abs(lam) > 10)
+            )
+            phi = np.clip(phi, -math.pi / 2, math.pi / 2)
+            lam = np.where(
+                np.abs(lam) < math.pi + 1e-12,
+                lam,
+                np.mod(lam + math.pi, 2 * math.pi) - math.pi,
+            )
+
+            x = EARTH_RADIUS * lam
+            y = EARTH_RADIUS * np.arcsinh(np.tan(phi))
+
+        # Same as PROJ: NaN for NaN inputs and inf for the other invalid inputs
+        nodata = np.where(nan, np.nan, np.inf)
+        return np.where(invalid, nodata, x), np.where(invalid, nodata, y)
+
+    @staticmethod
+    def _inverse_array(x: Any, y: Any) -> tuple[Any, Any]:
+        """Web Mercator arrays to Longitude/Latitude."""
+        import numpy as np
+
+        x = np.asarray(x, dtype="float64")
+        y = np.asarray(y, dtype="float64")
+
+        with np.errstate(invalid="ignore", over="ignore"):
+            nan = np.isnan(x) | np.isnan(y)
+            invalid = ~np.isfinite(x) | ~np.isfinite(y)
+            lam = x * INV_EARTH_RADIUS
+            lam = np.where(
+                np.abs(lam) < math.pi + 1e-12,
+                lam,
+                np.mod(lam + math.pi, 2 * math.pi) - math.pi,
+            )
+
+            lng = lam * RAD_TO_DEG
+            lat = np.arctan(np.sinh(y * INV_EARTH_RADIUS)) * RAD_TO_DEG
+
+        # Same as PROJ: NaN for NaN inputs and inf for the other invalid inputs
+        nodata = np.where(nan, np.nan, np.inf)
+        return np.where(invalid, nodata, lng), np.where(invalid, nodata, lat)
+
+
+def is_web_mercator(crs: pyproj.CRS) -> bool:
+    """Check if a CRS is EPSG:3857."""
+    return crs == crs_from_epsg(3857)
+
+
+def is_wgs84(crs: pyproj.CRS) -> bool:
+    """Check if a CRS is WGS84 (ignoring axis order)."""
+    return crs.equals(crs_from_epsg(4326), ignore_axis_order=True)
+
+
+def closed_form_transformer(
+    crs_from: pyproj.CRS, crs_to: pyproj.CRS
+) -> IdentityTransformer | WebMercatorTransformer | None:
+    """Get a closed-form transformer (with always_xy=True) between two CRS, if any."""
+    # Same CRS or axis-swap only (always_xy=True makes it a no-op)
+    if crs_from.equals(crs_to, ignore_axis_order=True):
+        return IdentityTransformer(crs_from, crs_to)
+
+    if (is_web_mercator(crs_from) and is_wgs84(crs_to)) or (
+        is_wgs84(crs_from) and is_web_mercator(crs_to)
+    ):
+        return WebMercatorTransformer(crs_from, crs_to)
+
+    return None
+
+
+# Maximum number of transformers kept (per thread) by `transformer_from_crs`
+TRANSFORMER_CACHE_SIZE = 128
+
+_local = threading.local()
+
+
+def _thread_transformers() -> OrderedDict[tuple[str, str, bool], Any]:
+    """Return the transformers cache of the current thread."""
+    try:
+        return _local.transformers
+    except AttributeError:
+        _local.transformers = OrderedDict()
+        return _local.transformers
+
+
+def _cached_transformer(
+    crs_from: pyproj.CRS, crs_to: pyproj.CRS, closed_form: bool = True
+) -> Any:
+    """Get a transformer from the current thread's cache (LRU)."""
+    # CRS definitions (`CRS.srs`) are used as keys because hashing
+    # `pyproj.CRS` objects is slow (WKT export)
+    key = (crs_from.srs, crs_to.srs, closed_form)
+    transformers = _thread_transformers()
+    if (transformer := transformers.get(key)) is not None:
+        transformers.move_to_end(key)
+        return transformer
+
+    transformer = (
+        closed_form and closed_form_transformer(crs_from, crs_to)
+    ) or pyproj.Transformer.from_crs(crs_from, crs_to, always_xy=True)
+
+    transformers[key] = transformer
+    if len(transformers) > TRANSFORMER_CACHE_SIZE:
+        transformers.popitem(last=False)
+
+    return transformer
+
+
+def pyproj_transformer(crs_from: pyproj.CRS, crs_to: pyproj.CRS) -> pyproj.Transformer:
+    """Get a `pyproj.Transformer` (with always_xy=True) between two CRS.
+
+    Transformers are cached per thread.
+
+    """
+    return _cached_transformer(crs_from, crs_to, closed_form=False)
+
+
+def transformer_from_crs(crs_from: pyproj.CRS, crs_to: pyproj.CRS) -> Any:
+    """Get a transformer (with always_xy=True) between two CRS.
+
+    Closed-form transformers are returned for known transformations,
+    otherwise a `pyproj.Transformer` is returned. Transformers are cached
+    per thread.
+
+    """
+    return _cached_transformer(crs_from, crs_to)
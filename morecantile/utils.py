@@ -1,6 +1,8 @@
 """morecantile utils."""
 
 import math
+from functools import lru_cache
+from typing import TYPE_CHECKING
 
 from pyproj import CRS
 from pyproj.enums import WktVersion
@@ -8,6 +10,10 @@ from pyproj.enums import WktVersion
 from morecantile.commons import BoundingBox, Coords, Tile
 from morecantile.errors import TileArgParsingError
 
+if TYPE_CHECKING:
+    import numpy
+    import numpy.typing
+
 
 def _parse_tile_arg(*args) -> Tile:
     """
@@ -39,6 +45,53 @@ def _parse_tile_arg(*args) -> Tile:
         )
 
 
+def _parse_tile_arrays(
+    x, y=None, z=None
+) -> tuple["numpy.ndarray", "numpy.ndarray", "numpy.ndarray"]:
+    """
+    Parse the tile arrays of vectorized functions
+
+    Parameters
+    ----------
+    x : array_like
+        Either the X indices (with `y` and `z`) or a (N, 3) array of X, Y, Z.
+    y, z : array_like, optional
+        Y indices and zoom levels. Scalars are broadcasted.
+
+    Returns
+    -------
+    tuple of three 1D int64 arrays (x, y, z)
+
+    Raises
+    ------
+    TileArgParsingError
+
+    """
+    import numpy as np
+
+    if y is None and z is None:
+        tiles = np.asarray(x, dtype="int64")
+        if tiles.size == 0:
+            tiles = tiles.reshape(0, 3)
+        if tiles.ndim != 2 or tiles.shape[1] != 3:
+            raise TileArgParsingError(
+                "the tiles argument must be a (N, 3) array of X, Y, Z or 3 arrays"
+            )
+        return tiles[:, 0], tiles[:, 1], tiles[:, 2]
+
+    if y is None or z is None:
+        raise TileArgParsingError(
+            "the tiles argument must be a (N, 3) array of X, Y, Z or 3 arrays"
+        )
+
+    xs, ys, zs = np.broadcast_arrays(
+        np.asarray(x, dtype="int64"),
+        np.asarray(y, dtype="int64"),
+        np.asarray(z, dtype="int64"),
+    )
+    return xs.ravel(), ys.ravel(), zs.ravel()
+
+
 def lons_contain_antimeridian(lon1: float, lon2: float) -> bool:
     """
     Check if the antimeridian (180th meridian) is between two longitude points
@@ -63,6 +116,12 @@ def lons_contain_antimeridian(lon1: float, lon2: float) -> bool:
     return ws[0] < 180 < ws[1]
 
 
+@lru_cache
+def crs_from_epsg(code: int) -> CRS:
+    """Create a pyproj CRS from an EPSG code (cached, so CRS are only created on first use)."""
+    return CRS.from_epsg(code)
+
+
 def meters_per_unit(crs: CRS) -> float:
     """
     Coefficient to convert the coordinate reference system (CRS)
@@ -109,6 +168,22 @@ def point_in_bbox(point: Coords, bbox: BoundingBox, precision: int = 5) -> bool:
     )
 
 
+def points_in_bbox(
+    xs: "numpy.ndarray", ys: "numpy.ndarray", bbox: BoundingBox, precision: int = 5
+) -> "numpy.ndarray":
+    """Check if points are in a bounding box (vectorized `point_in_bbox`)."""
+    import numpy as np
+
+    xs = np.round(xs, precision)
+    ys = np.round(ys, precision)
+    return (
+        (xs >= round(bbox.left, precision))
+        & (xs <= round(bbox.right, precision))
+        & (ys >= round(bbox.bottom, precision))
+        & (ys <= round(bbox.top, precision))
+    )
+
+
 def truncate_coordinates(
     lng: float, lat: float, bbox: BoundingBox
 ) -> tuple[float, float]:
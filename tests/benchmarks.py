@@ -1,9 +1,13 @@
 """Morecantile benchmark."""
 
+import subprocess
+import sys
+
 import pytest
 
 import morecantile
 from morecantile.commons import BoundingBox
+from morecantile.utils import crs_from_epsg
 
 tms = morecantile.tms.get("WebMercatorQuad")
 
@@ -41,3 +45,49 @@ def test_xy_bounds(tile, benchmark) -> None:
 
     r = benchmark(tms.xy_bounds, *tile)
     assert isinstance(r, BoundingBox)
+
+
+@pytest.mark.parametrize(
+    "statement",
+    [
+        "import morecantile",
+        "import morecantile; morecantile.tms.get('WebMercatorQuad')",
+    ],
+)
+def test_import_time(statement, benchmark) -> None:
+    benchmark.name = f"morecantile.import-{statement}"
+    benchmark.fullname = f"morecantile.import-{statement}"
+    benchmark.group = "morecantile.import"
+
+    r = benchmark.pedantic(
+        subprocess.run, args=([sys.executable, "-c", statement],), rounds=10
+    )
+    assert r.returncode == 0
+
+
+nztm_tms = morecantile.tms.get("NZTM2000Quad")
+WGS84_CRS = crs_from_epsg(4326)
+
+
+@pytest.mark.parametrize(
+    "geographic_crs", [None, WGS84_CRS], ids=["default", "geographic_crs"]
+)
+def test_transformer_lookup(geographic_crs, benchmark) -> None:
+    benchmark.name = f"morecantile.transformers-{benchmark.name}"
+    benchmark.fullname = f"morecantile.transformers-{benchmark.name}"
+    benchmark.group = "morecantile.transformers"
+
+    r = benchmark(nztm_tms._geographic_transformers, geographic_crs)
+    assert len(r) == 2
+
+
+@pytest.mark.parametrize(
+    "geographic_crs", [None, WGS84_CRS], ids=["default", "geographic_crs"]
+)
+def test_tile(geographic_crs, benchmark) -> None:
+    benchmark.name = f"morecantile.tile-{benchmark.name}"
+    benchmark.fullname = f"morecantile.tile-{benchmark.name}"
+    benchmark.group = "morecantile.tile"
+
+    r = benchmark(nztm_tms.tile, 172.0, -41.0, 10, geographic_crs=geographic_crs)
+    assert r
@@ -201,6 +201,58 @@ def test_cli_tiles_geosjon():
     assert result.output == "[106, 193, 9]\n[106, 194, 9]\n"
 
 
+def test_cli_tiles_exact():
+    """Only list the tiles intersecting the geometry."""
+    pytest.importorskip("numpy")
+
+    triangle = '{"type": "Polygon", "coordinates": [[[-105, 39.9], [-104.9, 39.9], [-105, 40], [-105, 39.9]]]}'
+    runner = CliRunner()
+    result = runner.invoke(cli, ["tiles", "13"], triangle)
+    assert result.exit_code == 0
+    assert len(result.output.strip().split("\n")) == 12
+
+    result = runner.invoke(cli, ["tiles", "13", "--exact"], triangle)
+    assert result.exit_code == 0
+    assert len(result.output.strip().split("\n")) == 10
+    assert "[1708, 3101, 13]" not in result.output
+    assert "[1708, 3102, 13]" not in result.output
+
+    # Lines only list the tiles they cross
+    line = '{"type": "Feature", "geometry": {"type": "LineString", "coordinates": [[-105, 39.9], [-104.9, 40]]}, "properties": {}}'
+    result = runner.invoke(cli, ["tiles", "13"], line)
+    assert result.exit_code == 0
+    assert len(result.output.strip().split("\n")) == 12
+
+    result = runner.invoke(cli, ["tiles", "13", "--exact"], line)
+    assert result.exit_code == 0
+    assert len(result.output.strip().split("\n")) == 6
+    assert "[1706, 3104, 13]" in result.output
+    assert "[1708, 3101, 13]" in result.output
+    assert "[1706, 3101, 13]" not in result.output
+
+    # Points use the bounding box path
+    point = '{"type": "Feature", "geometry": {"type": "MultiPoint", "coordinates": [[14.0859, 5.798], [14.0859, 5.798]]}, "properties": {}}'
+    result = runner.invoke(cli, ["tiles", "14", "--exact", "--seq"], point)
+    assert result.exit_code == 0
+    assert result.output == "\x1e\n[8833, 7927, 14]\n"
+
+    collection = {
+        "type": "GeometryCollection",
+        "geometries": [
+            json.loads(triangle),
+            {"type": "Point", "coordinates": [14.0859, 5.798]},
+        ],
+    }
+    result = runner.invoke(cli, ["tiles", "13", "--exact"], json.dumps(collection))
+    assert result.exit_code == 0
+    assert len(result.output.strip().split("\n")) == 11
+
+    invalid = '{"type": "Polyhedron", "coordinates": []}'
+    result = runner.invoke(cli, ["tiles", "13", "--exact"], invalid)
+    assert result.exit_code == 2
+    assert "Invalid geometry type" in result.output
+
+
 def test_cli_strict_overlap_contain():
     """Input from shapes."""
     runner = CliRunner()
@@ -231,3 +283,13 @@ def test_cli_tiles_points():
     )
     assert result.exit_code == 0
     assert result.output == "[8833, 7927, 14]\n"
+
+
+def test_cli_compile_tms(tmp_path):
+    """Test compile-tms."""
+    output = tmp_path / "tms.pickle"
+    runner = CliRunner()
+    result = runner.invoke(cli, ["compile-tms", "--output", str(output)])
+    assert result.exit_code == 0
+    assert result.output == f"{output}\n"
+    assert output.exists()
@@ -0,0 +1,80 @@
+"""Test compiled TMS registry."""
+
+import pathlib
+from copy import copy
+
+import pytest
+
+import morecantile
+from morecantile import compiled
+from morecantile.defaults import TileMatrixSets, default_tms
+
+data_dir = pathlib.Path(morecantile.__file__).parent.joinpath("data")
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """Clear compiled registry cache."""
+    compiled._load_compiled.cache_clear()
+    yield
+    compiled._load_compiled.cache_clear()
+
+
+def test_compile_tms(tmp_path):
+    """Should load TMS from the compiled registry."""
+    output = compiled.compile_tms(output=tmp_path / "tms.pickle")
+    assert output == tmp_path / "tms.pickle"
+    assert list(tmp_path.iterdir()) == [output]
+
+    for path in sorted(data_dir.glob("*.json")):
+        tms = compiled.load_tms(path, compiled=output)
+        # Derived properties are stored in the compiled registry
+        assert "xy_bbox" in tms.__dict__
+        assert "is_quadtree" in tms.__dict__
+
+        ref = morecantile.TileMatrixSet.model_validate_json(path.read_text())
+        assert tms == ref
+        assert tms.xy_bbox == ref.xy_bbox
+        assert tms.bbox == ref.bbox
+        assert tms.geographic_crs == ref.geographic_crs
+        assert tms._to_geographic == ref._to_geographic
+
+
+def test_compile_tms_stale(tmp_path, monkeypatch):
+    """Should fall back to the JSON documents when the registry is stale."""
+    path = tmp_path / "WebMercatorQuad.json"
+    path.write_bytes(data_dir.joinpath("WebMercatorQuad.json").read_bytes())
+
+    output = compiled.compile_tms([path], output=tmp_path / "tms.pickle")
+    assert "xy_bbox" in compiled.load_tms(path, compiled=output).__dict__
+
+    # Document has changed
+    path.write_text(path.read_text().replace("Google Maps Compatible", "Updated"))
+    tms = compiled.load_tms(path, compiled=output)
+    assert "xy_bbox" not in tms.__dict__
+    assert tms.title == "Updated for the World"
+
+    # Different versions
+    compiled.compile_tms([path], output=output)
+    monkeypatch.setattr(compiled, "COMPILED_TMS_VERSION", 0)
+    compiled._load_compiled.cache_clear()
+    assert "xy_bbox" not in compiled.load_tms(path, compiled=output).__dict__
+
+    # Invalid/Missing files
+    output.write_bytes(b"not a pickle")
+    compiled._load_compiled.cache_clear()
+    assert compiled.load_tms(path, compiled=output).id == "WebMercatorQuad"
+
+    missing = tmp_path / "missing.pickle"
+    assert compiled.load_tms(path, compiled=missing).id == "WebMercatorQuad"
+
+
+def test_registry_compiled(tmp_path, monkeypatch):
+    """TileMatrixSets should use the compiled registry."""
+    output = compiled.compile_tms(output=tmp_path / "tms.pickle")
+    monkeypatch.setattr(compiled, "compiled_tms_path", output)
+
+    tilematrixsets = TileMatrixSets(copy(default_tms))
+    tms = tilematrixsets.get("WebMercatorQuad")
+    assert "xy_bbox" in tms.__dict__
+    assert tms == morecantile.tms.get("WebMercatorQuad")
@@ -0,0 +1,330 @@
+"""Test geometry cover."""
+
+import pytest
+
+import morecantile
+from morecantile.commons import Tile
+from morecantile.cover import _clip_ring, merge_spans
+
+np = pytest.importorskip("numpy")
+
+
+def _polygon(*rings):
+    return {"type": "Polygon", "coordinates": [list(ring) for ring in rings]}
+
+
+def _tile_ring(tms, *tiles):
+    """Polygon ring of the bounds of tiles."""
+    bounds = [tms.bounds(tile) for tile in tiles]
+    w = min(b.left for b in bounds)
+    s = min(b.bottom for b in bounds)
+    e = max(b.right for b in bounds)
+    n = max(b.top for b in bounds)
+    return [(w, s), (e, s), (e, n), (w, n), (w, s)]
+
+
+def _points_in_ring(x, y, ring):
+    """Even-odd point in polygon."""
+    inside = np.zeros(len(x), dtype=bool)
+    for (x0, y0), (x1, y1) in zip(ring[:-1], ring[1:]):
+        if y0 == y1:
+            continue
+        inside ^= ((y0 > y) != (y1 > y)) & (x < (x1 - x0) * (y - y0) / (y1 - y0) + x0)
+    return inside
+
+
+@pytest.mark.parametrize(
+    "identifier", ["WebMercatorQuad", "WorldCRS84Quad", "GNOSISGlobalGrid"]
+)
+def test_geometry_tiles_tile(identifier):
+    """Tile bounds should only cover the tile (and its children)."""
+    tms = morecantile.tms.get(identifier)
+    matrix = tms.matrix(5)
+    tile = Tile(matrix.matrixWidth // 2, matrix.matrixHeight // 2, 5)
+    geom = _polygon(_tile_ring(tms, tile))
+
+    parent, this, children = tms.geometry_tiles(geom, [4, 5, 6])
+    assert list(parent) == [tms.parent(tile)[0]]
+    assert list(this) == [tile]
+    assert sorted(children) == sorted(tms.children(tile))
+
+
+def test_geometry_tiles_triangle():
+    """Right triangle with its hypotenuse on the tiles corners."""
+    tms = morecantile.tms.get("WorldCRS84Quad")
+    ul = tms.ul(0, 0, 5)
+    lr = tms.ul(8, 8, 5)
+    geom = _polygon([(ul.x, ul.y), (lr.x, ul.y), (ul.x, lr.y), (ul.x, ul.y)])
+
+    (tiles,) = tms.geometry_tiles(geom, 5)
+    assert len(tiles) == 36
+    assert {t.x + t.y for t in tiles} == set(range(8))
+
+
+def test_geometry_tiles_holes():
+    """Tiles within holes should be excluded."""
+    tms = morecantile.tms.get("WebMercatorQuad")
+    outer = _tile_ring(tms, Tile(0, 0, 4), Tile(3, 3, 4))
+    hole = _tile_ring(tms, Tile(1, 1, 4), Tile(2, 2, 4))
+    (tiles,) = tms.geometry_tiles(_polygon(outer, hole[::-1]), 4)
+    assert len(tiles) == 12
+    assert Tile(1, 1, 4) not in tiles
+    assert Tile(2, 2, 4) not in tiles
+
+    # overlapping polygons
+    geom = {
+        "type": "MultiPolygon",
+        "coordinates": [[outer], [_tile_ring(tms, Tile(1, 1, 4), Tile(2, 2, 4))]],
+    }
+    (tiles,) = tms.geometry_tiles(geom, 4)
+    assert len(tiles) == 16
+
+    collection = {
+        "type": "FeatureCollection",
+        "features": [
+            {"type": "Feature", "geometry": _polygon(outer, hole), "properties": {}},
+            {"type": "Feature", "geometry": _polygon(hole), "properties": {}},
+        ],
+    }
+    assert list(tms.geometry_tiles(collection, 4)[0]) == list(tiles)
+
+    with pytest.raises(ValueError):
+        tms.geometry_tiles({"type": "LineString", "coordinates": outer}, 4)
+
+
+@pytest.mark.parametrize(
+    "identifier,ring,zooms",
+    [
+        (
+            "WebMercatorQuad",
+            [(-10, 40), (10, 60), (12, 58), (-8, 38), (-10, 40)],
+            [3, 6, 9],
+        ),
+        (
+            "NZTM2000Quad",
+            [(166, -47), (179, -34), (178, -33), (172, -40), (166, -47)],
+            [4, 7, 10],
+        ),
+        (
+            "GNOSISGlobalGrid",
+            [(-30, 60), (30, 89), (35, 80), (-20, 50), (-30, 60)],
+            [3, 5, 7],
+        ),
+        ("CDB1GlobalGrid", [(-3, 85), (3, 89), (3, 86), (-3, 85)], [2, 4]),
+    ],
+)
+def test_geometry_tiles_cover(identifier, ring, zooms):
+    """Should include the tiles of all the points inside the geometry."""
+    tms = morecantile.tms.get(identifier)
+    xs, ys = zip(*ring)
+    bbox = (min(xs), min(ys), max(xs), max(ys))
+
+    rng = np.random.default_rng(0)
+    lng = rng.uniform(bbox[0], bbox[2], 50000)
+    lat = rng.uniform(bbox[1], bbox[3], 50000)
+    inside = _points_in_ring(lng, lat, ring)
+    lng, lat = lng[inside], lat[inside]
+
+    for tiles in tms.geometry_tiles(_polygon(ring), zooms):
+        points_tiles = {
+            Tile(*t) for t in tms.tile_many(lng, lat, tiles.z, ignore_coalescence=False)
+        }
+        assert all(t in tiles for t in points_tiles)
+
+
+@pytest.mark.parametrize("identifier", ["WebMercatorQuad", "GNOSISGlobalGrid"])
+def test_geometry_tiles_world(identifier):
+    """A world polygon should cover all the tiles."""
+    tms = morecantile.tms.get(identifier)
+    geom = _polygon([(-180, -90), (180, -90), (180, 90), (-180, 90), (-180, -90)])
+    counts = tms.count_tiles(-180, -90, 180, 90, [0, 1, 2, 3, 4])
+    assert {
+        tiles.z: len(tiles) for tiles in tms.geometry_tiles(geom, [0, 1, 2, 3, 4])
+    } == counts
+
+
+def test_clip_ring():
+    """Should clip ring to bbox."""
+    ring = [(-10, -10), (10, -10), (10, 10), (-10, 10), (-10, -10)]
+    assert _clip_ring(ring, (0, 0, 20, 20)) == [
+        (0, 0),
+        (10, 0),
+        (10, 10),
+        (0, 10),
+        (0, 0),
+    ]
+    assert _clip_ring(ring, (20, 20, 30, 30)) == []
+
+
+def test_merge_spans():
+    """Should merge overlapping or adjacent spans."""
+    rows, starts, ends = merge_spans(
+        np.array([1, 0, 0, 0, 1]),
+        np.array([-2, 5, 0, 3, 6]),
+        np.array([3, 6, 2, 3, 12]),
+        width=10,
+    )
+    assert rows.tolist() == [0, 0, 1, 1]
+    assert starts.tolist() == [0, 5, 0, 6]
+    assert ends.tolist() == [3, 6, 3, 9]
+
+
+def test_line_tiles_grid():
+    """Lines on the tiles edges or corners should touch the adjacent tiles."""
+    tms = morecantile.tms.get("WorldCRS84Quad")
+    ul = tms.ul(0, 0, 5)
+    lr = tms.ul(8, 8, 5)
+    (tiles,) = tms.line_tiles(
+        {"type": "LineString", "coordinates": [[ul.x, ul.y], [lr.x, lr.y]]}, 5
+    )
+    assert {(t.x, t.y) for t in tiles} == {
+        (x, y) for x in range(9) for y in range(9) if abs(x - y) <= 1
+    }
+
+    tms = morecantile.tms.get("WebMercatorQuad")
+    (tiles,) = tms.line_tiles(
+        {"type": "LineString", "coordinates": [[1, 0], [20, 0]]}, 4
+    )
+    assert list(tiles) == [Tile(8, 7, 4), Tile(8, 8, 4)]
+
+    (tiles,) = tms.line_tiles({"type": "LineString", "coordinates": [[1.5, 10.2]]}, 10)
+    assert list(tiles) == [tms.tile(1.5, 10.2, 10)]
+
+
+def test_line_tiles_batch():
+    """Should accept many lines and deduplicate the tiles."""
+    tms = morecantile.tms.get("WebMercatorQuad")
+    line = [[1, 10], [20, 10]]
+    multi = {"type": "MultiLineString", "coordinates": [[[-50, -50], [-49, -49]]]}
+    (tiles,) = tms.line_tiles(
+        [line, {"type": "LineString", "coordinates": line}, multi], 4
+    )
+    assert list(tiles) == [Tile(8, 7, 4), Tile(5, 10, 4)]
+
+    collection = {
+        "type": "FeatureCollection",
+        "features": [
+            {"type": "Feature", "geometry": multi, "properties": {}},
+            {
+                "type": "Feature",
+                "geometry": {"type": "LineString", "coordinates": line},
+            },
+        ],
+    }
+    assert list(tms.line_tiles(collection, 4)[0]) == list(tiles)
+
+    assert [len(t) for t in tms.line_tiles([], [2, 3])] == [0, 0]
+
+    with pytest.raises(ValueError):
+        tms.line_tiles(_polygon(line + [[1, 10]]), 4)
+
+
+@pytest.mark.parametrize(
+    "identifier,zooms",
+    [
+        ("WebMercatorQuad", [4, 10, 14]),
+        ("NZTM2000Quad", [4, 8, 12]),
+        ("GNOSISGlobalGrid", [3, 6, 9]),
+    ],
+)
+def test_line_tiles_cover(identifier, zooms):
+    """Should include the tiles of all the points along the lines."""
+    tms = morecantile.tms.get(identifier)
+    t = np.linspace(0, 1, 100)
+    if identifier == "NZTM2000Quad":
+        coords = np.column_stack([167 + 11 * t, -46 + 12 * t + np.sin(t * 20)])
+    else:
+        coords = np.column_stack([-170 + 340 * t, 10 + 75 * np.sin(t * 9)])
+    line = {"type": "LineString", "coordinates": coords.tolist()}
+
+    s = np.linspace(0, 1, 200)[:, None]
+    lng = (coords[:-1, 0] + (coords[1:, 0] - coords[:-1, 0]) * s).ravel()
+    lat = (coords[:-1, 1] + (coords[1:, 1] - coords[:-1, 1]) * s).ravel()
+
+    for tiles in tms.line_tiles(line, zooms):
+        points_tiles = {
+            Tile(*t) for t in tms.tile_many(lng, lat, tiles.z, ignore_coalescence=False)
+        }
+        assert all(t in tiles for t in points_tiles)
+        # straight segments in geographic coordinates are not straight in the
+        # TMS CRS, so only check the cover is not much larger than needed
+        assert len(tiles) < 3 * len(points_tiles) + 10
+
+
+def _expand_pyramid(pyramid, zoom):
+    """Tiles of a pyramid at a zoom level."""
+    tiles = set()
+    for tile, full in pyramid:
+        d = zoom - tile.z
+        if d == 0 or (d > 0 and full):
+            tiles |= {
+                Tile(x, y, zoom)
+                for x in range(tile.x << d, (tile.x + 1) << d)
+                for y in range(tile.y << d, (tile.y + 1) << d)
+            }
+    return tiles
+
+
+@pytest.mark.parametrize(
+    "identifier,geom,minzoom,maxzoom",
+    [
+        (
+            "WebMercatorQuad",
+            _polygon([(-10, 40), (10, 60), (12, 58), (-8, 38), (-10, 40)]),
+            0,
+            9,
+        ),
+        (
+            "WebMercatorQuad",
+            _polygon(
+                [(-20, -20), (20, -20), (20, 20), (-20, 20), (-20, -20)],
+                [(-5, -5), (-5, 5), (5, 5), (5, -5), (-5, -5)],
+            ),
+            2,
+            8,
+        ),
+        (
+            "NZTM2000Quad",
+            _polygon([(166, -47), (179, -34), (178, -33), (172, -40), (166, -47)]),
+            3,
+            9,
+        ),
+    ],
+)
+def test_pyramid_tiles(identifier, geom, minzoom, maxzoom):
+    """Should match the geometry cover at each zoom level."""
+    tms = morecantile.tms.get(identifier)
+    pyramid = list(tms.pyramid_tiles(geom, minzoom, maxzoom))
+    assert [t.z for t, _ in pyramid] == sorted(t.z for t, _ in pyramid)
+    assert len(set(pyramid)) == len(pyramid)
+
+    zooms = list(range(minzoom, maxzoom + 1))
+    for z, tiles in zip(zooms, tms.geometry_tiles(geom, zooms)):
+        assert _expand_pyramid(pyramid, z) == set(tiles)
+
+    # full tiles have no descendants in the pyramid
+    full = {t for t, f in pyramid if f}
+    for tile, _ in pyramid:
+        assert not any(
+            Tile(tile.x >> d, tile.y >> d, tile.z - d) in full
+            for d in range(1, tile.z - minzoom + 1)
+        )
+
+
+def test_pyramid_tiles_world():
+    """Should not visit the children of the tiles inside the geometry."""
+    tms = morecantile.tms.get("WebMercatorQuad")
+    geom = _polygon([(-180, -86), (180, -86), (180, 86), (-180, 86), (-180, -86)])
+    assert list(tms.pyramid_tiles(geom, 0, 24)) == [(Tile(0, 0, 0), True)]
+
+    geom = _polygon(_tile_ring(tms, Tile(1, 1, 2), Tile(2, 2, 2)))
+    pyramid = list(tms.pyramid_tiles(geom, 1, 20))
+    assert pyramid == [(Tile(x, y, 1), False) for y in range(2) for x in range(2)] + [
+        (Tile(x, y, 2), True) for y in range(1, 3) for x in range(1, 3)
+    ]
+
+    with pytest.raises(morecantile.errors.NoQuadkeySupport):
+        next(morecantile.tms.get("WorldCRS84Quad").pyramid_tiles(geom, 0, 4))
+
+    with pytest.raises(morecantile.errors.InvalidZoomError):
+        next(tms.pyramid_tiles(geom, 4, 2))
@@ -0,0 +1,242 @@
+"""Test space-filling curves."""
+
+import pyproj
+import pytest
+
+import morecantile
+from morecantile.commons import Tile
+from morecantile.curves import (
+    _curve_tiles,
+    hilbert_index,
+    hilbert_indices,
+    hilbert_xy,
+    morton_index,
+    morton_indices,
+    morton_sort,
+)
+from morecantile.errors import InvalidZoomError, NoQuadkeySupport
+
+
+def test_morton_index():
+    """Morton index should be the quadkey as a base-4 number."""
+    tms = morecantile.tms.get("WebMercatorQuad")
+    for tile in [
+        Tile(0, 0, 1),
+        Tile(1, 0, 1),
+        Tile(486, 332, 10),
+        Tile(2**24 - 1, 3, 24),
+    ]:
+        assert morton_index(tile.x, tile.y) == int(tms.quadkey(tile), 4)
+
+    assert morton_index(0, 0) == 0
+    assert morton_index(3, 5) == 0b100111
+
+
+def test_morton_indices():
+    """Should match the scalar Morton index."""
+    np = pytest.importorskip("numpy")
+
+    rng = np.random.default_rng(0)
+    x = rng.integers(0, 2**32, 1000)
+    y = rng.integers(0, 2**32, 1000)
+    indices = morton_indices(x, y)
+    assert indices.dtype == np.uint64
+    assert indices.tolist() == [
+        morton_index(int(i), int(j)) for i, j in zip(x.tolist(), y.tolist())
+    ]
+
+
+def test_morton_sort():
+    """Should sort tiles by zoom and Morton index."""
+    np = pytest.importorskip("numpy")
+
+    tiles = [Tile(1, 1, 1), Tile(0, 0, 2), Tile(1, 0, 1), Tile(0, 1, 1), Tile(0, 0, 1)]
+    expected = [[0, 0, 1], [1, 0, 1], [0, 1, 1], [1, 1, 1], [0, 0, 2]]
+    assert morton_sort(tiles).tolist() == expected
+
+    x, y, z = np.array(tiles).T
+    assert morton_sort(x, y, z).tolist() == expected
+    assert morton_sort(x, y, 3).tolist() == [
+        [0, 0, 3],
+        [0, 0, 3],
+        [1, 0, 3],
+        [0, 1, 3],
+        [1, 1, 3],
+    ]
+    assert morton_sort(np.zeros((0, 3))).shape == (0, 3)
+
+
+@pytest.mark.parametrize("bits", [0, 1, 2, 3, 5])
+def test_hilbert_index(bits):
+    """Hilbert curve should visit each tile once, moving to a neighbour each time."""
+    size = 1 << bits
+    indices = {
+        (x, y): hilbert_index(x, y, bits) for x in range(size) for y in range(size)
+    }
+    assert sorted(indices.values()) == list(range(size * size))
+
+    tiles = sorted(indices, key=indices.get)
+    assert tiles[0] == (0, 0)
+    assert all(
+        abs(x0 - x1) + abs(y0 - y1) == 1 for (x0, y0), (x1, y1) in zip(tiles, tiles[1:])
+    )
+
+    # curve order of tiles within rectangles
+    assert list(_curve_tiles([(0, 0, size - 1, size - 1)], bits, "hilbert")) == tiles
+    rects = [(0, 0, size // 2, 0), (size // 2, size // 2, size - 1, size - 1)]
+    assert list(_curve_tiles(rects, bits, "hilbert")) == [
+        t
+        for t in tiles
+        if any(r[0] <= t[0] <= r[2] and r[1] <= t[1] <= r[3] for r in rects)
+    ]
+
+
+def test_hilbert_indices():
+    """Should match the scalar Hilbert index, and decode back to the tiles."""
+    np = pytest.importorskip("numpy")
+
+    rng = np.random.default_rng(0)
+    bits = rng.integers(0, 33, 2000)
+    x = rng.integers(0, 2**32, 2000) % (1 << bits)
+    y = rng.integers(0, 2**32, 2000) % (1 << bits)
+
+    indices = hilbert_indices(x, y, bits)
+    assert indices.dtype == np.uint64
+    assert indices.tolist() == [
+        hilbert_index(i, j, b) for i, j, b in zip(x.tolist(), y.tolist(), bits.tolist())
+    ]
+
+    dx, dy = hilbert_xy(indices, bits)
+    np.testing.assert_array_equal(dx, x)
+    np.testing.assert_array_equal(dy, y)
+
+    assert hilbert_indices([], [], 3).shape == (0,)
+
+
+def test_hilbert_ids():
+    """Should match PMTiles tile IDs."""
+    np = pytest.importorskip("numpy")
+
+    tms = morecantile.tms.get("WebMercatorQuad")
+    tiles = [
+        (0, 0, 0),
+        (0, 0, 1),
+        (0, 1, 1),
+        (1, 1, 1),
+        (1, 0, 1),
+        (0, 0, 2),
+        (3423, 1763, 12),
+        (2**31 - 1, 0, 31),
+    ]
+    ids = [0, 1, 2, 3, 4, 5, 19078479, 4 * (4**31 - 1) // 3]
+    assert tms.hilbert_ids(tiles).tolist() == ids
+    x, y, z = np.array(tiles).T
+    assert tms.hilbert_ids(x, y, z).tolist() == ids
+    assert tms.hilbert_tiles(ids).tolist() == [list(t) for t in tiles]
+
+    with pytest.raises(InvalidZoomError):
+        tms.hilbert_ids([(0, 0, 32)])
+
+    with pytest.raises(ValueError):
+        tms.hilbert_ids([(2, 0, 1)])
+
+    with pytest.raises(ValueError):
+        tms.hilbert_tiles([2**64 - 1])
+
+    # Quadtree TMS with a 2x2 minzoom TileMatrix
+    extent = [-20037508.342789244, -20037508.342789244] + [20037508.342789244] * 2
+    tms = morecantile.TileMatrixSet.custom(
+        extent, pyproj.CRS.from_epsg(3857), matrix_scale=[2, 2]
+    )
+    assert tms.is_quadtree
+    tiles = [
+        (0, 0, 0),
+        (0, 1, 0),
+        (1, 1, 0),
+        (1, 0, 0),
+        (0, 0, 1),
+        (3423, 1763, 11),
+        (2**31 - 1, 0, 30),
+    ]
+    ids = [0, 1, 2, 3, 4, 19078479 - 1, 4 * (4**31 - 1) // 3 - 1]
+    assert tms.hilbert_ids(tiles).tolist() == ids
+    assert tms.hilbert_tiles(ids).tolist() == [list(t) for t in tiles]
+
+    hilbert = list(tms.tiles(-180, -85, 180, 85, zooms=[0, 1, 2], order="hilbert"))
+    assert tms.hilbert_ids(hilbert).tolist() == list(range(4 + 16 + 64))
+
+    with pytest.raises(InvalidZoomError):
+        tms.hilbert_ids([(0, 0, 31)])
+
+    with pytest.raises(ValueError):
+        tms.hilbert_ids([(2, 0, 0)])
+
+    with pytest.raises(ValueError):
+        tms.hilbert_tiles([2**64 - 1])
+
+    # Tiles outside of a 2x1 TileMatrix but inside the 2x2 Hilbert curve
+    tms = morecantile.TileMatrixSet.custom(
+        [
+            -20037508.342789244,
+            -10018754.171394622,
+            20037508.342789244,
+            10018754.171394622,
+        ],
+        pyproj.CRS.from_epsg(3857),
+        matrix_scale=[2, 1],
+        maxzoom=0,
+    )
+    assert tms.is_quadtree
+    assert tms.hilbert_ids([(0, 0, 0), (1, 0, 0)]).tolist() == [0, 3]
+
+    with pytest.raises(ValueError):
+        tms.hilbert_ids([(0, 1, 0)])
+
+    tms = morecantile.tms.get("WorldCRS84Quad")
+    with pytest.raises(NoQuadkeySupport):
+        tms.hilbert_ids([(0, 0, 1)])
+
+    with pytest.raises(NoQuadkeySupport):
+        tms.hilbert_tiles([1])
+
+
+@pytest.mark.parametrize(
+    "identifier,bounds,zooms",
+    [
+        ("WebMercatorQuad", (-10, -10, 10, 10), [0, 1, 5, 9]),
+        ("WebMercatorQuad", (170, -10, -170, 10), [3, 6]),
+        ("NZTM2000Quad", (170, -45, 175, -40), [3, 6, 8]),
+    ],
+)
+def test_tiles_curve_order(identifier, bounds, zooms):
+    """Should yield the same tiles in Morton or Hilbert order."""
+    tms = morecantile.tms.get(identifier)
+    tiles = list(tms.tiles(*bounds, zooms=zooms, order="morton"))
+    assert sorted(tiles) == sorted(set(tms.tiles(*bounds, zooms=zooms)))
+    assert [t.z for t in tiles] == sorted(t.z for t in tiles)
+
+    keys = [(t.z, morton_index(t.x, t.y)) for t in tiles]
+    assert keys == sorted(keys)
+
+    tiles = list(tms.tiles(*bounds, zooms=zooms, order="hilbert"))
+    assert sorted(tiles) == sorted(set(tms.tiles(*bounds, zooms=zooms)))
+    assert [t.z for t in tiles] == sorted(t.z for t in tiles)
+
+    keys = [(t.z, hilbert_index(t.x, t.y, t.z)) for t in tiles]
+    assert keys == sorted(keys)
+
+
+def test_tiles_order_errors():
+    """Should raise errors for invalid order or non-quadtree TMS."""
+    tms = morecantile.tms.get("WebMercatorQuad")
+    with pytest.raises(ValueError):
+        tms.tiles(-10, -10, 10, 10, zooms=[1], order="foo")
+
+    tms = morecantile.tms.get("WorldCRS84Quad")
+    for order in ["morton", "hilbert"]:
+        # Raised when calling tiles, not when iterating over the tiles
+        with pytest.raises(NoQuadkeySupport):
+            tms.tiles(-10, -10, 10, 10, zooms=[1], order=order)
+
+        with pytest.raises(NoQuadkeySupport):
+            tms.tiles(-10, -10, 10, 10, zooms=[1], order=order, as_keys=True)
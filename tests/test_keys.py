@@ -0,0 +1,253 @@
+"""Test packed tile keys."""
+
+import pytest
+
+import morecantile
+from morecantile.commons import Tile
+from morecantile.errors import InvalidZoomError
+from morecantile.keys import pack_keys, unpack_keys
+from morecantile.ranges import TileRange
+from morecantile.tilesets import TileSet
+
+np = pytest.importorskip("numpy")
+
+
+def test_pack_keys():
+    """Keys should sort by zoom and row-major order."""
+    tiles = [
+        Tile(1, 0, 1),
+        Tile(0, 1, 1),
+        Tile(0, 0, 2),
+        Tile(2**29 - 1, 2**29 - 1, 63),
+    ]
+    keys = pack_keys(tiles)
+    assert keys.dtype == np.uint64
+    assert keys.tolist() == [(1 << 58) | 1, (1 << 58) | (1 << 29), 2 << 58, 2**64 - 1]
+    assert unpack_keys(keys).tolist() == [list(t) for t in tiles]
+
+    x, y, z = np.array(tiles).T
+    np.testing.assert_array_equal(pack_keys(x, y, z), keys)
+
+    rng = np.random.default_rng(0)
+    tiles = np.stack(
+        [
+            rng.integers(0, 2**29, 1000),
+            rng.integers(0, 2**29, 1000),
+            rng.integers(0, 64, 1000),
+        ],
+        axis=-1,
+    )
+    keys = pack_keys(tiles)
+    np.testing.assert_array_equal(unpack_keys(keys), tiles)
+    np.testing.assert_array_equal(
+        np.sort(keys),
+        pack_keys(tiles[np.lexsort((tiles[:, 0], tiles[:, 1], tiles[:, 2]))]),
+    )
+
+
+def test_pack_tiles():
+    """Should check the tile indices."""
+    tms = morecantile.tms.get("GNOSISGlobalGrid")
+    tiles = [[0, 0, 0], [3, 1, 0], [7, 3, 1]]
+    keys = tms.pack_tiles(tiles)
+    np.testing.assert_array_equal(keys, pack_keys(tiles))
+    assert tms.unpack_tiles(keys).tolist() == tiles
+
+    with pytest.raises(ValueError):
+        tms.pack_tiles([[4, 0, 0]])
+
+    with pytest.raises(ValueError):
+        tms.pack_tiles([[0, -1, 0]])
+
+    with pytest.raises(ValueError):
+        tms.unpack_tiles(pack_keys([[0, 2, 0]]))
+
+    with pytest.raises(InvalidZoomError):
+        tms.pack_tiles([[0, 0, -1]])
+
+    # GNOSISGlobalGrid zoom 28 has 2**30 columns
+    with pytest.raises(ValueError):
+        tms.pack_tiles([[0, 0, 28]])
+
+
+def test_pack_tiles_negative_zoom():
+    """Negative zoom levels should not be packed in keys."""
+    tms = morecantile.tms.get("CDB1GlobalGrid")
+    assert tms.minzoom < 0
+
+    tiles = [[0, 0, 0], [359, 179, 0], [3, 1, 2]]
+    keys = tms.pack_tiles(tiles)
+    assert tms.unpack_tiles(keys).tolist() == tiles
+
+    with pytest.raises(InvalidZoomError):
+        tms.pack_tiles([[0, 0, -10]])
+
+    with pytest.raises(InvalidZoomError):
+        pack_keys([[0, 0, -1]])
+
+    with pytest.raises(InvalidZoomError):
+        tms.tiles(-10, -10, 10, 10, zooms=[-10], as_keys=True)
+
+    with pytest.raises(InvalidZoomError):
+        tms.children(0, 0, -10, as_keys=True)
+
+    with pytest.raises(InvalidZoomError):
+        tms.parent(0, 0, 0, as_keys=True)
+
+    with pytest.raises(InvalidZoomError):
+        TileRange(-1, [(0, 0, 0, 0)]).to_keys()
+
+    with pytest.raises(InvalidZoomError):
+        TileSet(tms, [Tile(0, 0, -10)]).to_keys()
+
+
+def test_tile_range_keys():
+    """Should pack the tiles of the TileRange."""
+    tiles = TileRange(2, [(1, 0, 9, 7)], coalesce=((0, 2, 6), (4, 1, 2)))
+    np.testing.assert_array_equal(tiles.to_keys(), pack_keys(list(tiles)))
+    assert TileRange(3).to_keys().shape == (0,)
+
+
+@pytest.mark.parametrize(
+    "identifier,bounds,zooms",
+    [
+        ("WebMercatorQuad", (-10, -10, 10, 10), [0, 1, 5, 9]),
+        ("NZTM2000Quad", (170, -45, 175, -40), [3, 6, 8]),
+        ("GNOSISGlobalGrid", (-30, 60, 30, 89), [4, 7]),
+    ],
+)
+def test_tiles_keys(identifier, bounds, zooms):
+    """Should return the keys of the tiles."""
+    tms = morecantile.tms.get(identifier)
+    orders = ["row", "morton", "hilbert"] if tms.is_quadtree else ["row"]
+    for order in orders:
+        keys = tms.tiles(*bounds, zooms=zooms, order=order, as_keys=True)
+        assert keys.dtype == np.uint64
+        assert tms.unpack_tiles(keys).tolist() == [
+            list(t) for t in tms.tiles(*bounds, zooms=zooms, order=order)
+        ]
+
+
+def test_tiles_keys_antimeridian():
+    """Should merge the parts of a bbox crossing the antimeridian."""
+    tms = morecantile.tms.get("WebMercatorQuad")
+    keys = tms.tiles(170, -10, -170, 10, zooms=[3], as_keys=True)
+    assert tms.unpack_tiles(keys).tolist() == [
+        [0, 3, 3],
+        [7, 3, 3],
+        [0, 4, 3],
+        [7, 4, 3],
+    ]
+
+
+@pytest.mark.parametrize(
+    "identifier,tile",
+    [
+        ("WebMercatorQuad", Tile(486, 332, 10)),
+        ("WebMercatorQuad", Tile(0, 0, 0)),
+        ("GNOSISGlobalGrid", Tile(8, 1, 3)),
+        ("GNOSISGlobalGrid", Tile(20, 3, 3)),
+    ],
+)
+def test_neighbors_keys(identifier, tile):
+    """Should return the keys of the parent, children and neighbors."""
+    tms = morecantile.tms.get(identifier)
+
+    keys = tms.parent(tile, as_keys=True)
+    assert keys.dtype == np.uint64
+    if tile.z == tms.minzoom:
+        assert keys.shape == (0,)
+    else:
+        np.testing.assert_array_equal(keys, tms.pack_tiles(tms.parent(tile)))
+
+    for zoom in [tile.z + 1, tile.z + 2]:
+        np.testing.assert_array_equal(
+            tms.children(tile, zoom=zoom, as_keys=True),
+            tms.pack_tiles(tms.children(tile, zoom=zoom)),
+        )
+
+    np.testing.assert_array_equal(
+        tms.neighbors(tile, as_keys=True), tms.pack_tiles(tms.neighbors(tile))
+    )
+
+
+def test_compact_keys():
+    """Complete sets of siblings should be replaced by their parent."""
+    tms = morecantile.tms.get("WebMercatorQuad")
+    tiles = [
+        *tms.children(0, 0, 1),
+        *tms.children(3, 3, 2, zoom=5),
+        *tms.children(4, 4, 3)[:3],
+        Tile(1, 0, 1),
+        Tile(2, 1, 2),  # covered by Tile(1, 0, 1)
+    ]
+    keys = tms.compact_tiles(tms.pack_tiles(tiles + tiles[::-1]))
+    assert tms.unpack_tiles(keys).tolist() == [
+        [0, 0, 1],
+        [1, 0, 1],
+        [3, 3, 2],
+        [8, 8, 4],
+        [9, 8, 4],
+        [8, 9, 4],
+    ]
+
+    keys = tms.pack_tiles(tms.children(0, 0, 0, zoom=3))
+    assert tms.unpack_tiles(tms.compact_tiles(keys)).tolist() == [[0, 0, 0]]
+    assert tms.compact_tiles([]).size == 0
+
+    tms = morecantile.tms.get("EuropeanETRS89_LAEAQuad")
+    keys = tms.pack_tiles(tms.children(1, 1, 1, zoom=4))
+    assert tms.unpack_tiles(tms.compact_tiles(keys)).tolist() == [[1, 1, 1]]
+
+    with pytest.raises(morecantile.errors.NoQuadkeySupport):
+        morecantile.tms.get("GNOSISGlobalGrid").compact_tiles([])
+
+
+@pytest.mark.parametrize("identifier", ["WebMercatorQuad", "WorldMercatorWGS84Quad"])
+def test_compact_expand_cover(identifier):
+    """Compaction and expansion should round trip geometry covers."""
+    tms = morecantile.tms.get(identifier)
+    geom = {
+        "type": "Polygon",
+        "coordinates": [[[-20, -10], [30, -30], [40, 40], [0, 25], [-20, -10]]],
+    }
+    keys = np.concatenate([r.to_keys() for r in tms.geometry_tiles(geom, [9])])
+    compacted = tms.compact_tiles(keys)
+    assert len(compacted) < len(keys) / 10
+
+    # Compacted tiles do not overlap and are not complete sets of siblings
+    tiles = tms.unpack_tiles(compacted)
+    assert len(set(map(tuple, tiles.tolist()))) == len(tiles)
+    for t in tiles[tiles[:, 2] > 0].tolist():
+        siblings = tms.children(tms.parent(*t)[0], as_keys=True)
+        assert not np.isin(siblings, compacted).all()
+
+    chunks = list(tms.expand_tiles(compacted, 9, chunk_size=1000))
+    assert all(len(chunk) <= 1000 for chunk in chunks)
+    np.testing.assert_array_equal(np.sort(np.concatenate(chunks)), keys)
+
+    # Expand to a deeper zoom level
+    expanded = np.sort(np.concatenate(list(tms.expand_tiles(compacted, 10))))
+    expected = np.sort(
+        np.concatenate([tms.children(*t, as_keys=True) for t in tms.unpack_tiles(keys)])
+    )
+    np.testing.assert_array_equal(expanded, expected)
+    np.testing.assert_array_equal(tms.compact_tiles(expanded), compacted)
+
+
+def test_expand_keys():
+    """Large tiles should be expanded lazily by rows."""
+    tms = morecantile.tms.get("WebMercatorQuad")
+    chunks = tms.expand_tiles(tms.pack_tiles([[0, 0, 0], [5, 5, 4]]), 20, chunk_size=4)
+    chunk = next(chunks)
+    assert tms.unpack_tiles(chunk)[[0, -1]].tolist() == [[0, 0, 20], [2**20 - 1, 0, 20]]
+    chunk = next(chunks)
+    assert tms.unpack_tiles(chunk)[[0, -1]].tolist() == [[0, 1, 20], [2**20 - 1, 1, 20]]
+
+    assert not list(tms.expand_tiles([], 3))
+
+    with pytest.raises(InvalidZoomError):
+        tms.expand_tiles(tms.pack_tiles([[0, 0, 4]]), 3)
+
+    with pytest.warns(UserWarning), pytest.raises(ValueError):
+        tms.expand_tiles(tms.pack_tiles([[0, 0, 4]]), 30)
@@ -3,6 +3,7 @@
 import json
 import os
 import random
+import warnings
 from collections.abc import Iterable
 
 import pyproj
@@ -145,6 +146,51 @@ def test_findMatrix():
         tms.matrix(26)
 
 
+def test_extrapolated_matrix_cache(monkeypatch):
+    """Extrapolated matrices should be cached and warn once per zoom."""
+    tms = morecantile.tms.get("WebMercatorQuad")
+
+    # Reference, built from the last matrix
+    ref = morecantile.tms.get("WebMercatorQuad")
+    with pytest.warns(UserWarning):
+        ref_matrices = {z: ref.matrix(z) for z in range(25, 31)}
+        ref._extrapolated_matrices.clear()
+        assert ref.matrix(30) == ref_matrices[30]
+
+    with pytest.warns(UserWarning, match="level: 26"):
+        m26 = tms.matrix(26)
+
+    assert m26 == ref_matrices[26]
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        assert tms.matrix(26) is m26
+
+    # Matrices are extrapolated from the deepest cached matrix
+    with pytest.warns(UserWarning) as record:
+        assert tms.matrix(30) == ref_matrices[30]
+        assert tms.matrix(25) == ref_matrices[25]
+        assert tms.matrix(27) == ref_matrices[27]
+    assert len(record) == 3
+
+    assert tms.xy_bounds(0, 0, 30) == ref.xy_bounds(0, 0, 30)
+
+    # Cache is bounded, evicted matrices are re-created without warnings
+    monkeypatch.setattr(morecantile.models, "EXTRAPOLATED_MATRICES_CACHE_SIZE", 2)
+    tms = morecantile.tms.get("WebMercatorQuad")
+    with pytest.warns(UserWarning):
+        for z in range(25, 31):
+            tms.matrix(z)
+
+    assert list(tms._extrapolated_matrices) == [29, 30]
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        assert tms.matrix(25) == ref_matrices[25]
+
+    # cache should not change the TMS equality
+    assert tms == morecantile.tms.get("WebMercatorQuad")
+
+
 def test_Custom():
     """Create custom TMS grid."""
     tms = morecantile.tms.get("WebMercatorQuad")
@@ -775,6 +821,46 @@ def test_geographic_crs(name, is_wgs84):
     assert (tms.geographic_crs == pyproj.CRS.from_epsg(4326)) == is_wgs84
 
 
+def test_geographic_bbox_cache():
+    """Geographic bounding boxes should be cached by geographic CRS."""
+    tms = morecantile.tms.get("WebMercatorQuad")
+    ntf_paris = pyproj.CRS.from_epsg(4807)
+    ref = morecantile.tms.get("WebMercatorQuad")
+    ref.set_geographic_crs(ntf_paris)
+    assert ref.bbox != tms.bbox
+
+    bbox = tms.bbox
+    assert tms.bbox is bbox
+    assert list(tms._geographic_bboxes) == [None]
+
+    # tile(truncate=True) and tiles() use the cached bounding box
+    tms.tile(170.0, -89.0, 5, truncate=True)
+    list(tms.tiles(170.0, -42.0, 172.0, -40.0, [5], truncate=True))
+    assert list(tms._geographic_bboxes) == [None]
+
+    # Other geographic CRS are cached separately
+    tile = ref.tile(196.0, -93.0, 5, truncate=True)
+    assert tms.tile(196.0, -93.0, 5, truncate=True, geographic_crs=ntf_paris) == tile
+    assert list(tms._geographic_bboxes) == [None, ntf_paris.srs]
+    assert tms._geographic_bboxes[ntf_paris.srs] == ref.bbox
+
+    # Copy-on-write copies do not change the original cache
+    tms_ntf = tms.with_geographic_crs(ntf_paris)
+    assert tms_ntf.bbox == ref.bbox
+    assert tms.bbox is bbox
+
+    # Cache is invalidated by set_geographic_crs
+    tms.set_geographic_crs(ntf_paris)
+    assert tms.bbox == ref.bbox
+    assert tms.tile(196.0, -93.0, 5, truncate=True) == tile
+    assert list(tms.tiles(196.0, -93.0, 197.0, -92.0, [5], truncate=True)) == list(
+        ref.tiles(196.0, -93.0, 197.0, -92.0, [5], truncate=True)
+    )
+
+    # cache should not change the TMS equality
+    assert tms == ref
+
+
 def test_bottomleft_origin():
     """Create TMS with BottomLeft Origin."""
     wmTopLeft = morecantile.tms.get("WebMercatorQuad")
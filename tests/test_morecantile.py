@@ -1,7 +1,12 @@
 """Tests for morecantile."""
 
+import copy
 import math
+import pickle
+import subprocess
+import sys
 import warnings
+from collections.abc import Iterator
 
 import mercantile
 import pytest
@@ -9,6 +14,7 @@ from pyproj import CRS
 
 import morecantile
 from morecantile.errors import (
+    FrozenTileMatrixSetError,
     InvalidIdentifier,
     InvalidZoomError,
     PointOutsideTMSBounds,
@@ -18,6 +24,40 @@ from morecantile.utils import is_power_of_two, meters_per_unit
 DEFAULT_GRID_COUNT = 13
 
 
+def test_lazy_imports():
+    """`import morecantile` should not import pyproj, pydantic or the TMS registry."""
+    code = (
+        "import sys, morecantile; "
+        "print(sorted(m for m in ('pyproj', 'pydantic', 'attr', 'morecantile.defaults', 'morecantile.models') if m in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == "[]"
+
+    assert morecantile.tms.get("WebMercatorQuad")
+    assert morecantile.TileMatrixSet is morecantile.models.TileMatrixSet
+    assert morecantile.TileMatrixSets is morecantile.defaults.TileMatrixSets
+    assert morecantile.TileRange is morecantile.ranges.TileRange
+    assert morecantile.TileSet is morecantile.tilesets.TileSet
+    assert {
+        "tms",
+        "TileMatrixSet",
+        "TileSet",
+        "models",
+        "curves",
+        "keys",
+        "tilesets",
+    }.issubset(dir(morecantile))
+    assert morecantile.models.WGS84_CRS == CRS.from_epsg(4326)
+
+    with pytest.raises(AttributeError):
+        _ = morecantile.not_an_attribute
+
+    with pytest.raises(AttributeError):
+        _ = morecantile.models.not_an_attribute
+
+
 def test_default_grids():
     """Morecantile.default_grids should return the correct list of grids."""
     assert len(morecantile.tms.list()) == DEFAULT_GRID_COUNT
@@ -66,6 +106,59 @@ def test_register():
     assert "MyCustomGrid3031" not in morecantile.defaults.default_tms
 
 
+def test_shared_tms():
+    """Test shared (frozen) TMS."""
+    tms = morecantile.tms.get("WebMercatorQuad", shared=True)
+    assert tms.is_frozen
+    assert morecantile.tms.get("WebMercatorQuad", shared=True) is tms
+    assert morecantile.tms.get("WorldCRS84Quad", shared=True) is not tms
+
+    # copies are independent and not frozen
+    tms_copy = morecantile.tms.get("WebMercatorQuad")
+    assert tms_copy is not tms
+    assert not tms_copy.is_frozen
+    assert tms_copy.model_dump() == tms.model_dump()
+    assert tms_copy == morecantile.tms.get("WebMercatorQuad")
+
+    # cached properties are kept
+    xy_bbox = tms.xy_bbox
+    assert morecantile.tms.get("WebMercatorQuad", shared=True).xy_bbox is xy_bbox
+
+    with pytest.raises(FrozenTileMatrixSetError):
+        tms.set_geographic_crs(CRS.from_epsg(4258))
+
+    assert tms.geographic_crs == CRS.from_epsg(4326)
+
+    # Copy-on-write
+    tms_4258 = tms.with_geographic_crs(CRS.from_epsg(4258))
+    assert not tms_4258.is_frozen
+    assert tms_4258.geographic_crs == CRS.from_epsg(4258)
+    assert tms_4258.xy_bbox is xy_bbox
+    assert tms.geographic_crs == CRS.from_epsg(4326)
+    assert tms.bounds(0, 0, 1) == tms_copy.bounds(0, 0, 1)
+
+    tms_4258.set_geographic_crs(CRS.from_epsg(4326))
+    assert tms.geographic_crs == CRS.from_epsg(4326)
+
+    assert not copy.deepcopy(tms).is_frozen
+    assert not copy.copy(tms).is_frozen
+    assert not pickle.loads(pickle.dumps(tms)).is_frozen
+    assert pickle.loads(pickle.dumps(tms)).model_dump() == tms.model_dump()
+
+    # Shared TMS follow registry updates
+    crs = CRS.from_epsg(3031)
+    extent = [-948.75, -543592.47, 5817.41, -3333128.95]
+    custom = morecantile.TileMatrixSet.custom(extent, crs, id="MySharedGrid")
+    defaults = morecantile.tms.register({"MySharedGrid": custom})
+    shared = defaults.get("MySharedGrid", shared=True)
+    assert shared is not custom
+    assert not custom.is_frozen
+
+    custom = morecantile.TileMatrixSet.custom(extent, crs, id="MySharedGridV2")
+    defaults = defaults.register({"MySharedGrid": custom}, overwrite=True)
+    assert defaults.get("MySharedGrid", shared=True).id == "MySharedGridV2"
+
+
 def test_TMSproperties():
     """Test TileSchema()."""
     tms = morecantile.tms.get("WebMercatorQuad")
@@ -214,6 +307,39 @@ def test_feature():
         assert not feat.get("crs")
 
 
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {},
+        {"precision": 4, "buffer": -10},
+        {"projected": True},
+        {"geographic_crs": CRS.from_epsg(4258)},
+        {"props": {"some": "thing"}},
+    ],
+)
+@pytest.mark.parametrize("name", ["WebMercatorQuad", "NZTM2000Quad", "WGS1984Quad"])
+def test_features(name, kwargs):
+    """TileSchema.features should match TileSchema.feature."""
+    tms = morecantile.tms.get(name)
+    tiles = [morecantile.Tile(x, y, 3) for x in range(3) for y in range(3)]
+    tiles.append((1, 0, 1))
+
+    with warnings.catch_warnings(record=True) as record:
+        warnings.simplefilter("always")
+        features = tms.features(iter(tiles), **kwargs)
+        assert isinstance(features, Iterator)
+        features = list(features)
+
+    # Warn only once
+    assert len(record) <= 1
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        assert features == [tms.feature(tile, **kwargs) for tile in tiles]
+
+    assert list(tms.features([])) == []
+
+
 ################################################################################
 # replicate mercantile tests
 # https://github.com/mapbox/mercantile/blob/master/tests/test_funcs.py
@@ -0,0 +1,177 @@
+"""Test TileRange."""
+
+import pytest
+
+import morecantile
+from morecantile.commons import Tile
+from morecantile.ranges import TileRange
+
+
+def test_tile_range():
+    """Should behave like the list of tiles."""
+    tiles = TileRange(3, [(1, 2, 3, 4)])
+    expected = [Tile(x, y, 3) for y in range(2, 5) for x in range(1, 4)]
+
+    assert len(tiles) == 9
+    assert tiles.nrows == 3
+    assert list(tiles) == expected
+    assert [tiles[i] for i in range(-9, 9)] == expected + expected
+    assert tiles[1:7:2] == expected[1:7:2]
+    assert tiles[::-1] == expected[::-1]
+    assert tiles[100:] == []
+
+    assert Tile(1, 2, 3) in tiles
+    assert (3, 4, 3) in tiles
+    assert Tile(0, 2, 3) not in tiles
+    assert Tile(1, 5, 3) not in tiles
+    assert Tile(1, 2, 4) not in tiles
+    assert "1-2-3" not in tiles
+
+    assert list(tiles.row_spans()) == [(y, ((1, 3),), 1) for y in range(2, 5)]
+
+    with pytest.raises(IndexError):
+        tiles[9]
+
+    with pytest.raises(IndexError):
+        tiles[-10]
+
+    empty = TileRange(3)
+    assert len(empty) == 0
+    assert list(empty) == []
+    assert Tile(0, 0, 3) not in empty
+
+
+def test_tile_range_rects():
+    """Should merge overlapping rectangles."""
+    tiles = TileRange(4, [(0, 0, 1, 3), (6, 2, 7, 4), (1, 1, 2, 1)])
+    expected = sorted(
+        {Tile(x, y, 4) for y in range(0, 4) for x in range(0, 2)}
+        | {Tile(x, y, 4) for y in range(2, 5) for x in range(6, 8)}
+        | {Tile(x, 1, 4) for x in range(1, 3)},
+        key=lambda t: (t.y, t.x),
+    )
+    assert list(tiles) == expected
+    assert len(tiles) == len(expected)
+    assert tiles[:] == expected
+    assert all(t in tiles for t in expected)
+    assert Tile(5, 2, 4) not in tiles
+    assert tiles._blocks[0] == (0, 0, ((0, 1),), 1, 2)
+
+
+def test_tile_range_coalesce():
+    """Should only include the coalesced columns."""
+    # rows 0-1: coalesce 4, rows 2-5: 1, rows 6-7: coalesce 2
+    tiles = TileRange(2, [(1, 0, 9, 7)], coalesce=((0, 2, 6), (4, 1, 2)))
+    expected = [
+        Tile(x, y, 2)
+        for y in range(0, 8)
+        for x in range(1, 10)
+        if x % (4 if y < 2 else 2 if y > 5 else 1) == 0
+    ]
+    assert list(tiles) == expected
+    assert len(tiles) == len(expected)
+    assert tiles[:] == expected
+    assert Tile(4, 0, 2) in tiles
+    assert Tile(3, 0, 2) not in tiles
+    assert Tile(3, 3, 2) in tiles
+
+
+@pytest.mark.parametrize(
+    "identifier,bounds,zooms",
+    [
+        ("WebMercatorQuad", (-10, -10, 10, 10), [0, 1, 2, 5, 8]),
+        ("WebMercatorQuad", (170, -10, -170, 10), [2, 5, 8]),
+        ("WGS1984Quad", (175, -5, -175, 5), [1, 4, 7]),
+        ("NZTM2000Quad", (170, -45, 175, -40), [3, 6, 9]),
+        ("GNOSISGlobalGrid", (-180, -90, 180, 90), [0, 1, 2, 3]),
+        ("GNOSISGlobalGrid", (-30, 60, 30, 89), [4, 7]),
+        ("CDB1GlobalGrid", (-15, 50, 15, 89), [1, 3, 5]),
+    ],
+)
+def test_tile_ranges(identifier, bounds, zooms):
+    """TMS.tile_ranges should match TMS.tiles."""
+    tms = morecantile.tms.get(identifier)
+    ranges = tms.tile_ranges(*bounds, zooms)
+    assert [r.z for r in ranges] == zooms
+
+    for r in ranges:
+        expected = list(tms.tiles(*bounds, zooms=[r.z]))
+        # tiles() may yield the same tile twice when crossing the antimeridian
+        assert sorted(r) == sorted(set(expected))
+        assert len(r) == len(set(expected))
+        assert all(t in r for t in expected)
+        if bounds[0] <= bounds[2]:
+            assert list(r) == expected
+
+
+def test_tile_ranges_numpy():
+    """Should return the tiles as an array."""
+    np = pytest.importorskip("numpy")
+
+    tms = morecantile.tms.get("GNOSISGlobalGrid")
+    for r in tms.tile_ranges(-180, -90, 180, 90, [0, 2, 3]):
+        arr = r.to_numpy()
+        assert arr.dtype == np.int64
+        assert arr.shape == (len(r), 3)
+        np.testing.assert_array_equal(arr, list(r))
+
+    assert TileRange(3).to_numpy().shape == (0, 3)
+
+
+def test_tile_ranges_large():
+    """TileRange should not depend on the number of tiles."""
+    tms = morecantile.tms.get("WebMercatorQuad")
+    (r,) = tms.tile_ranges(-10, 40, 10, 50, [24])
+    assert len(r) == r.nrows * (r[-1].x - r[0].x + 1)
+    assert len(r) > 100_000_000_000
+    assert len(r._blocks) == 1
+    assert r[len(r) // 2] in r
+
+
+@pytest.mark.parametrize(
+    "identifier,bounds",
+    [
+        ("WebMercatorQuad", (-10, -10, 10, 10)),
+        ("WebMercatorQuad", (170, -10, -170, 10)),
+        ("NZTM2000Quad", (170, -45, 175, -40)),
+        ("GNOSISGlobalGrid", (-180, -90, 180, 90)),
+        ("CDB1GlobalGrid", (-15, 50, 15, 89)),
+    ],
+)
+def test_count_tiles(identifier, bounds):
+    """TMS.count_tiles should match the number of (distinct) tiles."""
+    tms = morecantile.tms.get(identifier)
+    zooms = list(range(0, 5))
+    counts = tms.count_tiles(*bounds, zooms)
+    assert list(counts) == zooms
+    for z, count in counts.items():
+        assert count == len(set(tms.tiles(*bounds, zooms=[z])))
+
+    assert tms.count_tiles(*bounds, 3) == {3: counts[3]}
+
+
+def test_count_tiles_deep():
+    """Should count the tiles without iterating over them."""
+    tms = morecantile.tms.get("WebMercatorQuad")
+    assert tms.count_tiles(
+        -180, -85.0511287798066, 180, 85.0511287798066, [18, 24]
+    ) == {
+        18: 4**18,
+        24: 4**24,
+    }
+
+    # GNOSISGlobalGrid: the polar rows are coalesced
+    tms = morecantile.tms.get("GNOSISGlobalGrid")
+    counts = tms.count_tiles(-180, -90, 180, 90, range(0, 25))
+    assert counts[0] == 8
+    assert counts[1] == 24
+    matrix = tms.matrix(20)
+    coalesced_rows = sum(
+        w.maxTileRow - w.minTileRow + 1 for w in matrix.variableMatrixWidths
+    )
+    assert counts[20] == (
+        matrix.matrixHeight - coalesced_rows
+    ) * matrix.matrixWidth + sum(
+        (w.maxTileRow - w.minTileRow + 1) * matrix.matrixWidth // w.coalesce
+        for w in matrix.variableMatrixWidths
+    )
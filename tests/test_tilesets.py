@@ -0,0 +1,142 @@
+"""Test TileSet."""
+
+import random
+
+import pytest
+
+import morecantile
+from morecantile.commons import Tile
+from morecantile.errors import InvalidZoomError
+from morecantile.ranges import TileRange
+from morecantile.tilesets import TileSet
+
+
+def _random_tiles(tms, zooms, count, seed):
+    """Random tiles (snapped to the coalesced tiles) of a TileMatrixSet."""
+    rnd = random.Random(seed)
+    tiles = set()
+    for _ in range(count):
+        z = rnd.choice(zooms)
+        matrix = tms.matrix(z)
+        y = rnd.randrange(matrix.matrixHeight)
+        x = rnd.randrange(matrix.matrixWidth)
+        if matrix.variableMatrixWidths is not None:
+            x -= x % matrix.get_coalesce_factor(y)
+
+        tiles.add(Tile(x, y, z))
+
+    return tiles
+
+
+@pytest.mark.parametrize("name", ["WebMercatorQuad", "GNOSISGlobalGrid"])
+def test_tileset_algebra(name):
+    """Set operations should match Python sets."""
+    tms = morecantile.tms.get(name)
+    a = set(tms.tiles(-40, -85, 60, 85, zooms=[2, 3, 4]))
+    a |= _random_tiles(tms, [1, 2, 3], 200, 0)
+    b = set(tms.tiles(0, -20, 120, 89, zooms=[3, 4, 5]))
+    b |= _random_tiles(tms, [2, 3, 4], 200, 1)
+
+    ta, tb = TileSet(tms, a), TileSet(tms, b)
+    assert len(ta) == len(a)
+    assert set(ta) == a
+    assert list(ta) == sorted(a, key=lambda t: (t.z, t.y, t.x))
+
+    for tileset, expected in [
+        (ta | tb, a | b),
+        (ta & tb, a & b),
+        (ta - tb, a - b),
+        (tb - ta, b - a),
+        (ta.union(tb), a | b),
+        (ta.intersection(tb), a & b),
+        (ta.difference(tb), a - b),
+    ]:
+        assert len(tileset) == len(expected)
+        assert set(tileset) == expected
+        assert tileset == TileSet(tms, expected)
+
+    assert ta - ta == TileSet(tms)
+    assert not (ta - ta).zooms
+    assert ta & tb == tb & ta
+    assert ta | tb == tb | ta
+
+
+def test_tileset_coalesce():
+    """Columns should be snapped to the coalesced tiles."""
+    tms = morecantile.tms.get("GNOSISGlobalGrid")
+    tileset = TileSet(tms, [Tile(3, 0, 2), Tile(2, 0, 2), Tile(5, 1, 2), Tile(5, 3, 2)])
+    assert list(tileset) == [Tile(0, 0, 2), Tile(4, 1, 2), Tile(5, 3, 2)]
+    assert Tile(0, 0, 2) in tileset
+    assert Tile(3, 0, 2) not in tileset
+
+    tile_range = TileRange(2, [(0, 0, 7, 0)])
+    assert len(tile_range) == 8
+    tileset = TileSet.from_ranges(tms, [tile_range])
+    assert list(tileset) == [Tile(0, 0, 2), Tile(4, 0, 2)]
+
+
+def test_tileset_ranges():
+    """TileSet should be created from tile_ranges and geometry covers."""
+    tms = morecantile.tms.get("GNOSISGlobalGrid")
+    tileset = TileSet.from_ranges(tms, tms.tile_ranges(-170, -89, 170, 89, [0, 3, 5]))
+    assert tileset == TileSet(tms, tms.tiles(-170, -89, 170, 89, [0, 3, 5]))
+    assert tileset.zooms == [0, 3, 5]
+    assert list(tileset.ranges) == [0, 3, 5]
+    assert repr(tileset) == (
+        f"<TileSet tms=GNOSISGlobalGrid zooms=[0, 3, 5] tiles={len(tileset)}>"
+    )
+
+    # Ranges of the same zoom level are merged
+    tms = morecantile.tms.get("WebMercatorQuad")
+    tileset = TileSet.from_ranges(
+        tms, [TileRange(4, [(0, 0, 3, 3)]), TileRange(4, [(2, 2, 5, 5)])]
+    )
+    assert len(tileset) == 16 + 16 - 4
+    assert TileSet.from_ranges(tms, [TileRange(4, [])]) == TileSet(tms)
+
+
+def test_tileset_invalid():
+    """Should raise for tiles outside of the TMS and mixed TMS."""
+    tms = morecantile.tms.get("WebMercatorQuad")
+    with pytest.raises(ValueError):
+        TileSet(tms, [Tile(4, 0, 2)])
+
+    with pytest.raises(ValueError):
+        TileSet(tms, [Tile(0, -1, 2)])
+
+    with pytest.raises(ValueError):
+        TileSet.from_ranges(tms, [TileRange(1, [(0, 0, 0, 0), (0, 1, 2, 1)])])
+
+    with pytest.raises(InvalidZoomError):
+        TileSet(tms, [Tile(0, 0, -1)])
+
+    with pytest.raises(ValueError):
+        TileSet(tms) | TileSet(morecantile.tms.get("WorldCRS84Quad"))
+
+    with pytest.raises(TypeError):
+        TileSet(tms) | {Tile(0, 0, 0)}
+
+    with pytest.raises(TypeError):
+        TileSet(tms).union({Tile(0, 0, 0)})
+
+    assert TileSet(tms) != {Tile(0, 0, 0)}
+    assert 1 not in TileSet(tms, [Tile(0, 0, 0)])
+
+
+def test_tileset_keys():
+    """TileSet should be converted to and from packed keys."""
+    np = pytest.importorskip("numpy")
+
+    tms = morecantile.tms.get("GNOSISGlobalGrid")
+    tiles = set(tms.tiles(-40, -89, 60, 89, zooms=[2, 4]))
+    tiles |= _random_tiles(tms, [1, 3, 6], 500, 2)
+
+    keys = tms.pack_tiles(list(tiles))
+    tileset = TileSet.from_keys(tms, np.concatenate([keys, keys[::-1]]))
+    assert tileset == TileSet(tms, tiles)
+    np.testing.assert_array_equal(tileset.to_keys(), np.sort(keys))
+    np.testing.assert_array_equal(tileset.to_numpy(), tms.unpack_tiles(np.sort(keys)))
+
+    assert TileSet.from_keys(tms, []) == TileSet(tms)
+    assert TileSet(tms).to_keys().dtype == np.uint64
+    assert TileSet(tms).to_numpy().shape == (0, 3)
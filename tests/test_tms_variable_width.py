@@ -62,6 +62,78 @@ def test_coalesce():
         matrix.get_coalesce_factor(0)
 
 
+def test_coalesce_many():
+    """test get coalesce for many rows."""
+    np = pytest.importorskip("numpy")
+
+    matrix = gnosisg_tms.matrix(3)
+    rows = np.arange(matrix.matrixHeight)
+    np.testing.assert_array_equal(
+        matrix.get_coalesce_factors(rows),
+        [matrix.get_coalesce_factor(row) for row in rows],
+    )
+
+    with pytest.raises(ValueError):
+        matrix.get_coalesce_factors([matrix.matrixHeight])
+
+    with pytest.raises(ValueError):
+        matrix.get_coalesce_factors([-1])
+
+    with pytest.raises(ValueError):
+        morecantile.tms.get("WebMercatorQuad").matrix(3).get_coalesce_factors([0])
+
+
+@pytest.mark.parametrize("tms", [gnosisg_tms, cdb1_tms])
+def test_coalesce_lookup(tms):
+    """Coalesce lookup table should match the variableMatrixWidths definitions."""
+    for matrix in tms.tileMatrices:
+        if not matrix.variableMatrixWidths:
+            continue
+
+        starts, factors = matrix._coalesce_lookup
+        assert starts[0] == 0
+        assert list(starts) == sorted(set(starts))
+        # adjacent intervals are merged
+        assert all(a != b for a, b in zip(factors[:-1], factors[1:]))
+
+        for w in matrix.variableMatrixWidths:
+            for row in {w.minTileRow, (w.minTileRow + w.maxTileRow) // 2, w.maxTileRow}:
+                assert matrix.get_coalesce_factor(row) == w.coalesce
+
+
+def test_coalesce_lookup_overlap():
+    """The first matching variableMatrixWidth should be used."""
+    np = pytest.importorskip("numpy")
+
+    matrix = TileMatrix(
+        **{
+            "id": "2",
+            "scaleDenominator": 34942641.501794859767,
+            "cellSize": 0.087890625,
+            "cornerOfOrigin": "topLeft",
+            "pointOfOrigin": [90, -180],
+            "matrixWidth": 16,
+            "matrixHeight": 8,
+            "tileWidth": 256,
+            "tileHeight": 256,
+            "variableMatrixWidths": [
+                {"coalesce": 4, "minTileRow": 0, "maxTileRow": 1},
+                {"coalesce": 2, "minTileRow": 1, "maxTileRow": 2},
+                {"coalesce": 8, "minTileRow": 2, "maxTileRow": 2},
+                {"coalesce": 2, "minTileRow": 6, "maxTileRow": 7},
+            ],
+        }
+    )
+
+    expected = [4, 4, 2, 1, 1, 1, 2, 2]
+    assert [matrix.get_coalesce_factor(row) for row in range(8)] == expected
+    np.testing.assert_array_equal(
+        matrix.get_coalesce_factors(np.arange(8)),
+        expected,
+    )
+    assert matrix._coalesce_lookup == ((0, 2, 3, 6), (4, 2, 1, 2))
+
+
 def test_invalid_matrix():
     """Should raise error because we cannot construct a Matrix for variableWidth TMS."""
     with pytest.raises(InvalidZoomError):
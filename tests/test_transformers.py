@@ -0,0 +1,455 @@
+"""Test morecantile transformers."""
+
+import math
+import random
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+import pyproj
+import pytest
+
+import morecantile
+from morecantile.transformers import (
+    WEB_MERCATOR_EXTENT,
+    IdentityTransformer,
+    WebMercatorTransformer,
+    pyproj_transformer,
+    transformer_from_crs,
+)
+
+WGS84 = pyproj.CRS.from_epsg(4326)
+WEB_MERCATOR = pyproj.CRS.from_epsg(3857)
+
+to_geographic = pyproj.Transformer.from_crs(WEB_MERCATOR, WGS84, always_xy=True)
+from_geographic = pyproj.Transformer.from_crs(WGS84, WEB_MERCATOR, always_xy=True)
+
+
+def test_transformer_from_crs():
+    """Should return closed-form transformers when possible."""
+    assert isinstance(transformer_from_crs(WEB_MERCATOR, WGS84), WebMercatorTransformer)
+    assert isinstance(transformer_from_crs(WGS84, WEB_MERCATOR), WebMercatorTransformer)
+    assert isinstance(
+        transformer_from_crs(WEB_MERCATOR, pyproj.CRS.from_user_input("OGC:CRS84")),
+        WebMercatorTransformer,
+    )
+    assert isinstance(
+        transformer_from_crs(WEB_MERCATOR, pyproj.CRS.from_epsg(4258)),
+        pyproj.Transformer,
+    )
+    assert isinstance(
+        transformer_from_crs(pyproj.CRS.from_epsg(3395), WGS84), pyproj.Transformer
+    )
+
+    tms = morecantile.tms.get("WebMercatorQuad")
+    assert isinstance(tms._to_geographic, WebMercatorTransformer)
+    assert isinstance(tms._from_geographic, WebMercatorTransformer)
+
+    tms.set_geographic_crs(pyproj.CRS.from_epsg(4258))
+    assert isinstance(tms._to_geographic, pyproj.Transformer)
+
+    tms = morecantile.tms.get("WorldMercatorWGS84Quad")
+    assert isinstance(tms._to_geographic, pyproj.Transformer)
+
+
+def test_web_mercator_scalar():
+    """Scalar transformations should match PROJ."""
+    inverse = WebMercatorTransformer(WEB_MERCATOR, WGS84)
+    forward = WebMercatorTransformer(WGS84, WEB_MERCATOR)
+
+    rd = random.Random(42)
+    for _ in range(1000):
+        x = rd.uniform(-WEB_MERCATOR_EXTENT, WEB_MERCATOR_EXTENT)
+        y = rd.uniform(-WEB_MERCATOR_EXTENT, WEB_MERCATOR_EXTENT)
+        assert inverse.transform(x, y) == to_geographic.transform(x, y)
+
+        lng = rd.uniform(-180, 180)
+        lat = rd.uniform(-85.06, 85.06)
+        assert forward.transform(lng, lat) == from_geographic.transform(lng, lat)
+
+
+@pytest.mark.parametrize(
+    "lng,lat",
+    [
+        (0, 0),
+        (180.0, 0.0),
+        (-180.0, 0.0),
+        (181.0, 10.0),
+        (-181.0, 10.0),
+        (540.0, 10.0),
+        (1000.0, 10.0),
+        (0.0, 90.0),
+        (0.0, -90.0),
+        (0.0, 91.0),
+        (math.inf, 0.0),
+    ],
+)
+def test_web_mercator_forward_edges(lng, lat):
+    """Forward transformation should match PROJ for edge cases."""
+    forward = WebMercatorTransformer(WGS84, WEB_MERCATOR)
+    x, y = forward.transform(lng, lat)
+    px, py = from_geographic.transform(lng, lat)
+    assert x == pytest.approx(px, abs=1e-6)
+    assert y == pytest.approx(py, abs=1e-6)
+
+
+@pytest.mark.parametrize(
+    "x,y",
+    [
+        (0, 0),
+        (WEB_MERCATOR_EXTENT, WEB_MERCATOR_EXTENT),
+        (-WEB_MERCATOR_EXTENT, -WEB_MERCATOR_EXTENT),
+        (WEB_MERCATOR_EXTENT * 1.0000001, 0.0),
+        (3e7, 3e7),
+        (-28366731.739810849, -1655181.9927159143),
+        (1e9, 1e9),
+        (math.inf, 0.0),
+    ],
+)
+def test_web_mercator_inverse_edges(x, y):
+    """Inverse transformation should match PROJ for edge cases."""
+    inverse = WebMercatorTransformer(WEB_MERCATOR, WGS84)
+    lng, lat = inverse.transform(x, y)
+    plng, plat = to_geographic.transform(x, y)
+    assert lng == pytest.approx(plng, abs=1e-9)
+    assert lat == pytest.approx(plat, abs=1e-9)
+
+
+@pytest.mark.parametrize(
+    "x,y",
+    [
+        (math.nan, 0.0),
+        (0.0, math.nan),
+        (math.nan, math.nan),
+        (math.nan, 100.0),
+        (math.inf, math.nan),
+        (1000.0, math.nan),
+    ],
+)
+def test_web_mercator_nan(x, y):
+    """NaN inputs should give NaN outputs, as with PROJ."""
+    np = pytest.importorskip("numpy")
+
+    for transformer, proj in [
+        (WebMercatorTransformer(WGS84, WEB_MERCATOR), from_geographic),
+        (WebMercatorTransformer(WEB_MERCATOR, WGS84), to_geographic),
+    ]:
+        expected = proj.transform(x, y)
+        assert all(math.isnan(v) for v in expected)
+        assert all(math.isnan(v) for v in transformer.transform(x, y))
+
+        xs = np.array([x, 0.0, math.inf])
+        ys = np.array([y, 0.0, 0.0])
+        np.testing.assert_array_equal(
+            transformer.transform(xs, ys), proj.transform(xs, ys)
+        )
+
+
+@pytest.mark.filterwarnings("ignore::morecantile.errors.PointOutsideTMSBounds")
+def test_web_mercator_tms_nan():
+    """WebMercatorQuad methods should not turn NaN inputs into tiles."""
+    tms = morecantile.tms.get("WebMercatorQuad")
+    assert all(math.isnan(v) for v in tms.xy(math.nan, 0))
+    assert all(math.isnan(v) for v in tms.lnglat(math.nan, 0))
+
+    with pytest.raises(ValueError):
+        tms.tile(math.nan, 0, 1)
+
+    with pytest.raises(ValueError):
+        tms.tile(0, math.nan, 1)
+
+
+def test_web_mercator_array():
+    """Array transformations should match PROJ within tolerance."""
+    np = pytest.importorskip("numpy")
+
+    inverse = WebMercatorTransformer(WEB_MERCATOR, WGS84)
+    forward = WebMercatorTransformer(WGS84, WEB_MERCATOR)
+
+    rng = np.random.default_rng(42)
+    x = rng.uniform(-2 * WEB_MERCATOR_EXTENT, 2 * WEB_MERCATOR_EXTENT, 10000)
+    y = rng.uniform(-WEB_MERCATOR_EXTENT, WEB_MERCATOR_EXTENT, 10000)
+    x[:2] = np.inf
+    lng, lat = inverse.transform(x, y)
+    plng, plat = to_geographic.transform(x, y)
+    np.testing.assert_allclose(lng, plng, rtol=0, atol=1e-9)
+    np.testing.assert_allclose(lat, plat, rtol=0, atol=1e-9)
+
+    lng = rng.uniform(-600, 600, 10000)
+    lat = rng.uniform(-91, 91, 10000)
+    x, y = forward.transform(lng, lat)
+    px, py = from_geographic.transform(lng, lat)
+    np.testing.assert_allclose(x, px, rtol=0, atol=1e-6)
+    np.testing.assert_allclose(y, py, rtol=1e-12, atol=1e-6)
+
+
+@pytest.mark.parametrize(
+    "bounds",
+    [
+        (-180, -85.0511287798066, 180, 85.0511287798066),
+        (-180, -90, 180, 90),
+        (10, 20, 30, 40),
+        (-200, -10, 10, 10),
+    ],
+)
+def test_web_mercator_forward_bounds(bounds):
+    """transform_bounds should match PROJ."""
+    forward = WebMercatorTransformer(WGS84, WEB_MERCATOR)
+    assert forward.transform_bounds(*bounds) == pytest.approx(
+        from_geographic.transform_bounds(*bounds, densify_pts=21), abs=1e-6
+    )
+
+
+@pytest.mark.parametrize(
+    "bounds",
+    [
+        (
+            -WEB_MERCATOR_EXTENT,
+            -WEB_MERCATOR_EXTENT,
+            WEB_MERCATOR_EXTENT,
+            WEB_MERCATOR_EXTENT,
+        ),
+        (-1017529.7205322663, 7005300.768279833, -978393.962050256, 7044436.526761846),
+        (-3e7, -1e7, 1e7, 1e7),
+    ],
+)
+def test_web_mercator_inverse_bounds(bounds):
+    """transform_bounds should match PROJ."""
+    inverse = WebMercatorTransformer(WEB_MERCATOR, WGS84)
+    assert inverse.transform_bounds(*bounds) == pytest.approx(
+        to_geographic.transform_bounds(*bounds, densify_pts=21), abs=1e-9
+    )
+
+
+def test_web_mercator_tms():
+    """WebMercatorQuad methods should match the pyproj results."""
+    tms = morecantile.tms.get("WebMercatorQuad")
+
+    rd = random.Random(1)
+    for _ in range(200):
+        z = rd.randint(0, 24)
+        x = rd.randint(0, 2**z - 1)
+        y = rd.randint(0, 2**z - 1)
+
+        left, bottom, right, top = tms.xy_bounds(x, y, z)
+        lng_left, lat_top = to_geographic.transform(left, top)
+        lng_right, lat_bottom = to_geographic.transform(right, bottom)
+        assert tms.bounds(x, y, z) == (lng_left, lat_bottom, lng_right, lat_top)
+        assert tms.ul(x, y, z) == (lng_left, lat_top)
+
+        lng = rd.uniform(-180, 180)
+        lat = rd.uniform(-85, 85)
+        assert tms.xy(lng, lat) == from_geographic.transform(lng, lat)
+        assert tms.tile(lng, lat, z) == tms._tile(
+            *from_geographic.transform(lng, lat), z
+        )
+
+    assert tms.bbox == to_geographic.transform_bounds(*tms.xy_bbox, densify_pts=21)
+
+
+def test_web_mercator_numpy_scalars():
+    """NumPy scalars and 0-d arrays should be transformed as python scalars."""
+    np = pytest.importorskip("numpy")
+
+    tms = morecantile.tms.get("WebMercatorQuad")
+    for lng, lat in [
+        (np.float32(10.5), np.float32(20.5)),
+        (np.float64(10.5), np.float64(20.5)),
+    ]:
+        x, y = tms.xy(lng, lat)
+        assert type(x) is float and type(y) is float
+        assert (x, y) == tms.xy(float(lng), float(lat))
+
+        lng_, lat_ = tms.lnglat(x, y)
+        assert type(lng_) is float and type(lat_) is float
+        assert tms.lnglat(np.float64(x), np.float64(y)) == tms.lnglat(x, y)
+
+    assert tms.tile(np.int64(10), np.int64(20), 5) == tms.tile(10, 20, 5)
+    assert tms.tile(np.float32(10.5), np.float32(20.5), 5) == tms.tile(10.5, 20.5, 5)
+
+    forward = WebMercatorTransformer(WGS84, WEB_MERCATOR)
+    x, y = forward.transform(np.array(10.5), np.array(20.5))
+    assert type(x) is float and type(y) is float
+    assert (x, y) == forward.transform(10.5, 20.5)
+
+    inverse = WebMercatorTransformer(WEB_MERCATOR, WGS84)
+    assert inverse.transform(np.float64(math.inf), np.float64(0.0)) == (
+        math.inf,
+        math.inf,
+    )
+
+
+def test_identity_transformer():
+    """Should return identity transformers for equivalent CRS."""
+    crs84 = pyproj.CRS.from_user_input("OGC:CRS84")
+    assert isinstance(transformer_from_crs(WGS84, WGS84), IdentityTransformer)
+    assert isinstance(transformer_from_crs(crs84, WGS84), IdentityTransformer)
+    assert isinstance(transformer_from_crs(WGS84, crs84), IdentityTransformer)
+    assert isinstance(
+        transformer_from_crs(WGS84, pyproj.CRS.from_epsg(4258)), pyproj.Transformer
+    )
+
+    tr = IdentityTransformer(crs84, WGS84)
+    ref = pyproj.Transformer.from_crs(crs84, WGS84, always_xy=True)
+    for point in [(10.0, 20.0), (190.0, 95.0), (-200, 10), (math.inf, 0.0)]:
+        assert tr.transform(*point) == ref.transform(*point)
+
+    np = pytest.importorskip("numpy")
+    for point in [(np.float32(10.5), np.float32(20.5)), (np.int64(10), np.array(20))]:
+        lng, lat = tr.transform(*point)
+        assert type(lng) is float and type(lat) is float
+        assert (lng, lat) == ref.transform(float(point[0]), float(point[1]))
+
+    for bounds in [(-190, -95, 200, 95), (170, -10, -170, 10), (-180, -90, 180, 90)]:
+        assert tr.transform_bounds(*bounds) == ref.transform_bounds(
+            *bounds, densify_pts=21
+        )
+
+
+@pytest.mark.parametrize(
+    "name", ["WorldCRS84Quad", "WGS1984Quad", "CDB1GlobalGrid", "GNOSISGlobalGrid"]
+)
+def test_identity_tms(name):
+    """Geographic TMS should not use pyproj transformations."""
+    tms = morecantile.tms.get(name)
+    assert isinstance(tms._to_geographic, IdentityTransformer)
+    assert isinstance(tms._from_geographic, IdentityTransformer)
+
+    # Results computed with pyproj
+    tms_ref = morecantile.tms.get(name)
+    tms_ref.__dict__["_bound_transformers"] = (
+        tms.crs._pyproj_crs,
+        tms.geographic_crs,
+        pyproj.Transformer.from_crs(
+            tms.crs._pyproj_crs, tms.geographic_crs, always_xy=True
+        ),
+        pyproj.Transformer.from_crs(
+            tms.geographic_crs, tms.crs._pyproj_crs, always_xy=True
+        ),
+    )
+    assert isinstance(tms_ref._to_geographic, pyproj.Transformer)
+
+    with (
+        mock.patch(
+            "morecantile.models.transformer_from_crs", side_effect=AssertionError
+        ),
+        mock.patch("pyproj.Transformer.from_crs", side_effect=AssertionError),
+    ):
+        assert tms.bbox == tms_ref.bbox
+        assert tms.xy(10.0, 20.0) == tms_ref.xy(10.0, 20.0)
+        assert tms.xy(10, 20) == tms_ref.xy(10, 20)
+        assert tms.lnglat(10.0, 20.0) == tms_ref.lnglat(10.0, 20.0)
+        assert tms.bounds(1, 1, 3) == tms_ref.bounds(1, 1, 3)
+        assert tms.ul(1, 1, 3) == tms_ref.ul(1, 1, 3)
+        assert tms.tile(10.0, 20.0, 5) == tms_ref.tile(10.0, 20.0, 5)
+        assert tms.tile(10.0, 20.0, 5, truncate=True) == tms_ref.tile(
+            10.0, 20.0, 5, truncate=True
+        )
+        assert list(tms.tiles(-10, -10, 10, 10, [3, 4])) == list(
+            tms_ref.tiles(-10, -10, 10, 10, [3, 4])
+        )
+        assert list(tms.tiles(170, -10, -170, 10, [3])) == list(
+            tms_ref.tiles(170, -10, -170, 10, [3])
+        )
+
+
+def test_identity_set_geographic_crs():
+    """Closed-form transformers should be updated with the geographic CRS."""
+    tms = morecantile.tms.get("WorldCRS84Quad")
+    assert isinstance(tms._to_geographic, IdentityTransformer)
+
+    tms.set_geographic_crs(pyproj.CRS.from_epsg(4258))
+    assert isinstance(tms._to_geographic, pyproj.Transformer)
+
+    tms.set_geographic_crs(WGS84)
+    assert isinstance(tms._to_geographic, IdentityTransformer)
+
+
+def test_transformer_cache(monkeypatch):
+    """Transformers should be cached by CRS definition."""
+    nzgd2000 = pyproj.CRS.from_epsg(2193).geodetic_crs
+    nztm = pyproj.CRS.from_epsg(2193)
+    tr = transformer_from_crs(nztm, nzgd2000)
+    assert isinstance(tr, pyproj.Transformer)
+    assert transformer_from_crs(nztm, nzgd2000) is tr
+    assert transformer_from_crs(pyproj.CRS.from_epsg(2193), nzgd2000) is tr
+    assert transformer_from_crs(nzgd2000, nztm) is not tr
+
+    # pyproj.CRS are not hashed
+    with mock.patch("pyproj.CRS.__hash__", side_effect=AssertionError):
+        assert transformer_from_crs(nztm, nzgd2000) is tr
+
+        tms = morecantile.tms.get("NZTM2000Quad")
+        tms.tile(172.0, -41.0, 10)
+        tms.tile(172.0, -41.0, 10, geographic_crs=WGS84)
+        list(tms.tiles(172.0, -41.0, 172.1, -40.9, [10], geographic_crs=WGS84))
+        tms.bounds(0, 0, 1)
+
+    # Cache is bounded (LRU)
+    monkeypatch.setattr(morecantile.transformers, "TRANSFORMER_CACHE_SIZE", 2)
+    monkeypatch.setattr(morecantile.transformers._local, "transformers", OrderedDict())
+    transformer_from_crs(nztm, nzgd2000)
+    transformer_from_crs(nzgd2000, nztm)
+    transformer_from_crs(nztm, nzgd2000)
+    transformer_from_crs(nztm, WGS84)
+    assert list(morecantile.transformers._thread_transformers()) == [
+        (nztm.srs, nzgd2000.srs, True),
+        (nztm.srs, WGS84.srs, True),
+    ]
+
+
+def test_transformer_cache_threads():
+    """Transformers should be cached per thread."""
+    nztm = pyproj.CRS.from_epsg(2193)
+    tr = transformer_from_crs(nztm, WGS84)
+    assert transformer_from_crs(nztm, WGS84) is tr
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        tr_thread = executor.submit(transformer_from_crs, nztm, WGS84).result()
+        assert tr_thread is not tr
+        assert executor.submit(transformer_from_crs, nztm, WGS84).result() is tr_thread
+
+    # Closed-form transformers and pyproj fallback
+    tr = transformer_from_crs(WEB_MERCATOR, WGS84)
+    assert isinstance(tr, WebMercatorTransformer)
+    assert isinstance(tr._transformer, pyproj.Transformer)
+    assert tr._transformer is pyproj_transformer(WEB_MERCATOR, WGS84)
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        assert executor.submit(lambda: tr._transformer).result() is not tr._transformer
+
+
+@pytest.mark.filterwarnings("ignore::morecantile.errors.PointOutsideTMSBounds")
+@pytest.mark.parametrize(
+    "name", ["NZTM2000Quad", "EuropeanETRS89_LAEAQuad", "WebMercatorQuad"]
+)
+def test_transformers_threads(name):
+    """Check tiles, bounds and tile results in multiple threads."""
+    tms = morecantile.tms.get(name, shared=True)
+    west, south, east, north = tms.bbox
+    lng_min, lng_max = min(west, east), max(west, east)
+
+    rd = random.Random(3)
+    tasks = []
+    for _ in range(200):
+        zoom = rd.randint(tms.minzoom, tms.minzoom + 8)
+        lng = rd.uniform(lng_min, lng_max)
+        lat = rd.uniform(south, north)
+        tasks.append((lng, lat, zoom))
+
+    def run(task):
+        lng, lat, zoom = task
+        tile = tms.tile(lng, lat, zoom)
+        return (
+            tile,
+            tms.bounds(tile),
+            tms.xy(lng, lat),
+            list(tms.tiles(lng, lat, lng + 0.1, lat + 0.1, [zoom])),
+            tms.tile(lng, lat, zoom, geographic_crs=WGS84),
+        )
+
+    expected = [run(task) for task in tasks]
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(run, tasks * 4))
+
+    assert results == expected * 4
@@ -40,3 +40,16 @@ def test_mpu(crs, unit):
 )
 def test_lons_contain_antimeridian(lon1: float, lon2: float, contains: bool):
     assert utils.lons_contain_antimeridian(lon1, lon2) == contains
+
+
+def test_points_in_bbox():
+    """points_in_bbox should match point_in_bbox."""
+    np = pytest.importorskip("numpy")
+
+    bbox = utils.BoundingBox(-180.0, -90.0, 180.0, 90.0)
+    xs = np.array([0.0, -180.000001, -180.0000001, 181.0, 10.0])
+    ys = np.array([0.0, 0.0, 0.0, 0.0, 90.1])
+    np.testing.assert_array_equal(
+        utils.points_in_bbox(xs, ys, bbox),
+        [utils.point_in_bbox(utils.Coords(x, y), bbox) for x, y in zip(xs, ys)],
+    )
@@ -0,0 +1,271 @@
+"""Test vectorized TileMatrixSet methods."""
+
+import pytest
+
+import morecantile
+from morecantile.errors import PointOutsideTMSBounds, TileArgParsingError
+
+np = pytest.importorskip("numpy")
+
+
+@pytest.mark.parametrize("name", morecantile.tms.list())
+def test_xy_bounds_many(name):
+    """xy_bounds_many should match xy_bounds exactly."""
+    tms = morecantile.tms.get(name)
+
+    tiles = []
+    for z in range(tms.minzoom, min(tms.minzoom + 6, tms.maxzoom) + 1):
+        matrix = tms.matrix(z)
+        for y in {0, matrix.matrixHeight // 2, matrix.matrixHeight - 1}:
+            for x in {0, matrix.matrixWidth // 3, matrix.matrixWidth - 1}:
+                tiles.append((x, y, z))
+
+    bounds = tms.xy_bounds_many(np.array(tiles))
+    assert bounds.shape == (len(tiles), 4)
+    assert bounds.dtype == np.float64
+    for tile, bbox in zip(tiles, bounds):
+        assert tuple(bbox) == tms.xy_bounds(tile)
+
+    x, y, z = np.array(tiles).T
+    np.testing.assert_array_equal(tms.xy_bounds_many(x, y, z), bounds)
+
+
+def test_xy_bounds_many_args():
+    """Check xy_bounds_many input parsing."""
+    tms = morecantile.tms.get("WebMercatorQuad")
+
+    # scalar zoom is broadcasted
+    bounds = tms.xy_bounds_many([486, 487], [332, 332], 10)
+    assert tuple(bounds[0]) == tms.xy_bounds(486, 332, 10)
+    assert tuple(bounds[1]) == tms.xy_bounds(487, 332, 10)
+
+    # list of Tile
+    bounds = tms.xy_bounds_many([morecantile.Tile(486, 332, 10)])
+    assert tuple(bounds[0]) == tms.xy_bounds(486, 332, 10)
+
+    assert tms.xy_bounds_many(np.empty((0, 3))).shape == (0, 4)
+
+    with pytest.raises(TileArgParsingError):
+        tms.xy_bounds_many([486, 332, 10])
+
+    with pytest.raises(TileArgParsingError):
+        tms.xy_bounds_many([486], [332])
+
+
+def test_xy_bounds_many_variable_width():
+    """Coalesced rows should return the coalesced tile bounds."""
+    tms = morecantile.tms.get("GNOSISGlobalGrid")
+    tiles = [(x, y, 3) for y in (0, 1, 2, 8, 15) for x in range(0, 32, 3)]
+    bounds = tms.xy_bounds_many(tiles)
+    for tile, bbox in zip(tiles, bounds):
+        assert tuple(bbox) == tms.xy_bounds(tile)
+
+    with pytest.raises(ValueError):
+        tms.xy_bounds_many([0], [16], 3)
+
+
+@pytest.mark.filterwarnings("ignore::morecantile.errors.PointOutsideTMSBounds")
+@pytest.mark.parametrize("name", morecantile.tms.list())
+def test_bounds_many(name):
+    """bounds_many should match bounds."""
+    tms = morecantile.tms.get(name)
+
+    tiles = []
+    for z in range(tms.minzoom, min(tms.minzoom + 4, tms.maxzoom) + 1):
+        matrix = tms.matrix(z)
+        for y in {0, matrix.matrixHeight // 2, matrix.matrixHeight - 1}:
+            for x in {0, matrix.matrixWidth // 3, matrix.matrixWidth - 1}:
+                tiles.append((x, y, z))
+
+    bounds = tms.bounds_many(tiles)
+    assert bounds.shape == (len(tiles), 4)
+    for tile, bbox in zip(tiles, bounds):
+        np.testing.assert_allclose(bbox, tms.bounds(tile), rtol=0, atol=1e-10)
+
+    assert tms.bounds_many(np.empty((0, 3))).shape == (0, 4)
+
+
+def test_bounds_many_outside():
+    """Should warn once when tiles are outside the TMS bounds."""
+    tms = morecantile.tms.get("WebMercatorQuad")
+    with pytest.warns(PointOutsideTMSBounds):
+        tms.bounds_many([2, 3], [0, 0], 0)
+
+
+@pytest.mark.filterwarnings("ignore::morecantile.errors.PointOutsideTMSBounds")
+@pytest.mark.parametrize("name", morecantile.tms.list())
+def test_tile_many(name):
+    """tile_many should match tile."""
+    tms = morecantile.tms.get(name)
+    west, south, east, north = tms.bbox
+
+    rng = np.random.default_rng(42)
+    lng = rng.uniform(min(west, east), max(west, east), 200)
+    lat = rng.uniform(south, north, 200)
+    for zoom in {tms.minzoom, tms.minzoom + 3}:
+        tiles = tms.tile_many(lng, lat, zoom)
+        assert tiles.shape == (200, 3)
+        assert tiles.dtype == np.int64
+        for x, y, tile in zip(lng, lat, tiles):
+            assert tuple(tile) == tms.tile(x, y, zoom)
+
+        tiles = tms.tile_many(lng, lat, zoom, ignore_coalescence=True)
+        for x, y, tile in zip(lng, lat, tiles):
+            assert tuple(tile) == tms.tile(x, y, zoom, ignore_coalescence=True)
+
+    # Points inside and outside of the TMS bounds
+    lng = rng.uniform(-200, 200, 300)
+    lat = rng.uniform(-100, 100, 300)
+    zoom = tms.minzoom + 2
+    tiles = tms.tile_many(lng, lat, zoom, truncate=True)
+    for x, y, tile in zip(lng, lat, tiles):
+        assert tuple(tile) == tms.tile(x, y, zoom, truncate=True)
+
+
+def test_tile_many_truncate():
+    """Input is truncated"""
+    tms = morecantile.tms.get("WebMercatorQuad")
+    tiles = tms.tile_many([-181.0, 0.0], [0.0, 90.0], 3, truncate=True)
+    assert tuple(tiles[0]) == tms.tile(-181.0, 0.0, 3, truncate=True)
+    assert tuple(tiles[1]) == tms.tile(0.0, 90.0, 3, truncate=True)
+
+    with pytest.warns(PointOutsideTMSBounds):
+        tms.tile_many([0.0, 0.0], [0.0, 89.0], 3)
+
+
+def test_xy_tile_many():
+    """_tile_many should match _tile."""
+    tms = morecantile.tms.get("WebMercatorQuad")
+    x = [-20037508.342789244, 0.0, 20037508.342789244, -np.inf, np.inf, 1e12]
+    y = [20037508.342789244, 0.0, -20037508.342789244, np.inf, -np.inf, -1e12]
+    tiles = tms._tile_many(x, y, 5)
+    for xcoord, ycoord, tile in zip(x, y, tiles):
+        assert tuple(tile) == tms._tile(xcoord, ycoord, 5)
+
+    with pytest.raises(ValueError):
+        tms._tile_many([np.nan], [0.0], 5)
+
+    # bottomLeft corner of origin
+    tms = morecantile.TileMatrixSet.custom(
+        [
+            -20037508.342789244,
+            -20037508.342789244,
+            20037508.342789244,
+            20037508.342789244,
+        ],
+        morecantile.models.pyproj.CRS.from_epsg(3857),
+        corner_of_origin="bottomLeft",
+    )
+    tiles = tms._tile_many(x[:3], y[:3], 5)
+    for xcoord, ycoord, tile in zip(x, y, tiles):
+        assert tuple(tile) == tms._tile(xcoord, ycoord, 5)
+
+
+def test_overlapping_tiles_same_tms():
+    """Overlapping tiles in the same TMS should be the tile, parent or children."""
+    tms = morecantile.tms.get("WebMercatorQuad")
+    tile = morecantile.Tile(3, 5, 4)
+    assert tms.overlapping_tiles(tms, tile, 4) == [tile]
+    assert tms.overlapping_tiles(tms, tile, 2) == tms.parent(tile, zoom=2)
+    assert tms.overlapping_tiles(tms, (3, 5, 4), 6) == tms.children(tile, zoom=6)
+
+    tms = morecantile.tms.get("GNOSISGlobalGrid")
+    assert tms.overlapping_tiles(tms, (4, 0, 3), 4) == tms.children(4, 0, 3)
+
+
+def test_overlapping_tiles_geographic():
+    """WebMercatorQuad tiles are rectangles in WorldCRS84Quad."""
+    wmq = morecantile.tms.get("WebMercatorQuad")
+    crs84 = morecantile.tms.get("WorldCRS84Quad")
+
+    tiles = [
+        *wmq.tiles(-180, -85, 180, 85, zooms=[0, 1, 2]),
+        *wmq.tiles(-20, 30, 40, 70, zooms=[5]),
+    ]
+    for zoom in [0, 3, 6]:
+        ranges = wmq.overlapping_tiles_many(crs84, tiles, zoom)
+        assert len(ranges) == len(tiles)
+        for tile, tile_range in zip(tiles, ranges):
+            assert list(tile_range) == list(crs84.tiles(*wmq.bounds(tile), [zoom]))
+
+    assert crs84.overlapping_tiles(wmq, (0, 0, 1), 2) == [
+        morecantile.Tile(0, 0, 2),
+        morecantile.Tile(0, 1, 2),
+    ]
+
+
+def test_overlapping_tiles_projected():
+    """Overlapping tiles should match the densified bounds transformation."""
+    wmq = morecantile.tms.get("WebMercatorQuad")
+    laea = morecantile.tms.get("EuropeanETRS89_LAEAQuad")
+    transformer = morecantile.models.pyproj.Transformer.from_crs(
+        wmq.crs._pyproj_crs, laea.crs._pyproj_crs, always_xy=True
+    )
+
+    tiles = list(wmq.tiles(-20, 30, 40, 70, zooms=[4, 6]))
+    for tile, tile_range in zip(tiles, wmq.overlapping_tiles_many(laea, tiles, 5)):
+        left, bottom, right, top = transformer.transform_bounds(
+            *wmq.xy_bounds(tile), densify_pts=21
+        )
+        bbox = laea.xy_bbox
+        if (
+            left >= bbox.right
+            or right <= bbox.left
+            or bottom >= bbox.top
+            or top <= bbox.bottom
+        ):
+            assert not tile_range
+            continue
+
+        ul = laea._tile(left, top, 5)
+        lr = laea._tile(right, bottom, 5)
+        assert list(tile_range) == [
+            morecantile.Tile(x, y, 5)
+            for y in range(ul.y, lr.y + 1)
+            for x in range(ul.x, lr.x + 1)
+        ]
+
+    # Outside of the other TMS
+    assert wmq.overlapping_tiles(laea, (0, 0, 3), 5) == []
+    assert wmq.overlapping_tiles_many(laea, [], 5) == []
+
+    # Variable width TMS
+    gnosis = morecantile.tms.get("GNOSISGlobalGrid")
+    assert [(t.x, t.y) for t in wmq.overlapping_tiles(gnosis, (0, 0, 2), 3)] == [
+        (0, 0),
+        (0, 1),
+        (4, 1),
+        (0, 2),
+        (2, 2),
+        (4, 2),
+        (6, 2),
+    ]
+
+
+def test_overlapping_tiles_lookup():
+    """Lookup tables should give the same tiles and be cached."""
+    wmq = morecantile.tms.get("WebMercatorQuad")
+    # Private instance (the shared TMS cache depends on the other tests)
+    laea = morecantile.TileMatrixSet.model_validate_json(
+        morecantile.tms.get("EuropeanETRS89_LAEAQuad").model_dump_json(
+            exclude_none=True
+        )
+    )
+    assert not laea._overlapping_tables
+
+    tiles = np.array(list(laea.tiles(-20, 30, 40, 70, zooms=[3, 4])))
+    ranges = laea.overlapping_tiles_many(wmq, tiles, 6)
+    lookup = laea.overlapping_tiles_many(wmq, tiles, 6, lookup=True)
+    assert [list(r) for r in lookup] == [list(r) for r in ranges]
+    assert len(laea._overlapping_tables) == 2
+
+    tables = list(laea._overlapping_tables.values())
+    laea.overlapping_tiles_many(wmq, tiles[:3], 6, lookup=True)
+    assert list(laea._overlapping_tables.values()) == tables
+    assert laea._overlapping_tables[next(iter(laea._overlapping_tables))] is tables[0]
+
+    with pytest.raises(ValueError):
+        laea.overlapping_tiles_many(wmq, [(8, 0, 3)], 6, lookup=True)
+
+    with pytest.raises(ValueError):
+        wmq.overlapping_tiles_many(laea, [(0, 0, 11)], 6, lookup=True)